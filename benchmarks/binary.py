@@ -0,0 +1,56 @@
+"""
+Benchmark (un)packing many fixed-size BinaryConfig records that are stored back-to-back.
+
+Usage: python benchmarks/binary.py
+"""
+
+import time
+
+from configuraptor import BinaryConfig, BinaryField, load_into
+
+N = 200_000
+
+
+class Record(BinaryConfig):
+    id = BinaryField(int, format="q")
+    score = BinaryField(float, format="d")
+    active = BinaryField(bool)
+    name = BinaryField(str, length=16)
+
+
+def measure(name, func, expected=N):
+    start = time.perf_counter()
+    result = func()
+    duration = time.perf_counter() - start
+    assert len(result) == expected
+    print(f"{name:<28} {duration:6.3f}s {N / duration:12,.0f} records/s")
+    return result
+
+
+def load_slices(buffer):
+    size = Record._get_length()
+    return [load_into(Record, buffer[offset : offset + size]) for offset in range(0, len(buffer), size)]
+
+
+if __name__ == "__main__":
+    records = [Record.load(Record._struct().pack(idx, idx / 3, bool(idx % 2), b"record")) for idx in range(N)]
+    size = Record._get_length()
+
+    packed = measure("pack: join _pack", lambda: b"".join(record._pack() for record in records), N * size)
+    measure("pack: pack_many", lambda: Record.pack_many(records), N * size)
+
+    measure("unpack: load_into slices", lambda: load_slices(packed))
+    measure("unpack: iter_unpack", lambda: list(Record.iter_unpack(packed)))
+
+    try:
+        import numpy as np
+    except ImportError:
+        print("numpy not installed, skipping the numpy bridge")
+    else:
+        array = measure("numpy: to_numpy", lambda: Record.to_numpy(records))
+        measure("numpy: frombuffer", lambda: np.frombuffer(packed, dtype=Record.to_dtype()))
+        measure("numpy: from_numpy", lambda: Record.from_numpy(array))
+        # select the active records with a score above 1000:
+        half = N // 2 - 1500
+        measure("filter: python", lambda: [r for r in records if r.active and r.score > 1000], half)
+        measure("filter: numpy", lambda: array[array["active"] & (array["score"] > 1000)], half)
@@ -0,0 +1,52 @@
+"""
+Benchmark loading records with json fields when only one field is used: eager vs lazy (decode on access) BinaryConfig.
+
+Usage: python benchmarks/binary_lazy.py
+"""
+
+import json
+import struct
+import time
+
+from configuraptor import BinaryConfig, BinaryField
+
+N = 20_000
+
+
+class Settings:
+    name: str
+    tags: list[str]
+    retries: int
+
+
+class Record(BinaryConfig):
+    id = BinaryField(int, format="q")
+    score = BinaryField(float, format="d")
+    settings = BinaryField(Settings, format="json", length=96)
+
+
+class LazyRecord(BinaryConfig, lazy=True):
+    id = BinaryField(int, format="q")
+    score = BinaryField(float, format="d")
+    settings = BinaryField(Settings, format="json", length=96)
+
+
+def measure(name, func):
+    start = time.perf_counter()
+    result = func()
+    duration = time.perf_counter() - start
+    print(f"{name:<36} {duration:6.3f}s {N / duration:12,.0f} records/s")
+    return result
+
+
+if __name__ == "__main__":
+    settings = json.dumps({"name": "record", "tags": ["a", "b", "c"], "retries": 3}).encode()
+    packed = b"".join(struct.pack("q d 96s", idx, idx / 3, settings) for idx in range(N))
+
+    for cls in (Record, LazyRecord):
+        records = measure(f"{cls.__name__}: iter_unpack", lambda: list(cls.iter_unpack(packed)))
+        measure(f"{cls.__name__}: sum of ids", lambda: sum(record.id for record in records))
+        records[0].id = -1
+        measure(f"{cls.__name__}: pack_many", lambda: cls.pack_many(records))
+        measure(f"{cls.__name__}: read settings", lambda: [record.settings.retries for record in records])
+        print()
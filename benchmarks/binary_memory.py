@@ -0,0 +1,44 @@
+"""
+Benchmark the memory of many loaded BinaryConfig records: regular instances vs @compact (slotted) ones.
+
+Usage: python benchmarks/binary_memory.py
+"""
+
+import tracemalloc
+
+from configuraptor import BinaryConfig, BinaryField, compact
+
+N = 100_000
+
+
+class Record(BinaryConfig):
+    id = BinaryField(int, format="q")
+    score = BinaryField(float, format="d")
+    active = BinaryField(bool)
+    count = BinaryField(int)
+
+
+@compact
+class CompactRecord(BinaryConfig):
+    id = BinaryField(int, format="q")
+    score = BinaryField(float, format="d")
+    active = BinaryField(bool)
+    count = BinaryField(int)
+
+
+def measure(name, load):
+    tracemalloc.start()
+    records = load()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(records) == N
+    print(f"{name:<36} {current / 1024 / 1024:8.2f} MiB {current / N:8.0f} bytes/record")
+
+
+if __name__ == "__main__":
+    packed = bytes(Record.pack_many([Record.load(Record._struct().pack(idx, idx / 3, True, idx)) for idx in range(N)]))
+    size = Record._get_length()
+
+    measure("Record: load per record", lambda: [Record.load(packed[o : o + size]) for o in range(0, len(packed), size)])
+    measure("Record: iter_unpack", lambda: list(Record.iter_unpack(packed)))
+    measure("CompactRecord: iter_unpack", lambda: list(CompactRecord.iter_unpack(packed)))
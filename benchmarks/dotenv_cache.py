@@ -0,0 +1,46 @@
+"""
+Benchmark loading many config sections with use_env='yes' (the default), with and without the .env/environment cache.
+
+Usage: python benchmarks/dotenv_cache.py
+"""
+
+import os
+import tempfile
+import time
+from contextlib import chdir
+
+from configuraptor import load_into
+from configuraptor.env import invalidate
+
+SECTIONS = 30
+
+
+class Section:
+    name: str
+    url: str
+
+
+def load_sections(config, clear_cache):
+    for idx in range(SECTIONS):
+        if clear_cache:
+            invalidate()
+        load_into(Section, config, key=f"section_{idx}")
+
+
+def measure(name, config, clear_cache):
+    start = time.perf_counter()
+    load_sections(config, clear_cache)
+    duration = time.perf_counter() - start
+    print(f"{name:<28} {duration * 1000:8.2f} ms for {SECTIONS} sections")
+
+
+if __name__ == "__main__":
+    config = {f"section_{idx}": {"name": f"section {idx}", "url": f"${{BASE_URL}}/{idx}"} for idx in range(SECTIONS)}
+
+    with tempfile.TemporaryDirectory() as directory, chdir(directory):
+        with open(os.path.join(directory, ".env"), "w") as f:
+            f.write("BASE_URL=https://example.com\n")
+            f.writelines(f"VARIABLE_{idx}=value {idx}\n" for idx in range(20))
+
+        measure("uncached", config, clear_cache=True)
+        measure("cached", config, clear_cache=False)
@@ -0,0 +1,63 @@
+"""
+Benchmark expanding ${VAR} placeholders in a config with thousands of string values (what use_env='yes' does).
+
+Compares the compiled, cached expansion with running expandvars on every string of every (nested) dict.
+
+Usage: python benchmarks/env_expansion.py
+"""
+
+import copy
+import os
+import time
+
+from expandvars import expand
+
+from configuraptor.env import ENV_VIEWS, TEMPLATES, case_insensitive_env, expand_values
+
+SECTIONS = 100
+VALUES = 50  # per section
+ROUNDS = 10
+
+
+def expandvars_everywhere(data, env):
+    # the expansion before the compiled templates:
+    env = case_insensitive_env(env)
+    for key, value in data.items():
+        if isinstance(value, dict):
+            expandvars_everywhere(value, env)
+        elif isinstance(value, list):
+            data[key] = [expand(item, environ=env) if isinstance(item, str) else item for item in value]
+        elif isinstance(value, str):
+            data[key] = expand(value, environ=env)
+
+
+def config():
+    # 1 in 10 values has a placeholder:
+    return {
+        f"section_{section}": {
+            f"key_{idx}": f"${{HOME}}/data/{idx}" if idx % 10 == 0 else f"some plain value {idx}"
+            for idx in range(VALUES)
+        }
+        for section in range(SECTIONS)
+    }
+
+
+def measure(name, expand_into):
+    data = config()
+    copies = [copy.deepcopy(data) for _ in range(ROUNDS)]
+    env = dict(os.environ)
+
+    start = time.perf_counter()
+    for data in copies:
+        expand_into(data, env)
+    duration = (time.perf_counter() - start) / ROUNDS
+
+    assert data["section_0"]["key_0"] == f"{os.environ['HOME']}/data/0"
+    print(f"{name:<28} {duration * 1000:8.2f} ms per config ({SECTIONS * VALUES:,} strings)")
+
+
+if __name__ == "__main__":
+    measure("expandvars everywhere", expandvars_everywhere)
+    TEMPLATES.clear()
+    ENV_VIEWS.clear()
+    measure("compiled + cached", expand_values)
@@ -0,0 +1,46 @@
+"""
+Benchmark `import configuraptor` with `python -X importtime` and list which heavy dependencies it pulled in.
+
+The libraries behind the loaders, dumpers and url fetching should only be imported when they are first used.
+
+Usage: python benchmarks/import_time.py
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+
+RUNS = 10
+HEAVY = ("requests", "yaml", "pyjson5", "tomli", "tomli_w", "dotenv", "expandvars", "typeguard", "asyncio")
+
+
+def import_time(statement: str) -> int:
+    """
+    Cumulative import time of the package in microseconds (the last line of -X importtime is the top-level import).
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=os.environ,
+    )
+    for line in reversed(result.stderr.splitlines()):
+        if line.rstrip().endswith("| configuraptor"):
+            return int(line.split("|")[1])
+    raise RuntimeError(result.stderr)
+
+
+def loaded_modules(statement: str) -> list[str]:
+    code = f"{statement}; import sys; print(' '.join(m for m in {HEAVY!r} if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env=os.environ)
+    return result.stdout.split()
+
+
+if __name__ == "__main__":
+    timings = [import_time("import configuraptor") for _ in range(RUNS)]
+    print(f"import configuraptor: {statistics.median(timings) / 1000:.2f} ms (median of {RUNS} runs)")
+
+    for statement in ["import configuraptor", "import configuraptor; configuraptor.astoml(object())"]:
+        print(f"{statement:<56} loaded: {' '.join(loaded_modules(statement)) or '-'}")
@@ -0,0 +1,51 @@
+"""
+Benchmark loading many small records into one class: `load_into` in a loop vs `load_many`.
+
+Usage: python benchmarks/load_many.py
+"""
+
+import dataclasses
+import time
+
+from configuraptor import TypedConfig, load_into, load_many
+
+N = 20_000
+
+
+@dataclasses.dataclass
+class Row:
+    id: int
+    name: str
+    score: float
+    tags: list[str]
+
+
+class Limits(TypedConfig):
+    users: int
+    storage: int
+
+
+class Tenant(TypedConfig):
+    name: str
+    active: bool
+    limits: Limits
+
+
+ROWS = [{"id": idx, "name": f"row {idx}", "score": idx / 3, "tags": ["a", "b"]} for idx in range(N)]
+TENANTS = [{"name": f"tenant {idx}", "active": True, "limits": {"users": idx, "storage": 10}} for idx in range(N)]
+
+
+def measure(name, func):
+    start = time.perf_counter()
+    result = func()
+    duration = time.perf_counter() - start
+    assert len(result) == N
+    print(f"{name:<32} {duration:6.3f}s {N / duration:10,.0f} records/s")
+
+
+if __name__ == "__main__":
+    for cls, records in ((Row, ROWS), (Tenant, TENANTS)):
+        # key="" to skip key guessing, like load_many:
+        measure(f"{cls.__name__}: load_into loop", lambda: [load_into(cls, record, key="") for record in records])
+        measure(f"{cls.__name__}: load_many", lambda: load_many(cls, records))
+        measure(f"{cls.__name__}: load_many(use_env='no')", lambda: load_many(cls, records, use_env="no"))
@@ -0,0 +1,56 @@
+"""
+Benchmark deriving a config with a small override from a large config: `config | {...}` (deepcopy) vs apply_patch.
+
+Usage: python benchmarks/patch.py
+"""
+
+import timeit
+import tracemalloc
+
+from configuraptor import TypedConfig, apply_patch
+
+
+class Tenant(TypedConfig):
+    name: str
+    limits: dict[str, int]
+    features: list[str]
+
+
+class Settings(TypedConfig):
+    debug: bool
+    tenants: dict[str, Tenant]
+    default: Tenant
+
+
+N = 1_000
+CONFIG = Settings.load(
+    {
+        "debug": False,
+        "tenants": {
+            str(i): Tenant.load({"name": str(i), "limits": {"users": i}, "features": ["a", "b", "c"]}) for i in range(N)
+        },
+        "default": {"name": "default", "limits": {"users": 1}, "features": []},
+    }
+)
+
+
+def or_update() -> Settings:
+    return CONFIG | {"debug": True}
+
+
+def patch_update() -> Settings:
+    return apply_patch(CONFIG, {"default.name": "other"})
+
+
+def allocated(func) -> int:
+    tracemalloc.start()
+    result = func()  # noqa: F841
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size
+
+
+if __name__ == "__main__":
+    for func in (or_update, patch_update):
+        duration = timeit.timeit(func, number=100)
+        print(f"{func.__name__:<16} {duration * 10:.3f} ms/call {allocated(func) / 1024:.1f} KiB")
@@ -0,0 +1,49 @@
+"""
+Benchmark keeping many snapshots of a large config with one override each: deepcopy vs | vs PersistentTypedMapping.
+
+Usage: python benchmarks/persistent.py
+"""
+
+import copy
+import time
+import tracemalloc
+
+from configuraptor import PersistentTypedMapping, TypedConfig
+
+KEYS = 5_000
+SNAPSHOTS = 1_000
+
+ANNOTATIONS = {f"key_{idx}": int for idx in range(KEYS)}
+DATA = {f"key_{idx}": idx for idx in range(KEYS)}
+
+Regular = type("Regular", (TypedConfig,), {"__annotations__": ANNOTATIONS})
+Persistent = type("Persistent", (PersistentTypedMapping,), {"__annotations__": ANNOTATIONS})
+
+
+def deepcopy_snapshots(config):
+    return [copy.deepcopy(config)._update(key_0=idx) for idx in range(SNAPSHOTS)]
+
+
+def or_snapshots(config):
+    return [config | {"key_0": idx} for idx in range(SNAPSHOTS)]
+
+
+def measure(name, func, config):
+    tracemalloc.start()
+    start = time.perf_counter()
+    snapshots = func(config)
+    duration = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(snapshots) == SNAPSHOTS
+    print(f"{name:<28} {duration * 1000 / SNAPSHOTS:8.3f} ms/snapshot {size / SNAPSHOTS / 1024:8.1f} KiB/snapshot")
+
+
+if __name__ == "__main__":
+    regular = Regular.load(DATA)
+    persistent = Persistent.load(DATA)
+
+    print(f"{KEYS} keys, {SNAPSHOTS} snapshots:")
+    measure("TypedConfig deepcopy", deepcopy_snapshots, regular)
+    measure("TypedConfig |", or_snapshots, regular)
+    measure("PersistentTypedMapping |", or_snapshots, persistent)
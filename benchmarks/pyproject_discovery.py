@@ -0,0 +1,51 @@
+"""
+Benchmark loading many sections of a pyproject.toml (data=None), with and without the discovery and parse caches.
+
+Usage: python benchmarks/pyproject_discovery.py
+"""
+
+import os
+import tempfile
+import time
+from contextlib import chdir
+
+from configuraptor import load_into
+from configuraptor.core import PYPROJECT_CACHE
+from configuraptor.helpers import PYPROJECT_PATHS
+
+SECTIONS = 30
+DEPTH = 8
+
+
+class Section:
+    name: str
+    numbers: list[int]
+
+
+def load_sections(clear_cache):
+    for idx in range(SECTIONS):
+        if clear_cache:
+            PYPROJECT_PATHS.clear()
+            PYPROJECT_CACHE.clear()
+        load_into(Section, key=f"tool.section_{idx}", use_env="no")
+
+
+def measure(name, clear_cache):
+    start = time.perf_counter()
+    load_sections(clear_cache)
+    duration = time.perf_counter() - start
+    print(f"{name:<28} {duration * 1000:8.2f} ms for {SECTIONS} sections")
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as directory:
+        with open(os.path.join(directory, "pyproject.toml"), "w") as f:
+            f.write('[project]\nname = "benchmark"\ndependencies = [%s]\n' % ", ".join(f'"dep{i}"' for i in range(200)))
+            for idx in range(SECTIONS):
+                f.write(f'\n[tool.section_{idx}]\nname = "section {idx}"\nnumbers = {list(range(20))}\n')
+
+        workdir = os.path.join(directory, *[f"level_{idx}" for idx in range(DEPTH)])
+        os.makedirs(workdir)
+        with chdir(workdir):
+            measure("uncached", clear_cache=True)
+            measure("cached", clear_cache=False)
@@ -0,0 +1,56 @@
+"""
+Benchmark loading one small section of a huge JSON/YAML manifest: full parse vs streaming.
+
+Usage: python benchmarks/streaming.py
+"""
+
+import json
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import yaml
+
+from configuraptor import TypedConfig
+from configuraptor.loaders.streaming import STREAMING
+
+N = 20_000
+
+
+class Api(TypedConfig):
+    port: int
+    name: str
+
+
+MANIFEST = {
+    "resources": {f"resource-{idx}": {"id": idx, "labels": ["a", "b", "c"], "enabled": True} for idx in range(N)},
+    "services": {"api": {"port": 8000, "name": "api"}},
+}
+
+
+def measure(name, path):
+    start = time.perf_counter()
+    api = Api.load(path, key="services.api")
+    duration = time.perf_counter() - start
+    assert api.port == 8000
+
+    # separately, since tracing slows down allocating:
+    tracemalloc.start()
+    Api.load(path, key="services.api")
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<24} {duration:6.3f}s peak {peak / 1024 / 1024:8.2f} MiB")
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        for extension, dump in ((".json", json.dumps), (".yaml", yaml.safe_dump)):
+            path = Path(tmp) / f"manifest{extension}"
+            path.write_text(dump(MANIFEST))
+            print(f"{path.name}: {path.stat().st_size / 1024 / 1024:.1f} MiB")
+
+            STREAMING.min_size = None
+            measure(f"{extension}: full parse", path)
+            STREAMING.min_size = 0
+            measure(f"{extension}: streaming", path)
@@ -5,26 +5,33 @@ Exposes TypedConfig and load_into for this library.
 # SPDX-FileCopyrightText: 2023-present Robin van der Noord <robinvandernoord@gmail.com>
 #
 # SPDX-License-Identifier: MIT
+from .aio import aload_data, aload_into
 from .alias import Alias, alias
 from .beautify import beautify
-from .binary_config import BinaryConfig, BinaryField
+from .binary_config import BinaryConfig, BinaryField, compact
 from .cls import TypedConfig, TypedMapping, TypedMutableMapping, update
 from .core import (
     Defaultable,
     check_and_convert_data,
     convert_config,
     ensure_types,
+    iter_load_into,
     load_data,
     load_into,
     load_into_class,
     load_into_instance,
+    load_many,
 )
 from .dump import asbytes, asdict, asjson, astoml, asyaml
 from .helpers import all_annotations, check_type
 from .loaders import register_loader as loader
+from .patch import DELETED, apply_patch, diff
+from .persistent import PersistentTypedMapping
 from .postpone import postpone
 from .singleton import Singleton, SingletonMeta
+from .sources import Sources
 from .type_converters import register_converter as converter
+from .watch import Watcher
 
 __all__ = [
     # beautify,
@@ -32,10 +39,12 @@ __all__ = [
     # binary
     "BinaryConfig",
     "BinaryField",
+    "compact",
     # cls
     "TypedConfig",
     "TypedMapping",
     "TypedMutableMapping",
+    "PersistentTypedMapping",
     "update",
     # singleton
     "Singleton",
@@ -48,10 +57,23 @@ __all__ = [
     "load_into",
     "load_into_class",
     "load_into_instance",
+    "load_many",
+    "iter_load_into",
     "Defaultable",
+    # sources
+    "Sources",
+    # watch
+    "Watcher",
+    # aio
+    "aload_data",
+    "aload_into",
     # helpers
     "all_annotations",
     "check_type",
+    # patch
+    "diff",
+    "apply_patch",
+    "DELETED",
     # postpone
     "postpone",
     # dump
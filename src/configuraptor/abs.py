@@ -2,20 +2,18 @@
 Contains the Abstract config class shared by TypedConfig and BinaryConfig.
 """
 
+import mmap
 import os
 import types
 import typing
 from pathlib import Path
 
-import dotenv
-from dotenv import find_dotenv
-
 # T is a reusable typevar
 T = typing.TypeVar("T")
 # t_typelike is anything that can be type hinted
 T_typelike: typing.TypeAlias = type | types.UnionType  # | typing.Union
 # t_data is anything that can be fed to _load_data
-T_data_types = str | Path | bytes | dict[str, typing.Any] | None
+T_data_types = str | Path | bytes | bytearray | memoryview | mmap.mmap | dict[str, typing.Any] | None
 T_data = T_data_types | list[T_data_types]
 
 # c = a config class instance, can be any (user-defined) class
@@ -35,6 +33,9 @@ class AbstractTypedConfig:
     These functions only exist on the class, not on instances.
     """
 
+    # no __dict__ of its own, so subclasses can use __slots__ (see binary_config.compact):
+    __slots__ = ()
+
     @classmethod
     def load(
         cls: typing.Type[C],
@@ -64,6 +65,35 @@ class AbstractTypedConfig:
             use_env=use_env,
         )
 
+    @classmethod
+    async def aload(
+        cls: typing.Type[C],
+        data: T_data = None,
+        key: str = None,
+        init: dict[str, typing.Any] = None,
+        strict: bool = True,
+        lower_keys: bool = False,
+        convert_types: bool = False,
+        use_env: UseEnvSetting = DEFAULT_ENV_SETTING,
+    ) -> C:
+        """
+        Async version of `load`.
+
+        await SomeClass.aload(data, ...) = await aload_into(SomeClass, data, ...).
+        """
+        from .aio import aload_into
+
+        return await aload_into(
+            cls,
+            data,
+            key=key,
+            init=init,
+            strict=strict,
+            lower_keys=lower_keys,
+            convert_types=convert_types,
+            use_env=use_env,
+        )
+
     @classmethod
     def from_env(
         cls: typing.Type[C],
@@ -93,7 +123,9 @@ class AbstractTypedConfig:
         from .core import load_into
 
         if load_dotenv:
-            dotenv_path = load_dotenv if isinstance(load_dotenv, str) else find_dotenv(usecwd=True)
+            import dotenv
+
+            dotenv_path = load_dotenv if isinstance(load_dotenv, str) else dotenv.find_dotenv(usecwd=True)
             dotenv.load_dotenv(dotenv_path)
 
         data = {**os.environ}
@@ -0,0 +1,245 @@
+"""
+Asyncio variants of `load_data` and `load_into`.
+
+Blocking work (file reads, url fetches and parsing) is offloaded to a thread, so the event loop is not stalled.
+A list of sources is loaded concurrently and merged in the declared order
+(for `Sources`, with at most `workers` at the same time and following its `on_error` setting).
+
+asyncio itself is imported by the functions (it's already loaded when they are awaited),
+so `import configuraptor` doesn't pay for it.
+"""
+
+import io
+import time
+import typing
+import warnings
+from pathlib import Path
+
+from . import loaders
+from .abs import DEFAULT_ENV_SETTING, C, T_data, UseEnvSetting
+from .binary_config import BUFFER_TYPES, BinaryConfig
+from .core import (
+    T_init,
+    _failed_to_load,
+    _guess_url_filetype,
+    _is_lazy_env,
+    _load_into_instance,
+    _load_into_recurse,
+    _post_load,
+    _select_with_fallback,
+    is_url,
+    load_data,
+)
+from .env import defer_values
+from .errors import FailedToLoad
+from .sources import Sources, SourceTiming
+from .watch import WATCHED
+
+# async transport for urls: takes the url, returns the body and the content-type (if known), e.g. using httpx:
+# async def transport(url: str) -> tuple[str, str | None]:
+#     resp = await client.get(url)
+#     return resp.text, resp.headers.get("content-type")
+T_transport = typing.Callable[[str], typing.Awaitable[tuple[str, str | None]]]
+
+
+async def _aload_url(
+    url: str,
+    transport: T_transport,
+    key: str = None,
+    classname: str = None,
+    lower_keys: bool = False,
+    allow_types: tuple[type, ...] = (dict,),
+    strict: bool = False,
+    use_env: UseEnvSetting = DEFAULT_ENV_SETTING,
+) -> dict[str, typing.Any]:
+    """
+    Fetch a url with an async transport, parse it in a thread and select the right key.
+    """
+    import asyncio
+
+    try:
+        text, content_type = await transport(url)
+        loader = loaders.get(_guess_url_filetype(url, content_type))
+        # dev/null exists but always returns b''
+        document = await asyncio.to_thread(loader, io.BytesIO(text.encode()), Path("/dev/null"))
+    except Exception as e:
+        return _failed_to_load(url, e, strict)
+
+    return _select_with_fallback(url, document, False, key, classname, lower_keys, allow_types, strict, use_env)
+
+
+async def _aload_sources(
+    sources: Sources,
+    key: str = None,
+    classname: str = None,
+    allow_types: tuple[type, ...] = (dict,),
+    strict: bool = False,
+    use_env: UseEnvSetting = DEFAULT_ENV_SETTING,
+    transport: T_transport = None,
+) -> dict[str, typing.Any]:
+    """
+    Async version of `core._load_sources`: load at most `sources.workers` sources at the same time.
+    """
+    import asyncio
+
+    on_error = sources.on_error or ("raise" if strict else "warn")
+    workers = asyncio.Semaphore(max(1, sources.workers))
+    timings: list[SourceTiming | None] = [None for _ in sources]
+
+    async def load_one(idx: int, source: typing.Any) -> dict[str, typing.Any]:
+        async with workers:
+            start = time.perf_counter()
+            try:
+                result = await aload_data(
+                    source,
+                    key=key,
+                    classname=classname,
+                    lower_keys=True,
+                    allow_types=allow_types,
+                    strict=True,
+                    use_env=use_env,
+                    transport=transport,
+                )
+            except Exception as e:
+                timings[idx] = SourceTiming(source, time.perf_counter() - start, e)
+                if on_error == "raise":
+                    if isinstance(e, FailedToLoad):
+                        raise
+                    raise FailedToLoad(source) from e
+
+                warnings.warn(f"Data ('{source!r}') could not be loaded", source=e, category=UserWarning)
+                return {}
+
+            timings[idx] = SourceTiming(source, time.perf_counter() - start)
+            return result
+
+    tasks = [asyncio.ensure_future(load_one(idx, source)) for idx, source in enumerate(sources)]
+    try:
+        results = await asyncio.gather(*tasks)
+    except BaseException:
+        # fail fast: stop the sources that are still waiting or running
+        for task in tasks:
+            task.cancel()
+        raise
+    finally:
+        sources.timings = [timing for timing in timings if timing is not None]
+
+    final_data: dict[str, typing.Any] = {}
+    for result in results:
+        final_data |= result
+    return final_data
+
+
+async def aload_data(
+    data: T_data,
+    key: str = None,
+    classname: str = None,
+    lower_keys: bool = False,
+    allow_types: tuple[type, ...] = (dict,),
+    strict: bool = False,
+    use_env: UseEnvSetting = DEFAULT_ENV_SETTING,
+    transport: T_transport = None,
+) -> dict[str, typing.Any]:
+    """
+    Async version of `load_data`.
+
+    Args:
+        data: see `load_data`. The items of a list are loaded concurrently.
+        key: see `load_data`.
+        classname: see `load_data`.
+        lower_keys: see `load_data`.
+        allow_types: see `load_data`.
+        strict: see `load_data`.
+        use_env: see `load_data`.
+        transport: optional async function to fetch urls with (see `T_transport`).
+            By default, urls are fetched in a thread using the pooled and cached `remote.HTTP` client.
+    """
+    import asyncio
+
+    if isinstance(data, Sources) and data:
+        return await _aload_sources(data, key, classname, allow_types, strict, use_env, transport)
+
+    if isinstance(data, list):
+        if not data:
+            return _failed_to_load(data, ValueError("Empty list passed!"), strict)
+
+        sources = await asyncio.gather(
+            *(
+                aload_data(
+                    source,
+                    key=key,
+                    classname=classname,
+                    lower_keys=True,
+                    allow_types=allow_types,
+                    strict=strict,
+                    use_env=use_env,
+                    transport=transport,
+                )
+                for source in data
+            )
+        )
+
+        final_data: dict[str, typing.Any] = {}
+        for source_data in sources:
+            final_data |= source_data
+        return final_data
+
+    if transport and isinstance(data, str) and is_url(data):
+        return await _aload_url(data, transport, key, classname, lower_keys, allow_types, strict, use_env)
+
+    return await asyncio.to_thread(
+        load_data,
+        data,
+        key,
+        classname,
+        lower_keys=lower_keys,
+        allow_types=allow_types,
+        strict=strict,
+        use_env=use_env,
+    )
+
+
+async def aload_into(
+    cls: typing.Type[C],
+    data: T_data = None,
+    /,
+    key: str = None,
+    init: T_init = None,
+    strict: bool = True,
+    lower_keys: bool = False,
+    convert_types: bool = False,
+    use_env: UseEnvSetting = DEFAULT_ENV_SETTING,
+    transport: T_transport = None,
+) -> C:
+    """
+    Async version of `load_into`.
+
+    Only loading the data is async, filling the class is done on the event loop (it doesn't block on I/O).
+    See `load_into` and `aload_data` for the arguments.
+    """
+    klass = cls if isinstance(cls, type) else cls.__class__
+    allow_types = (dict, *BUFFER_TYPES) if issubclass(klass, BinaryConfig) else (dict,)
+    lazy_env = _is_lazy_env(klass, use_env)
+
+    to_load = await aload_data(
+        data,
+        key,
+        klass.__name__,
+        lower_keys=lower_keys,
+        allow_types=allow_types,
+        strict=strict,
+        use_env="no" if lazy_env else use_env,
+        transport=transport,
+    )
+    if lazy_env:
+        to_load = defer_values(to_load, use_env, strict, convert_types)
+
+    result: C
+    if isinstance(cls, type):
+        result = _load_into_recurse(cls, to_load, init=init, strict=strict, convert_types=convert_types)
+    else:
+        # would not be supported according to mypy, but you can still aload_into(instance)
+        result = _load_into_instance(cls, klass, to_load, init=init, strict=strict, convert_types=convert_types)
+
+    WATCHED.track(result, data, key, strict, lower_keys, convert_types, use_env)
+    return _post_load(result)
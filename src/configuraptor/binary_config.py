@@ -3,6 +3,7 @@ Logic to do with parsing bytestrings as configuration (using struct).
 """
 
 import collections
+import mmap
 import struct
 import typing
 from dataclasses import dataclass
@@ -17,94 +18,338 @@ from .loaders.register import DUMPERS
 
 BINARY_TYPES = typing.Union[str, float, int, bool]
 
+# anything struct.unpack_from can read from without copying it first:
+T_buffer = bytes | bytearray | memoryview | mmap.mmap
+BUFFER_TYPES = (bytes, bytearray, memoryview, mmap.mmap)
+
 
 class BinaryConfig(AbstractTypedConfig):
     """
     Inherit this class if you want your config or a section of it to be parsed using struct.
+
+    With `class MyConfig(BinaryConfig, lazy=True)`, loaded instances keep the raw bytes of their record
+    and only decode a field when it is first accessed.
     """
 
-    _fields: collections.OrderedDict[str, "_BinaryField"]
+    __slots__ = ()
+
+    # the field info is the same for every instance, so it's stored on the class (by __init_subclass__):
+    _fields: typing.ClassVar[collections.OrderedDict[str, "_BinaryField"]] = collections.OrderedDict()
+    _layout: typing.ClassVar["BinaryLayout"]
+    _lazy: typing.ClassVar[bool] = False
+    # (layout, record) of a lazily loaded instance:
+    _raw: "tuple[BinaryLayout, bytes] | None" = None
 
-    def __init__(self) -> None:
+    def __init_subclass__(cls, lazy: bool | None = None, **kwargs: typing.Any) -> None:
         """
-        Before filling the class with data, we store the fields (BinaryField) for later use.
+        Store the fields (BinaryField) of a new subclass and compile its layout for later use.
+
+        Args:
+            lazy: decode fields on first access instead of when loading (inherited by subclasses).
         """
-        fields, elements = self._collect_fields()
-        self._fields = collections.OrderedDict(zip(fields, elements))
-        super().__init__()
+        super().__init_subclass__(**kwargs)
+        if lazy is not None:
+            cls._lazy = lazy
+        if "_fields" not in cls.__dict__:
+            # not already collected (by `compact`)
+            cls._fields = collections.OrderedDict(
+                (field, value)
+                for field, value in cls.__dict__.items()
+                # skip other data:
+                if not field.startswith("_") and isinstance(value, _BinaryField)
+            )
+
+        cls._layout = BinaryLayout.compile(cls)
 
     @classmethod
     def _collect_fields(cls) -> tuple[list[str], list["_BinaryField"]]:
         """
         Get the class' field names and dataclass instances.
         """
-        elements: list[_BinaryField] = []
-        fields: list[str] = []
+        return list(cls._fields), list(cls._fields.values())
 
-        for field, value in cls.__dict__.items():
-            if field.startswith("_"):
-                continue
-            if not isinstance(value, _BinaryField):
-                # other data, skip
-                continue
+    def _set_values(self, values: typing.Iterable[tuple[str, typing.Any]]) -> None:
+        """
+        Fill a new instance with (decoded) values.
 
-            fields.append(field)
-            elements.append(value)
+        Works for compact (slotted) instances too and doesn't go through the resizing logic of __setattr__.
+        """
+        for field, value in values:
+            object.__setattr__(self, field, value)
 
-        return fields, elements
+    @classmethod
+    def layout(cls) -> "BinaryLayout":
+        """
+        The compiled layout of this class: struct format, size and offset of every (nested) field.
+
+        Usage:
+            Versions.layout().size  # -> 24
+            Versions.layout().table()  # -> [("first", 0, 12, "12s"), ("first.major", 0, 4, "1i"), ...]
+        """
+        return cls._layout
+
+    @classmethod
+    def _struct(cls) -> struct.Struct:
+        """
+        The compiled struct for the fields of this class (nested configs as one bytestring each).
+        """
+        return cls._layout.compiled
 
     @classmethod
-    def _parse(cls, data: bytes | dict[str, bytes]) -> dict[str, BINARY_TYPES]:
+    def _from_values(cls, values: typing.Iterable[tuple[str, typing.Any]]) -> Self:
         """
-        Parse a bytestring or a dict of bytestrings (in the right order).
+        Create a new instance with (decoded) values.
         """
-        from .core import load_into
+        inst = cls() if cls.__init__ is not BinaryConfig.__init__ else object.__new__(cls)
+        inst._set_values(values)
+        return inst
 
+    @classmethod
+    def _parse(cls, data: T_buffer | dict[str, bytes], offset: int = 0) -> dict[str, BINARY_TYPES]:
+        """
+        Parse a bytestring (or other buffer, starting at `offset`) or a dict of bytestrings (in the right order).
+        """
         # NOTE: annotations not used!
-        fields, elements = cls._collect_fields()
+        layout = cls._layout
 
         if isinstance(data, dict):
             # create one long bytestring of data in the right order:
-            data = b"".join(data[field] for field in fields)
+            data = b"".join(data[field] for field in layout.fields)
 
-        unpacked = struct.unpack(" ".join(str(_) for _ in elements), data)
-        final_data: dict[str, BINARY_TYPES] = {}
+        values, _ = layout.decode(layout.flat.unpack_from(data, offset))
+        return dict(values)
 
-        zipped: typing.Iterable[tuple[str, typing.Any, _BinaryField]] = zip(fields, unpacked, elements)
-        for field, value, meta in zipped:
-            if isinstance(value, bytes) and not issubclass(meta.klass, BinaryConfig):
-                value = value.strip(b"\x00").decode()
+    @classmethod
+    def _parse_into(cls, data: T_buffer | dict[str, bytes]) -> Self:
+        """
+        Create a new instance based on data, which should be exactly one record (like struct.unpack).
 
-            if meta.special:
-                # e.g. load from JSON
-                value = meta.special(value)
+        Use `from_buffer` to read a record from a larger buffer.
+        """
+        layout = cls._layout
+        if isinstance(data, dict):
+            data = b"".join(data[field] for field in layout.fields)
 
-            # ensure it's the right class (e.g. bool):
-            value = load_into(meta.klass, value) if is_custom_class(meta.klass) else meta.klass(value)
+        size = data.nbytes if isinstance(data, memoryview) else len(data)
+        if size != layout.size:
+            raise struct.error(f"unpack requires a buffer of {layout.size} bytes")
 
-            final_data[field] = value
+        return cls._load_at(data)
 
-        return final_data
+    @classmethod
+    def _load_at(cls, data: T_buffer | dict[str, bytes], offset: int = 0) -> Self:
+        """
+        Create a new instance from the record at `offset` of data (the rest of the buffer is ignored).
+        """
+        if cls._lazy:
+            return cls._from_raw(data, offset)
+        return cls._from_values(cls._parse(data, offset).items())
 
     @classmethod
-    def _parse_into(cls, data: bytes | dict[str, bytes]) -> Self:
+    def _from_raw(cls, data: T_buffer | dict[str, bytes], offset: int = 0) -> Self:
         """
-        Create a new instance based on data.
+        Create a new lazy instance, that only keeps (a copy of) its record and decodes fields when they are accessed.
         """
-        converted = cls._parse(data)
-        inst = cls()
-        inst.__dict__.update(**converted)
+        layout = cls._layout
+        if isinstance(data, dict):
+            data = b"".join(data[field] for field in layout.fields)
+
+        if type(data) is bytes and offset == 0 and len(data) == layout.size:
+            record = data
+        else:
+            record = bytes(data[offset : offset + layout.size])
+
+        if len(record) != layout.size:
+            raise struct.error(f"{cls.__name__} requires a buffer of at least {offset + layout.size} bytes")
+
+        inst = cls._from_values(())
+        object.__setattr__(inst, "_raw", (layout, record))
         return inst
 
+    def _decode_field(self, field: str) -> typing.Any:
+        """
+        Decode a field of a lazily loaded instance and store it, so it's only decoded once.
+        """
+        layout, record = typing.cast(tuple[BinaryLayout, bytes], self._raw)
+        value = layout.decode_field(record, layout.fields.index(field))
+        object.__setattr__(self, field, value)
+        return value
+
+    @classmethod
+    def from_buffer(cls, buffer: T_buffer, offset: int = 0) -> Self:
+        """
+        Load the record at `offset` of a buffer, e.g. a memoryview or an mmap of a file with many records.
+
+        The fields are unpacked from the buffer directly (struct.unpack_from), so the rest of the buffer
+        is not copied (or, for an mmap, read from disk).
+
+        Usage:
+            with open("records.bin", "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                tenth = MyBinaryConfig.from_buffer(mm, offset=9 * MyBinaryConfig._get_length())
+        """
+        return cls._load_at(buffer, offset)
+
+    def _pack_values(self) -> list[typing.Any]:
+        """
+        The values of this instance, as struct expects them.
+        """
+        return [meta.pack(getattr(self, field)) for field, meta in self._fields.items()]
+
     def _pack(self) -> bytes:
         """
         Pack an instance back into a bytestring.
         """
-        fmt = " ".join(str(_) for _ in self._fields.values())
+        if self._raw is not None:
+            return self._pack_raw(*self._raw)
+
+        layout = self._layout
+        if (values := layout.encode(self)) is not None:
+            return layout.flat.pack(*values)
+
+        return layout.compiled.pack(*self._pack_values())
+
+    def _pack_raw(self, layout: "BinaryLayout", record: bytes) -> bytes:
+        """
+        Pack a lazily loaded instance: the bytes of fields that were not accessed are reused as they are.
+        """
+        if layout is not self._layout:
+            # the class was resized since loading, so decode everything and pack it like a regular instance:
+            for field in layout.fields:
+                if not _loaded(self, field):
+                    self._decode_field(field)
+            object.__setattr__(self, "_raw", None)
+            return self._pack()
+
+        loaded = [idx for idx, field in enumerate(layout.fields) if _loaded(self, field)]
+        if not loaded:
+            return record
+
+        buffer = bytearray(record)
+        for idx in loaded:
+            value = getattr(self, layout.fields[idx])
+            if not layout.plain[idx]:
+                value = layout.elements[idx].pack(value)
+            layout.structs[idx].pack_into(buffer, layout.offsets[idx], value)
+        return bytes(buffer)
+
+    @classmethod
+    def iter_unpack(cls, buffer: T_buffer) -> typing.Iterator[Self]:
+        """
+        Lazily load every record of a buffer that contains records of this class back-to-back (see `pack_many`).
+
+        The size of the buffer must be a multiple of the record size (`_get_length()`).
+        Faster than slicing the buffer and loading each slice, because plain numbers are used as unpacked
+        and struct.iter_unpack reads the records without copying the buffer.
+
+        Usage:
+            with open("versions.bin", "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for version in Version.iter_unpack(mm):
+                    ...
+        """
+        layout = cls._layout
+        if cls._lazy:
+            view = memoryview(buffer).cast("B")
+            if len(view) % layout.size:
+                raise struct.error(f"iter_unpack requires a buffer of a multiple of {layout.size} bytes")
+            for offset in range(0, len(view), layout.size):
+                yield cls._from_raw(view, offset)
+            return
+
+        if any(layout.inlined):
+            for unpacked in layout.flat.iter_unpack(buffer):
+                values, _ = layout.decode(unpacked)
+                yield cls._from_values(values)
+            return
+
+        # only decode the values that need it:
+        fields = layout.fields
+        decoders = [(idx, layout.elements[idx].decode) for idx, plain in enumerate(layout.plain) if not plain]
+
+        custom_init = cls.__init__ is not BinaryConfig.__init__
+        new = object.__new__
+
+        for unpacked in layout.compiled.iter_unpack(buffer):
+            if decoders:
+                values = list(unpacked)
+                for idx, decode in decoders:
+                    values[idx] = decode(values[idx])
+                unpacked = tuple(values)
+
+            inst = cls() if custom_init else new(cls)
+            inst._set_values(zip(fields, unpacked))
+            yield inst
+
+    @classmethod
+    def pack_many(cls, instances: typing.Iterable["BinaryConfig"]) -> bytearray:
+        """
+        Pack instances of this class into one buffer, back-to-back (see `iter_unpack`).
+
+        The buffer is allocated once and every record is packed into it directly (struct.pack_into).
+        """
+        instances = instances if isinstance(instances, typing.Sequence) else list(instances)
+        layout = cls._layout
+        size = layout.size
+
+        buffer = bytearray(size * len(instances))
+        for idx, inst in enumerate(instances):
+            if not isinstance(inst, cls):
+                raise TypeError(f"Can not pack {type(inst).__name__} as {cls.__name__}.")
 
-        values = [self._fields[k].pack(v) for k, v in self.__dict__.items() if not k.startswith("_")]
+            if inst._raw is not None:
+                buffer[idx * size : (idx + 1) * size] = inst._pack()
+            elif (values := layout.encode(inst)) is not None:
+                layout.flat.pack_into(buffer, idx * size, *values)
+            else:
+                layout.compiled.pack_into(buffer, idx * size, *inst._pack_values())
 
-        return struct.pack(fmt, *values)
+        return buffer
+
+    @classmethod
+    def to_dtype(cls) -> typing.Any:
+        """
+        NumPy structured dtype with the same memory layout as the records of this class.
+
+        Requires numpy (`pip install configuraptor[numpy]`).
+        Strings (and json/yaml/... fields) become fixed-size bytes ('S<length>'), nested BinaryConfigs nested dtypes.
+        """
+        np = _import_numpy()
+        layout = cls._layout
+
+        return np.dtype(
+            {
+                "names": list(layout.fields),
+                "formats": [element.to_dtype() for element in layout.elements],
+                "offsets": list(layout.offsets),
+                "itemsize": layout.size,
+            }
+        )
+
+    @classmethod
+    def to_numpy(cls, instances: typing.Iterable["BinaryConfig"]) -> typing.Any:
+        """
+        Pack instances into a NumPy structured array (see `to_dtype`), e.g. to filter millions of records vectorised.
+
+        The records are packed with `pack_many` and the array is a view on that buffer (no extra copy).
+        """
+        np = _import_numpy()
+        return np.frombuffer(cls.pack_many(instances), dtype=cls.to_dtype())
+
+    @classmethod
+    def from_numpy(cls, array: typing.Any) -> list[Self]:
+        """
+        Load the records of a NumPy structured array (see `to_numpy`) into instances of this class.
+
+        Only the memory layout matters (the size of the dtype must be the record size), so a plain uint8 array of
+        packed records works too. The records are read with `iter_unpack`, without copying contiguous arrays.
+        """
+        np = _import_numpy()
+        array = np.ascontiguousarray(array)
+        if array.dtype.fields and array.dtype.itemsize != cls._get_length():
+            raise ValueError(
+                f"Records of {cls.__name__} are {cls._get_length()} bytes, not {array.dtype.itemsize} ({array.dtype})."
+            )
+
+        return list(cls.iter_unpack(memoryview(array).cast("B")))
 
     @classmethod
     def _format(cls) -> str:
@@ -117,9 +362,7 @@ class BinaryConfig(AbstractTypedConfig):
         """
         How many bytes do the fields of this class have?
         """
-        fmt = cls._format()
-
-        return struct.calcsize(fmt)
+        return cls._layout.size
 
     def __setattr__(self, key: str, value: typing.Any) -> None:
         """
@@ -129,10 +372,76 @@ class BinaryConfig(AbstractTypedConfig):
             field = self._fields[key]
             field.klass = value.__class__
             field.length = value.__class__._get_length()
+            # the size of this class changed, so its layout has to be compiled again:
+            cls = self.__class__
+            cls._layout = BinaryLayout.compile(cls)
 
         return super().__setattr__(key, value)
 
 
+B = typing.TypeVar("B", bound=BinaryConfig)
+
+
+def compact(cls: typing.Type[B]) -> typing.Type[B]:
+    """
+    Class decorator that rebuilds a BinaryConfig with __slots__ for its fields (like @dataclass(slots=True)).
+
+    Instances have no __dict__, which makes them a lot smaller when loading many records (see `iter_unpack`).
+    Compact instances can't get other attributes than their fields and can't be weakly referenced
+    (so they are not hot-reloaded by a `Watcher`).
+
+    Usage:
+        @compact
+        class Record(BinaryConfig):
+            id = BinaryField(int)
+            name = BinaryField(str, length=16)
+    """
+    if not issubclass(cls, BinaryConfig):
+        raise TypeError(f"Only BinaryConfig classes can be compact, not {cls.__name__}.")
+
+    # the fields are replaced by slots, so keep their info in `_fields`:
+    namespace = {k: v for k, v in cls.__dict__.items() if k not in cls._fields and k not in ("__dict__", "__weakref__")}
+    namespace |= {"__slots__": tuple(cls._fields), "_fields": cls._fields}
+    if cls._lazy:
+        namespace["__slots__"] += ("_raw",)
+        # unset slots raise an AttributeError instead of going to _BinaryField.__get__:
+        namespace["__getattr__"] = _getattr_lazy
+
+    metaclass: type = type(cls)
+    new_cls = metaclass(cls.__name__, cls.__bases__, namespace)
+    new_cls.__qualname__ = cls.__qualname__
+    return typing.cast(typing.Type[B], new_cls)
+
+
+def _getattr_lazy(self: BinaryConfig, key: str) -> typing.Any:
+    """
+    __getattr__ of compact lazy classes: decode fields (unset slots) on first access.
+    """
+    if key == "_raw":
+        return None
+    if key in self._fields and self._raw is not None:
+        return self._decode_field(key)
+    raise AttributeError(f"{type(self).__name__!r} object has no attribute {key!r}")
+
+
+def _loaded(inst: BinaryConfig, field: str) -> bool:
+    """
+    Has a field of an instance been set (or decoded, if it was loaded lazily)?
+    """
+    try:
+        namespace = object.__getattribute__(inst, "__dict__")
+    except AttributeError:
+        # compact: the field is a slot, which raises when it's not set
+        slot = getattr(type(inst), field)
+        try:
+            slot.__get__(inst, type(inst))
+        except AttributeError:
+            return False
+        return True
+
+    return field in namespace
+
+
 @dataclass(slots=True)
 class _BinaryField:
     """
@@ -146,10 +455,73 @@ class _BinaryField:
     fmt: str
     special: typing.Callable[[typing.Any], dict[str, typing.Any]] | None
     packer: typing.Callable[[typing.Any], typing.Any] | None
+    name: str = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: BinaryConfig | None, owner: type = None) -> typing.Any:
+        """
+        Only called if an instance has no value for this field yet: decode it if the instance was loaded lazily.
+        """
+        if instance is None or instance._raw is None:
+            return self
+        return instance._decode_field(self.name)
 
     def __str__(self) -> str:
         return f"{self.length}{self.fmt}"
 
+    def is_plain(self) -> bool:
+        """
+        Is the value unpacked by struct already of the right type (so it needs no decoding or packing)?
+        """
+        if self.packer or self.special:
+            return False
+        return self.fmt in _PLAIN_FORMATS.get(self.klass, "")
+
+    def to_dtype(self) -> typing.Any:
+        """
+        NumPy dtype of this field (see `BinaryConfig.to_dtype`).
+        """
+        if issubclass(self.klass, BinaryConfig) and self.klass._get_length() == self.length:
+            return self.klass.to_dtype()
+
+        if self.fmt in "sp":
+            return f"S{self.length}"
+
+        size = struct.calcsize(self.fmt)
+        if self.fmt in "bhilqn":
+            dtype = f"i{size}"
+        elif self.fmt in "BHILQN":
+            dtype = f"u{size}"
+        elif self.fmt in "efd":
+            dtype = f"f{size}"
+        elif self.fmt in "?c":
+            dtype = self.fmt
+        else:
+            raise ValueError(f"Struct format {self.fmt!r} has no NumPy equivalent.")
+
+        return dtype if self.length == 1 else (dtype, (self.length,))
+
+    def decode(self, value: typing.Any) -> typing.Any:
+        """
+        Convert a value unpacked by struct into `klass`.
+        """
+        if isinstance(value, bytes) and not issubclass(self.klass, BinaryConfig):
+            value = value.strip(b"\x00").decode()
+
+        if self.special:
+            # e.g. load from JSON
+            value = self.special(value)
+
+        if is_custom_class(self.klass):
+            from .core import load_into
+
+            return load_into(self.klass, value)
+
+        # ensure it's the right class (e.g. bool):
+        return self.klass(value)
+
     def pack(self, value: typing.Any) -> typing.Any:
         if self.packer:
             value = self.packer(value)
@@ -160,6 +532,203 @@ class _BinaryField:
         return value
 
 
+# struct formats that unpack into the right python type already:
+_PLAIN_FORMATS = {
+    int: "bBhHiIlLqQnN",
+    float: "efd",
+    bool: "?",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class BinaryLayout:
+    """
+    Compiled memory layout of a BinaryConfig class, computed once per class and used to (un)pack its records.
+
+    Nested BinaryConfig fields are inlined into one flat struct if that doesn't change the layout (struct aligns
+    values natively, so inlining could move them), so nested records are unpacked in one go as well.
+    """
+
+    config: typing.Type[BinaryConfig]
+    fields: tuple[str, ...]
+    elements: tuple[_BinaryField, ...]
+    offsets: tuple[int, ...]
+    # does the value need decoding/packing? (see _BinaryField.is_plain)
+    plain: tuple[bool, ...]
+    # one value per field (nested configs as one bytestring):
+    compiled: struct.Struct
+    # per field, to (un)pack it on its own (for lazily loaded instances):
+    structs: tuple[struct.Struct, ...]
+    # nested configs inlined (the same as `compiled` if there are none, or if they can't be inlined):
+    flat: struct.Struct
+    # per field: the layout of the nested config that is inlined into `flat`, if any
+    inlined: tuple["BinaryLayout | None", ...]
+    # (format, offset) of every value in `flat`
+    leaves: tuple[tuple[str, int], ...]
+
+    @classmethod
+    def compile(cls, config: typing.Type[BinaryConfig]) -> "BinaryLayout":
+        """
+        Compile the layout of a BinaryConfig class.
+        """
+        fields, elements = config._collect_fields()
+        formats = [str(element) for element in elements]
+        offsets = _offsets(formats)
+        compiled = struct.Struct(" ".join(formats))
+
+        inlined: list[BinaryLayout | None] = []
+        leaves: list[tuple[str, int]] = []
+        for element, fmt, offset in zip(elements, formats, offsets):
+            nested = _inlinable(element)
+            inlined.append(nested)
+            if nested:
+                leaves.extend((leaf, offset + leaf_offset) for leaf, leaf_offset in nested.leaves)
+            else:
+                leaves.append((fmt, offset))
+
+        flat = compiled
+        if any(inlined):
+            flat_formats = [leaf for leaf, _ in leaves]
+            flat = struct.Struct(" ".join(flat_formats))
+            if flat.size != compiled.size or _offsets(flat_formats) != [offset for _, offset in leaves]:
+                # inlining would change the layout, so unpack nested configs as bytes:
+                flat = compiled
+                inlined = [None] * len(fields)
+                leaves = list(zip(formats, offsets))
+
+        return cls(
+            config=config,
+            fields=tuple(fields),
+            elements=tuple(elements),
+            offsets=tuple(offsets),
+            plain=tuple(element.is_plain() for element in elements),
+            compiled=compiled,
+            structs=tuple(struct.Struct(fmt) for fmt in formats),
+            flat=flat,
+            inlined=tuple(inlined),
+            leaves=tuple(leaves),
+        )
+
+    @property
+    def size(self) -> int:
+        """
+        Size of one record in bytes.
+        """
+        return self.compiled.size
+
+    @property
+    def format(self) -> str:
+        """
+        Struct format of one record.
+        """
+        return self.compiled.format
+
+    def table(self, _prefix: str = "", _offset: int = 0) -> list[tuple[str, int, int, str]]:
+        """
+        (name, offset, size, format) of every field, followed by the fields of nested configs ('nested.field').
+        """
+        rows = []
+        for field, element, offset in zip(self.fields, self.elements, self.offsets):
+            fmt = str(element)
+            rows.append((f"{_prefix}{field}", _offset + offset, struct.calcsize(fmt), fmt))
+            if issubclass(element.klass, BinaryConfig) and element.length == element.klass._get_length():
+                rows.extend(element.klass._layout.table(f"{_prefix}{field}.", _offset + offset))
+        return rows
+
+    def decode(self, values: typing.Sequence[typing.Any], pos: int = 0) -> tuple[list[tuple[str, typing.Any]], int]:
+        """
+        Convert the values unpacked by `flat` (starting at `pos`) into (field, value) pairs of the right types.
+
+        Also returns the position after the values of this layout, for the parent of an inlined config.
+        """
+        result = []
+        for field, element, plain, nested in zip(self.fields, self.elements, self.plain, self.inlined):
+            if nested:
+                nested_values, pos = nested.decode(values, pos)
+                value = nested.config._from_values(nested_values)
+            else:
+                value = values[pos] if plain else element.decode(values[pos])
+                pos += 1
+            result.append((field, value))
+        return result, pos
+
+    def decode_field(self, record: T_buffer, idx: int) -> typing.Any:
+        """
+        Unpack and decode only the value of one field (by index) of a record.
+        """
+        if nested := self.inlined[idx]:
+            return nested.config._load_at(record, self.offsets[idx])
+
+        (value,) = self.structs[idx].unpack_from(record, self.offsets[idx])
+        return value if self.plain[idx] else self.elements[idx].decode(value)
+
+    def encode(self, inst: BinaryConfig) -> list[typing.Any] | None:
+        """
+        The values of an instance as `flat` expects them.
+
+        None if a nested config can't be inlined (e.g. it was replaced by one of another class).
+        """
+        result: list[typing.Any] = []
+        for field, element, plain, nested in zip(self.fields, self.elements, self.plain, self.inlined):
+            value = getattr(inst, field)
+            if nested is None:
+                result.append(value if plain else element.pack(value))
+            elif type(value) is nested.config and (nested_values := nested.encode(value)) is not None:
+                result.extend(nested_values)
+            else:
+                return None
+        return result
+
+
+def _offsets(formats: list[str]) -> list[int]:
+    """
+    Offset of every value of a struct format.
+    """
+    # struct aligns the values natively, so the offset is the size up to and including the value, minus itself:
+    return [struct.calcsize(" ".join(formats[: idx + 1])) - struct.calcsize(fmt) for idx, fmt in enumerate(formats)]
+
+
+def _inlinable(element: _BinaryField) -> BinaryLayout | None:
+    """
+    The layout of a nested BinaryConfig field, if it can be unpacked as part of its parent.
+    """
+    klass = element.klass
+    if not issubclass(klass, BinaryConfig) or element.length != klass._get_length():
+        return None
+    if hasattr(klass, "__post_init__"):
+        # loaded with load_into, which calls it
+        return None
+    if klass._lazy:
+        # keeps its own record, to decode it when it's used
+        return None
+
+    layout = klass._layout
+    for nested_element, nested in zip(layout.elements, layout.inlined):
+        if issubclass(nested_element.klass, BinaryConfig) and nested is None:
+            # it has nested configs of its own that can't be inlined
+            return None
+
+    return layout
+
+
+BinaryConfig._layout = BinaryLayout.compile(BinaryConfig)
+
+
+def _import_numpy() -> typing.Any:
+    """
+    NumPy is an optional dependency, only required for the (to|from)_numpy/to_dtype bridge.
+    """
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "NumPy is required for this, install it with `pip install configuraptor[numpy]`. "
+            "Without numpy, BinaryConfig.iter_unpack and pack_many can be used."
+        ) from e
+
+    return numpy
+
+
 T = typing.TypeVar("T")
 
 # https://docs.python.org/3/library/struct.html
@@ -0,0 +1,153 @@
+"""
+Small caching primitives shared by the different caches in this library.
+"""
+
+import collections
+import threading
+import typing
+import weakref
+
+K = typing.TypeVar("K")
+V = typing.TypeVar("V")
+
+
+class CacheInfo(typing.NamedTuple):
+    """
+    Statistics of a cache, similar to `functools.lru_cache().cache_info()`.
+    """
+
+    hits: int
+    misses: int
+    currsize: int
+
+
+class ClassCache(typing.Generic[V]):
+    """
+    Stores a value computed once per class.
+
+    Classes are stored weakly (by identity), so when a class is redefined (e.g. in a test or a reloaded module),
+    the new class gets a new entry and the old one disappears together with the old class.
+    """
+
+    def __init__(self, factory: typing.Callable[[type], V]) -> None:
+        """
+        Factory is called with the class on a cache miss.
+        """
+        self._factory = factory
+        self._storage: weakref.WeakKeyDictionary[type, V] = weakref.WeakKeyDictionary()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, cls: type) -> V:
+        """
+        Get the cached value for `cls` or compute (and store) it.
+        """
+        try:
+            value = self._storage[cls]
+        except KeyError:
+            pass
+        except TypeError:  # pragma: no cover
+            # not weak-referenceable, don't cache
+            return self._factory(cls)
+        else:
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        value = self._storage[cls] = self._factory(cls)
+        return value
+
+    def invalidate(self, cls: type) -> None:
+        """
+        Forget the value for one class (e.g. after monkeypatching its annotations).
+        """
+        self._storage.pop(cls, None)
+
+    def clear(self) -> None:
+        """
+        Forget everything, including statistics.
+        """
+        self._storage.clear()
+        self.hits = self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """
+        Hit/miss statistics of this cache.
+        """
+        return CacheInfo(self.hits, self.misses, len(self._storage))
+
+
+class LRUCache(typing.Generic[K, V]):
+    """
+    Thread-safe mapping that forgets the least recently used item when it grows beyond `maxsize`.
+
+    A maxsize of 0 disables the cache.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        """
+        Create an empty cache of at most `maxsize` items.
+        """
+        self.maxsize = maxsize
+        self._storage: collections.OrderedDict[K, V] = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: K) -> V | None:
+        """
+        Get an item (and mark it as recently used) or None.
+        """
+        with self._lock:
+            try:
+                value = self._storage[key]
+            except KeyError:
+                self.misses += 1
+                return None
+
+            self._storage.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        """
+        Store an item, possibly evicting the least recently used one.
+        """
+        if not self.maxsize:
+            return
+
+        with self._lock:
+            self._storage[key] = value
+            self._storage.move_to_end(key)
+            while len(self._storage) > self.maxsize:
+                self._storage.popitem(last=False)
+
+    def resize(self, maxsize: int) -> None:
+        """
+        Change the maximum size (0 disables the cache), evicting items if required.
+        """
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._storage) > maxsize:
+                self._storage.popitem(last=False)
+
+    def invalidate(self, key: K) -> None:
+        """
+        Forget one item.
+        """
+        with self._lock:
+            self._storage.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Forget everything, including statistics.
+        """
+        with self._lock:
+            self._storage.clear()
+            self.hits = self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """
+        Hit/miss statistics of this cache.
+        """
+        return CacheInfo(self.hits, self.misses, len(self._storage))
@@ -13,8 +13,9 @@ from .abs import AbstractTypedConfig
 from .alias import has_aliases
 from .beautify import beautify as apply_beautify
 from .core import check_and_convert_type
+from .env import UNRESOLVED, LazyEnv
 from .errors import ConfigErrorExtraKey, ConfigErrorImmutable
-from .helpers import all_annotations, is_optional
+from .helpers import ANNOTATIONS, all_annotations, is_optional
 from .loaders.loaders_shared import _convert_key
 
 C = typing.TypeVar("C", bound=Any)
@@ -22,22 +23,101 @@ C = typing.TypeVar("C", bound=Any)
 NO_ANNOTATION = typing.NewType("NO_ANNOTATION", object)  # SentinelObject
 
 
+def _expand_lazy_env(inst: "TypedConfig", key: str, lazy: LazyEnv) -> Any:
+    """
+    Expand (and type check) a value that was loaded with lazy_env, the first time it is used.
+    """
+    if lazy.value is UNRESOLVED:
+        value: Any = lazy.render()
+        annotation = ANNOTATIONS.get(inst.__class__).get(key)
+        if lazy.strict and annotation is not None:
+            value = check_and_convert_type(value, annotation, convert_types=lazy.convert_types, key=key)
+        lazy.value = value
+    return lazy.value
+
+
+def _getattribute_lazy_env(self: "TypedConfig", key: str) -> Any:
+    """
+    __getattribute__ for classes with lazy_env.
+    """
+    value = object.__getattribute__(self, key)
+    if type(value) is LazyEnv:
+        return _expand_lazy_env(self, key, value)
+    return value
+
+
+def _copy_lazy_env(self: "TypedConfig") -> Any:
+    """
+    __copy__ for classes with lazy_env: the copy gets its own LazyEnv values, so expanding or refreshing them
+    (e.g. on a config created by `apply_patch`) doesn't affect the original.
+    """
+    cls = self.__class__
+    new = cls.__new__(cls)
+    new.__dict__.update(
+        {key: copy.copy(value) if type(value) is LazyEnv else value for key, value in self.__dict__.items()}
+    )
+    return new
+
+
 class TypedConfig(AbstractTypedConfig):
     """
     Can be used instead of load_into.
     """
 
-    def __init_subclass__(cls, beautify: bool = True, **_: typing.Any) -> None:
+    # expand ${VAR} placeholders when a value is first used instead of when loading:
+    # (not annotated, otherwise it would be seen as a config key)
+    _lazy_env = False
+
+    def __init_subclass__(cls, beautify: bool = True, lazy_env: bool | None = None, **_: typing.Any) -> None:
         """
         When inheriting from TypedConfig, automatically beautify the class.
 
         To disable this behavior:
         class MyConfig(TypedConfig, beautify=False):
             ...
+
+        With lazy_env=True, placeholders in (top-level) string values are expanded on first access,
+        see also `refresh_env`:
+        class MyConfig(TypedConfig, lazy_env=True):
+            ...
         """
         if beautify:
             apply_beautify(cls)
 
+        if lazy_env is not None:
+            cls._lazy_env = lazy_env
+            cls.__getattribute__ = _getattribute_lazy_env if lazy_env else object.__getattribute__  # type: ignore
+            if lazy_env:
+                cls.__copy__ = _copy_lazy_env  # type: ignore
+
+    def _expanded_dict(self) -> dict[str, Any]:
+        """
+        The config data, with lazy_env values expanded.
+        """
+        if not self._lazy_env:
+            return self.__dict__
+        return {
+            key: _expand_lazy_env(self, key, value) if type(value) is LazyEnv else value
+            for key, value in self.__dict__.items()
+        }
+
+    def _refresh_env(self) -> Self:
+        """
+        Expand the lazy_env values again on their next use (e.g. after os.environ or the .env file changed).
+
+        Underscore version can be used if .refresh_env is overwritten with another value in the config.
+        """
+        for value in self.__dict__.values():
+            if type(value) is LazyEnv:
+                value.value = UNRESOLVED
+        return self
+
+    def refresh_env(self) -> Self:
+        """
+        Expand the lazy_env values again on their next use (e.g. after os.environ or the .env file changed).
+        """
+        return self._refresh_env()
+
     def _update(
         self,
         _strict: bool = True,
@@ -54,7 +134,7 @@ class TypedConfig(AbstractTypedConfig):
         """
         Underscore version can be used if .update is overwritten with another value in the config.
         """
-        annotations = all_annotations(self.__class__)
+        annotations = ANNOTATIONS.get(self.__class__)
 
         for key, value in values.items():
             if _lower_keys:
@@ -148,6 +228,9 @@ class TypedConfig(AbstractTypedConfig):
 
         Returns an updated clone of the original object, so this works too:
         new_config = config | {...}
+
+        The clone is a deep copy, so it can be modified without affecting the original.
+        Use `apply_patch` (or a PersistentTypedMapping) to share the unchanged values instead.
         """
         to_update = self._clone()
         return to_update._update(**other)
@@ -188,7 +271,7 @@ class TypedConfig(AbstractTypedConfig):
         Replacement for string.format(**config), which is only possible for MutableMappings.
         MutableMapping does not work well with our Singleton Metaclass.
         """
-        return string.format(**self.__dict__)
+        return string.format(**self._expanded_dict())
 
     def __setattr__(self, key: str, value: typing.Any) -> None:
         """
@@ -207,12 +290,15 @@ class TypedConfig(AbstractTypedConfig):
         """
         Two instances are equal if they are of the same type and have equal internal data.
         """
+        if self is other:
+            return True
+
         if type(self) is not type(other):
             # only comparisons between the same classes are allowed
             return False
 
         # == should always return bool already but otherwise mypy gets confused:
-        return bool(self.__dict__ == other.__dict__)
+        return bool(self._expanded_dict() == other._expanded_dict())
 
 
 K = typing.TypeVar("K", bound=str)
@@ -233,7 +319,10 @@ class TypedMappingAbstract(TypedConfig, Mapping[K, V]):
         Example:
             my_config[key]
         """
-        return typing.cast(V, self.__dict__[key])
+        value = self.__dict__[key]
+        if type(value) is LazyEnv:
+            value = _expand_lazy_env(self, key, value)
+        return typing.cast(V, value)
 
     def __len__(self) -> int:
         """
@@ -2,43 +2,50 @@
 Contains most of the loading logic.
 """
 
+import copy
 import dataclasses as dc
+import datetime as dt
 import io
 import os
+import time
 import types
 import typing
 import warnings
 from pathlib import Path
 from typing import Any, Type
 
-import requests
-from dotenv import dotenv_values as _dotenv_values
-from dotenv import find_dotenv
-
 from . import loaders
-from .abs import DEFAULT_ENV_SETTING, AnyType, C, T, T_data, Type_C, UseEnvSetting
-from .alias import Alias, has_alias
-from .binary_config import BinaryConfig
+from .abs import DEFAULT_ENV_SETTING, AnyType, C, T, T_data, T_data_types, UseEnvSetting
+from .alias import Alias
+from .binary_config import BUFFER_TYPES, BinaryConfig, T_buffer
+from .caching import LRUCache
+from .env import LazyEnv, case_insensitive_view, defer_values, env_for, expand_values
+from .env import dotenv_values as _dotenv_values
 from .errors import (
     ConfigErrorCouldNotConvert,
     ConfigErrorInvalidType,
-    ConfigErrorMissingKey,
     FailedToLoad,
 )
 from .helpers import (
-    all_annotations,
     camel_to_snake,
     check_type,
-    dataclass_field,
-    expand_env_vars_into_toml_values,
     find_pyproject_toml,
     is_custom_class,
     is_optional,
-    is_parameterized,
-    is_union,
 )
+from .loaders.records import iter_records
+from .loaders.register import T_loader
+from .loaders.streaming import STREAMING
+from .plan import FieldKind, FieldPlan, load_plan
 from .postpone import Postponed
+from .remote import HTTP, CachedResponse
+from .sources import Sources, SourceTiming
 from .type_converters import CONVERTERS
+from .validators import compile_validator
+from .watch import WATCHED
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import requests
 
 
 def _data_for_nested_key(key: str, raw: dict[str, typing.Any]) -> dict[str, typing.Any]:
@@ -76,18 +83,25 @@ def _from_mock_url(url: str) -> str:
     return url.removeprefix("mock://")
 
 
-def guess_filetype_for_url(url: str, response: requests.Response = None) -> str:
+URL_PREFIXES = ("http://", "https://", "mock://")
+
+
+def is_url(data: str) -> bool:
     """
-    Based on the url (which may have an extension) and the requests response \
-        (which may have a content-type), try to guess the right filetype (-> loader, e.g. json or yaml).
+    Should this string be loaded as url (instead of as a filename)?
+    """
+    return data.startswith(URL_PREFIXES)
 
-    Falls back to JSON if none can be found.
+
+def _guess_url_filetype(url: str, content_type: str | None = None) -> str:
+    """
+    See `guess_filetype_for_url`, but based on the content-type header itself.
     """
     url = url.split("?")[0]
     if url_extension := os.path.splitext(url)[1].lower():
         return url_extension.strip(".")
 
-    if response and (content_type_header := response.headers.get("content-type", "").split(";")[0].strip()):
+    if content_type and (content_type_header := content_type.split(";")[0].strip()):
         content_type = content_type_header.split("/")[-1]
         if content_type != "plain":
             return content_type
@@ -96,14 +110,19 @@ def guess_filetype_for_url(url: str, response: requests.Response = None) -> str:
     return "json"
 
 
-def from_url(url: str, _dummy: bool = False) -> tuple[io.BytesIO, str]:
+def guess_filetype_for_url(url: str, response: "requests.Response | CachedResponse | None" = None) -> str:
     """
-    Load data as bytes into a file-like object and return the file type.
+    Based on the url (which may have an extension) and the requests response \
+        (which may have a content-type), try to guess the right filetype (-> loader, e.g. json or yaml).
 
-    This can be used by __load_data:
-    > loader = loaders.get(filetype)
-    > # dev/null exists but always returns b''
-    > data = loader(contents, Path("/dev/null"))
+    Falls back to JSON if none can be found.
+    """
+    return _guess_url_filetype(url, response.headers.get("content-type", "") if response else None)
+
+
+def _from_url(url: str, _dummy: bool = False) -> tuple[io.BytesIO, str, CachedResponse | None]:
+    """
+    Like `from_url` but also returns the (cached) response, if any.
     """
     if url.startswith("mock://"):
         data = _from_mock_url(url)
@@ -114,91 +133,175 @@ def from_url(url: str, _dummy: bool = False) -> tuple[io.BytesIO, str]:
     else:
         ssl_verify = os.getenv("SSL_VERIFY", "1") == "1"
 
-        resp = requests.get(url, timeout=10, verify=ssl_verify)
+        resp = HTTP.get(url, verify=ssl_verify)
         data = resp.text
 
     filetype = guess_filetype_for_url(url, resp)
-    return io.BytesIO(data.encode()), filetype
+    return io.BytesIO(data.encode()), filetype, resp
+
+
+def from_url(url: str, _dummy: bool = False) -> tuple[io.BytesIO, str]:
+    """
+    Load data as bytes into a file-like object and return the file type.
+
+    Requests go through a pooled session with an HTTP cache (see `remote.HTTP`).
+
+    This can be used by __load_data:
+    > loader = loaders.get(filetype)
+    > # dev/null exists but always returns b''
+    > data = loader(contents, Path("/dev/null"))
+    """
+    contents, filetype, _ = _from_url(url, _dummy)
+    return contents, filetype
+
+
+def _fetch_url(url: str) -> tuple[dict[str, typing.Any], bool]:
+    """
+    Load and parse a url. The parsed document is stored on cached responses, so a 304 doesn't parse again.
+
+    Returns the data and whether it's shared with the cache (and should thus be copied before modifying).
+    """
+    contents, filetype, response = _from_url(url)
+    if response is not None and response.parsed is not None:
+        return response.parsed, True
+
+    loader = loaders.get(filetype)
+    # dev/null exists but always returns b''
+    parsed = loader(contents, Path("/dev/null"))
+    if response is None:
+        return parsed, False
+
+    response.parsed = parsed
+    return parsed, True
+
+
+# Opt-in cache of parsed files, e.g. for loading multiple sections of one big pyproject.toml.
+# Enable with `FILE_CACHE.resize(<max amount of files>)`, empty with `FILE_CACHE.clear()`.
+# Entries are keyed on the file's mtime, size and inode, so a changed file is parsed again.
+FILE_CACHE: LRUCache[tuple[Path, T_loader, tuple[int, int, int]], dict[str, typing.Any]] = LRUCache(maxsize=0)
+# Same, but always on for the pyproject.toml that is used when no data is passed (e.g. one per section at startup).
+PYPROJECT_CACHE: LRUCache[tuple[Path, T_loader, tuple[int, int, int]], dict[str, typing.Any]] = LRUCache(maxsize=4)
+
+_IMMUTABLE = (str, int, float, bool, bytes, types.NoneType, dt.date, dt.time, dt.timedelta)
+
+
+def _copy_document(data: typing.Any) -> typing.Any:
+    """
+    Structural copy of parsed data, so modifications (e.g. env expansion) don't end up in the FILE_CACHE.
+
+    Cheaper than copy.deepcopy for the usual dicts, lists and scalars.
+    """
+    if isinstance(data, dict):
+        return {k: _copy_document(v) for k, v in data.items()}
+    elif isinstance(data, list):
+        return [_copy_document(v) for v in data]
+    elif isinstance(data, _IMMUTABLE):
+        return data
+    else:
+        return copy.deepcopy(data)
+
+
+def _parse_file(
+    path: Path, cache: LRUCache[tuple[Path, T_loader, tuple[int, int, int]], dict[str, typing.Any]] = FILE_CACHE
+) -> tuple[dict[str, typing.Any], bool]:
+    """
+    Load a file using the loader for its extension.
+
+    Returns the data and whether it's shared with the cache (and should thus be copied before modifying).
+    """
+    loader = loaders.get(path.suffix or path.name)
+    fullpath = path.resolve()
+
+    if not cache.maxsize:
+        with path.open("rb") as f:
+            return loader(f, fullpath), False
+
+    stat = fullpath.stat()
+    cache_key = (fullpath, loader, (stat.st_mtime_ns, stat.st_size, stat.st_ino))
+    if (data := cache.get(cache_key)) is None:
+        with path.open("rb") as f:
+            data = loader(f, fullpath)
+        cache.set(cache_key, data)
+
+    return data, True
 
 
 def dotenv_values() -> dict[str, str | None]:
-    """Wrapper around dotenv.dotenv_values that uses .env in cwd."""
-    return _dotenv_values(dotenv_path=find_dotenv(usecwd=True))
+    """
+    Wrapper around dotenv.dotenv_values that uses .env in cwd.
+
+    Kept for backwards compatibility, see `env.dotenv_values` (which is cached) and `env.env_for`.
+    """
+    return dict(_dotenv_values())
 
 
 def apply_env(data: dict[str, typing.Any], use_env: UseEnvSetting) -> None:
     """
     Apply the desired env-setting logic on data.
     """
-    match use_env:
-        case "yes":
-            env = dotenv_values() | os.environ
-        case "inverse":
-            env = os.environ | dotenv_values()
-        case "dotenv":
-            env = dotenv_values()
-        case "environ":
-            env = {**os.environ}
-        case _:  # pragma: no cover
-            return
+    if (env := env_for(use_env)) is None:  # pragma: no cover
+        return
 
-    expand_env_vars_into_toml_values(data, env)
+    expand_values(data, env)
 
 
-def _load_data(
-    data: T_data,
+def _fetch_data(data: T_data) -> tuple[typing.Any, bool]:
+    """
+    First stage of loading: turn a url, filename or Path into parsed data (other data is returned as-is).
+
+    Returns the data and whether it's shared with the FILE_CACHE (and should thus be copied before modifying).
+    """
+    if isinstance(data, str):
+        if is_url(data):
+            return _fetch_url(data)
+        else:
+            data = Path(data)
+
+    if isinstance(data, Path):
+        return _parse_file(data)
+
+    return data, False
+
+
+def _stream_data(data: T_data, key: str | None, classname: str | None) -> tuple[dict[str, typing.Any], str] | None:
+    """
+    For (huge) json/yaml files: only parse the section that will be selected (see `loaders.streaming.STREAMING`).
+
+    Returns the document with only that section in it and the key to select it with,
+    or None if streaming doesn't apply (e.g. the file is too small or the key isn't found).
+    """
+    if STREAMING.min_size is None:
+        return None
+
+    if isinstance(data, str) and not is_url(data):
+        data = Path(data)
+    if not isinstance(data, Path):
+        return None
+
+    if key is None and classname is not None:
+        key = _guess_key(classname)
+
+    if key and (document := STREAMING.select(data, key)) is not None:
+        return document, key
+
+    return None
+
+
+def _select_data(
+    data: typing.Any,
     key: str = None,
     classname: str = None,
     lower_keys: bool = False,
     allow_types: tuple[type, ...] = (dict,),
-    strict: bool = False,
     use_env: UseEnvSetting = DEFAULT_ENV_SETTING,
+    shared: bool = False,
 ) -> dict[str, typing.Any]:
     """
-    Tries to load the right data from a filename/path or dict, based on a manual key or a classname.
+    Second stage of loading: select the right (nested) key from already parsed data, based on a key or a classname.
 
     E.g. class Tool will be mapped to key tool.
     It also deals with nested keys (tool.extra -> {"tool": {"extra": ...}}
     """
-    if isinstance(data, bytes):
-        # instantly return, don't modify
-        # bytes as inputs -> bytes as output
-        # but since `T_data` is re-used, that's kind of hard to type for mypy.
-        return data  # type: ignore
-
-    if isinstance(data, list):
-        if not data:
-            raise ValueError("Empty list passed!")
-
-        final_data: dict[str, typing.Any] = {}
-        for source in data:
-            final_data |= load_data(
-                source,
-                key=key,
-                classname=classname,
-                lower_keys=True,
-                allow_types=allow_types,
-                strict=strict,
-                use_env=use_env,
-            )
-
-        return final_data
-
-    if isinstance(data, str):
-        if data.startswith(("http://", "https://", "mock://")):
-            contents, filetype = from_url(data)
-
-            loader = loaders.get(filetype)
-            # dev/null exists but always returns b''
-            data = loader(contents, Path("/dev/null"))
-        else:
-            data = Path(data)
-
-    if isinstance(data, Path):
-        with data.open("rb") as f:
-            loader = loaders.get(data.suffix or data.name)
-            data = loader(f, data.resolve())
-
     if not data:
         return {}
 
@@ -218,6 +321,10 @@ def _load_data(
     if not isinstance(data, allow_types):
         raise ValueError(f"Data should be one of {allow_types} but it is {type(data)}!")
 
+    if shared:
+        # only copy the selected section, not the whole (cached) file
+        data = _copy_document(data)
+
     if lower_keys and isinstance(data, dict):
         data = {k.lower(): v for k, v in data.items()}
 
@@ -227,52 +334,253 @@ def _load_data(
     return typing.cast(dict[str, typing.Any], data)
 
 
-def load_data(
-    data: T_data,
+def _load_list(
+    data: list[typing.Any],
     key: str = None,
     classname: str = None,
-    lower_keys: bool = False,
     allow_types: tuple[type, ...] = (dict,),
     strict: bool = False,
     use_env: UseEnvSetting = DEFAULT_ENV_SETTING,
 ) -> dict[str, typing.Any]:
     """
-    Wrapper around __load_data that retries with key="" if anything goes wrong.
+    Load multiple data sources and merge them in order.
     """
-    if data is None:
-        # try to load pyproject.toml
-        data = find_pyproject_toml()
+    if not data:
+        raise ValueError("Empty list passed!")
 
-    try:
-        return _load_data(
-            data,
-            key,
-            classname,
-            lower_keys=lower_keys,
+    final_data: dict[str, typing.Any] = {}
+    for source in data:
+        final_data |= load_data(
+            source,
+            key=key,
+            classname=classname,
+            lower_keys=True,
             allow_types=allow_types,
             strict=strict,
             use_env=use_env,
         )
-    except Exception as e:
-        # sourcery skip: remove-unnecessary-else, simplify-empty-collection-comparison, swap-if-else-branches
-        # @sourcery: `key != ""` is NOT the same as `not key`
-        if key != "":
-            # try again with key ""
-            return load_data(
-                data,
-                "",
-                classname,
-                lower_keys=lower_keys,
+
+    return final_data
+
+
+def _load_sources(
+    sources: Sources,
+    key: str = None,
+    classname: str = None,
+    allow_types: tuple[type, ...] = (dict,),
+    strict: bool = False,
+    use_env: UseEnvSetting = DEFAULT_ENV_SETTING,
+) -> dict[str, typing.Any]:
+    """
+    Load Sources in a thread pool, then merge them in list order (like `_load_list`).
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    on_error = sources.on_error or ("raise" if strict else "warn")
+    results: list[dict[str, typing.Any]] = [{} for _ in sources]
+    timings: list[SourceTiming | None] = [None for _ in sources]
+
+    def load_one(idx: int, source: T_data_types) -> dict[str, typing.Any]:
+        start = time.perf_counter()
+        try:
+            result = load_data(
+                source,
+                key=key,
+                classname=classname,
+                lower_keys=True,
                 allow_types=allow_types,
-                strict=strict,
+                strict=True,
                 use_env=use_env,
             )
-        elif strict:
-            raise FailedToLoad(data) from e
+        except Exception as e:
+            timings[idx] = SourceTiming(source, time.perf_counter() - start, e)
+            raise
+
+        timings[idx] = SourceTiming(source, time.perf_counter() - start)
+        return result
+
+    pool = ThreadPoolExecutor(max_workers=max(1, min(sources.workers, len(sources))))
+    try:
+        futures = {pool.submit(load_one, idx, source): idx for idx, source in enumerate(sources)}
+        for future in as_completed(futures):
+            idx = futures[future]
+            try:
+                results[idx] = future.result()
+            except Exception as e:
+                if on_error == "raise":
+                    # fail fast: don't start the sources that are still waiting
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    if isinstance(e, FailedToLoad):
+                        raise
+                    raise FailedToLoad(sources[idx]) from e
+
+                warnings.warn(f"Data ('{sources[idx]!r}') could not be loaded", source=e, category=UserWarning)
+    finally:
+        pool.shutdown(wait=False)
+        sources.timings = [timing for timing in timings if timing is not None]
+
+    final_data: dict[str, typing.Any] = {}
+    for result in results:
+        final_data |= result
+
+    return final_data
+
+
+def _load_data(
+    data: T_data,
+    key: str = None,
+    classname: str = None,
+    lower_keys: bool = False,
+    allow_types: tuple[type, ...] = (dict,),
+    strict: bool = False,
+    use_env: UseEnvSetting = DEFAULT_ENV_SETTING,
+) -> dict[str, typing.Any]:
+    """
+    Tries to load the right data from a filename/path or dict, based on a manual key or a classname.
+
+    Combines `_fetch_data` and `_select_data` (without the key fallback of `load_data`).
+    """
+    if isinstance(data, BUFFER_TYPES):
+        # instantly return, don't modify
+        # bytes as inputs -> bytes as output
+        # but since `T_data` is re-used, that's kind of hard to type for mypy.
+        return data  # type: ignore
+
+    if isinstance(data, list):
+        return _load_list(data, key, classname, allow_types=allow_types, strict=strict, use_env=use_env)
+
+    document, shared = _fetch_data(data)
+    return _select_data(document, key, classname, lower_keys, allow_types, use_env, shared=shared)
+
+
+T_fallback_hook = typing.Callable[[T_data, str | None, Exception], None]
+
+
+@dc.dataclass
+class KeyFallbackTrace:
+    """
+    Keeps track of how often `load_data` had to retry with key="" (e.g. because the guessed key was not found).
+
+    Hooks are called with (data, original key, exception) every time the fallback is taken.
+    """
+
+    count: int = 0
+    hooks: list[T_fallback_hook] = dc.field(default_factory=list)
+
+    def register(self, hook: T_fallback_hook) -> T_fallback_hook:
+        """
+        Add a hook (can be used as a decorator).
+        """
+        self.hooks.append(hook)
+        return hook
+
+    def __call__(self, data: T_data, key: str | None, exception: Exception) -> None:
+        """
+        Record one fallback.
+        """
+        self.count += 1
+        for hook in self.hooks:
+            hook(data, key, exception)
+
+    def reset(self) -> None:
+        """
+        Set the counter back to zero (hooks are kept).
+        """
+        self.count = 0
+
+
+KEY_FALLBACK = KeyFallbackTrace()
+
+
+def _failed_to_load(data: T_data, exception: Exception, strict: bool) -> dict[str, typing.Any]:
+    """
+    Raise (strict) or warn (non-strict) when data could not be loaded.
+    """
+    if strict:
+        raise FailedToLoad(data) from exception
+
+    # e.g. if settings are to be loaded via a URL that is unavailable or returns invalid json
+    warnings.warn(f"Data ('{data!r}') could not be loaded", source=exception, category=UserWarning)
+    return {}
+
+
+def load_data(
+    data: T_data,
+    key: str = None,
+    classname: str = None,
+    lower_keys: bool = False,
+    allow_types: tuple[type, ...] = (dict,),
+    strict: bool = False,
+    use_env: UseEnvSetting = DEFAULT_ENV_SETTING,
+) -> dict[str, typing.Any]:
+    """
+    Wrapper around _load_data that retries with key="" if selecting the key goes wrong.
+
+    The data is only fetched and parsed once: the fallback reuses the already parsed document.
+    """
+    if data is None and (pyproject := find_pyproject_toml()):
+        # try to load pyproject.toml (found and parsed once for all sections, see PYPROJECT_CACHE)
+        try:
+            document, shared = _parse_file(pyproject, PYPROJECT_CACHE)
+        except Exception as e:
+            return _failed_to_load(pyproject, e, strict)
+
+        return _select_with_fallback(
+            pyproject, document, shared, key, classname, lower_keys, allow_types, strict, use_env
+        )
+
+    if isinstance(data, BUFFER_TYPES):
+        return _load_data(data)
+
+    if isinstance(data, Sources) and data:
+        # errors are handled per source (see Sources.on_error)
+        return _load_sources(data, key, classname, allow_types=allow_types, strict=strict, use_env=use_env)
+
+    try:
+        if isinstance(data, list):
+            return _load_list(data, key, classname, allow_types=allow_types, strict=strict, use_env=use_env)
+
+        if streamed := _stream_data(data, key, classname):
+            document, key = streamed
+            shared = False
         else:
-            # e.g. if settings are to be loaded via a URL that is unavailable or returns invalid json
-            warnings.warn(f"Data ('{data!r}') could not be loaded", source=e, category=UserWarning)
-            return {}
+            document, shared = _fetch_data(data)
+    except Exception as e:
+        # fetching/parsing failed, retrying with another key won't help.
+        return _failed_to_load(data, e, strict)
+
+    return _select_with_fallback(data, document, shared, key, classname, lower_keys, allow_types, strict, use_env)
+
+
+def _select_with_fallback(
+    data: T_data,
+    document: typing.Any,
+    shared: bool,
+    key: str = None,
+    classname: str = None,
+    lower_keys: bool = False,
+    allow_types: tuple[type, ...] = (dict,),
+    strict: bool = False,
+    use_env: UseEnvSetting = DEFAULT_ENV_SETTING,
+) -> dict[str, typing.Any]:
+    """
+    `_select_data` on a parsed document of `data`, retrying with key="" if selecting the key goes wrong.
+    """
+    try:
+        return _select_data(document, key, classname, lower_keys, allow_types, use_env, shared=shared)
+    except Exception as e:
+        # sourcery skip: simplify-empty-collection-comparison
+        # @sourcery: `key != ""` is NOT the same as `not key`
+        if key == "":
+            return _failed_to_load(data, e, strict)
+
+        KEY_FALLBACK(data, key, e)
+
+    # try again with key ""
+    try:
+        return _select_data(document, "", classname, lower_keys, allow_types, use_env, shared=shared)
+    except Exception as e:
+        return _failed_to_load(data, e, strict)
 
 
 F = typing.TypeVar("F")
@@ -367,6 +675,11 @@ def ensure_types(
                 # original key set, update alias
                 compare = related_data
 
+        if isinstance(compare, LazyEnv):
+            # checked when it's expanded
+            final[key] = compare
+            continue
+
         compare = check_and_convert_type(compare, _type, convert_types, key)
 
         final[key] = compare
@@ -402,6 +715,7 @@ def load_recursive(
     try to resolve the tree of annotations.
 
     Uses `load_into_recurse`, not itself directly.
+    The analysis of `cls` (custom classes, aliases, defaults) is compiled once into a cached LoadPlan (see `plan.py`).
 
     Example:
         class First:
@@ -427,71 +741,55 @@ def load_recursive(
 
     TODO: python 3.11 exception groups to throw multiple errors at once!
     """
-    updated = {}
+    return _load_fields(cls, data, load_plan(cls).select(cls, annotations), convert_types=convert_types)
 
-    for _key, _type in annotations.items():
-        # fixme:
-        # if defaultable or optional[defaultable] and key is not in data: return Default()
-        # if defaultable or optional[defaultable] and key is in data but falsey: return None
 
+def _load_fields(
+    cls: AnyType,
+    data: dict[str, T],
+    fields: typing.Iterable[FieldPlan],
+    convert_types: bool = False,
+) -> dict[str, T]:
+    """
+    Execute (part of) a compiled LoadPlan, see `load_recursive`.
+    """
+    updated = {}
+
+    for field in fields:
+        _key = field.key
         if _key in data:
             value: typing.Any = data[_key]  # value can change so define it as any instead of T
-            if is_parameterized(_type):
-                origin = typing.get_origin(_type)
-                arguments = typing.get_args(_type)
-                if origin is list and arguments and is_custom_class(arguments[0]):
-                    subtype = arguments[0]
+            match field.kind:
+                case FieldKind.CUSTOM:
+                    # type must be C (custom class) at this point; includes dataclass but not optional[cls]
+                    value = _load_into_recurse(field.subtypes[0], value, convert_types=convert_types)
+                case FieldKind.LIST:
+                    subtype = field.subtypes[0]
                     value = [_load_into_recurse(subtype, subvalue, convert_types=convert_types) for subvalue in value]
-
-                elif origin is dict and arguments and is_custom_class(arguments[1]):
+                case FieldKind.DICT:
                     # e.g. dict[str, Point]
-                    subkeytype, subvaluetype = arguments
+                    subvaluetype = field.subtypes[0]
                     # subkey(type) is not a custom class, so don't try to convert it:
                     value = {
                         subkey: _load_into_recurse(subvaluetype, subvalue, convert_types=convert_types)
                         for subkey, subvalue in value.items()
                     }
-                # elif origin is dict:
-                # keep data the same
-                elif is_union(_type) and arguments:
-                    if convert_types and types.NoneType in arguments and not value:
+                case FieldKind.UNION:
+                    if convert_types and field.nullable and not value:
                         value = None
-                        updated[_key] = value
-                        continue
-
-                    for arg in arguments:
-                        if is_custom_class(arg) and isinstance(value, (dict, arg)):
-                            value = _load_into_recurse(arg, value, convert_types=convert_types)
-
-            elif is_custom_class(_type):
-                # type must be C (custom class) at this point; includes dataclass but not optional[cls]
-                value = _load_into_recurse(
-                    # make mypy and pycharm happy by telling it _type is of type C...
-                    # actually just passing _type as first arg!
-                    typing.cast(Type_C[typing.Any], _type),
-                    value,
-                    convert_types=convert_types,
-                )
-
-            # else: normal value, don't change
-
-        elif value := has_alias(cls, _key, data):
+                    else:
+                        for arg in field.subtypes:
+                            if isinstance(value, (dict, arg)):
+                                value = _load_into_recurse(arg, value, convert_types=convert_types)
+                # case FieldKind.PLAIN: normal value, don't change
+
+        elif field.aliases and (value := next((v for alias in field.aliases if (v := data.get(alias))), None)):
             # value updated by alias
             ...
-        elif _key in cls.__dict__:
-            # property has default, use that instead.
-            value = cls.__dict__[_key]
-        elif (defaultable := is_defaultable(_type, with_optional=True)) is not None:
-            value = defaultable.default()
-        elif is_optional(_type):
-            # type is optional and not found in __dict__ -> default is None
-            value = None
-        elif dc.is_dataclass(cls) and (field := dataclass_field(cls, _key)) and field.default_factory is not dc.MISSING:
-            # could have a default factory
-            # todo: do something with field.default?
-            value = field.default_factory()
         else:
-            raise ConfigErrorMissingKey(_key, cls, _type)
+            # property has default (class attribute, Defaultable, None for Optional, dataclass default_factory)
+            # or raises ConfigErrorMissingKey
+            value = field.default(cls)
 
         updated[_key] = value
 
@@ -512,13 +810,13 @@ def check_and_convert_data(
     2. loads custom class type annotations with the same logic (see also `load_recursive`)
     3. ensures the annotated types match the actual types after loading the config file.
     """
-    annotations = all_annotations(cls, _except=_except)
+    fields = load_plan(cls).without(_except)
 
     to_load = convert_config(data)
-    to_load = load_recursive(cls, to_load, annotations, convert_types=convert_types)
+    to_load = _load_fields(cls, to_load, fields, convert_types=convert_types)
 
     if strict:
-        to_load = ensure_types(to_load, annotations, convert_types=convert_types)
+        to_load = ensure_types(to_load, {field.key: field.annotation for field in fields}, convert_types=convert_types)
 
     return to_load
 
@@ -551,7 +849,7 @@ def _split_init(init: T_init) -> tuple[T_init_list, T_init_dict]:
 
 def _load_into_recurse(
     cls: typing.Type[C],
-    data: dict[str, typing.Any] | bytes,
+    data: dict[str, typing.Any] | T_buffer,
     init: T_init = None,
     strict: bool = True,
     convert_types: bool = False,
@@ -565,8 +863,8 @@ def _load_into_recurse(
     """
     init_args, init_kwargs = _split_init(init)
 
-    if isinstance(data, bytes) or issubclass(cls, BinaryConfig):
-        if not isinstance(data, (bytes, dict)):  # pragma: no cover
+    if isinstance(data, BUFFER_TYPES) or issubclass(cls, BinaryConfig):
+        if not isinstance(data, (*BUFFER_TYPES, dict)):  # pragma: no cover
             raise NotImplementedError("BinaryConfig can only deal with `bytes` or a dict of bytes as input.")
         elif not issubclass(cls, BinaryConfig):  # pragma: no cover
             raise NotImplementedError("Only BinaryConfig can be used with `bytes` (or a dict of bytes) as input.")
@@ -621,6 +919,13 @@ def _load_into_instance(
     return inst
 
 
+def _is_lazy_env(cls: AnyType, use_env: UseEnvSetting) -> bool:
+    """
+    Should ${VAR} placeholders be expanded when the values are used, instead of when loading (see TypedConfig)?
+    """
+    return use_env != "no" and getattr(cls, "_lazy_env", False) is True
+
+
 def load_into_class(
     cls: typing.Type[C],
     data: T_data,
@@ -635,7 +940,8 @@ def load_into_class(
     """
     Shortcut for _load_data + load_into_recurse.
     """
-    allow_types = (dict, bytes) if issubclass(cls, BinaryConfig) else (dict,)
+    allow_types = (dict, *BUFFER_TYPES) if issubclass(cls, BinaryConfig) else (dict,)
+    lazy_env = _is_lazy_env(cls, use_env)
     to_load = load_data(
         data,
         key,
@@ -643,8 +949,10 @@ def load_into_class(
         lower_keys=lower_keys,
         allow_types=allow_types,
         strict=strict,
-        use_env=use_env,
+        use_env="no" if lazy_env else use_env,
     )
+    if lazy_env:
+        to_load = defer_values(to_load, use_env, strict, convert_types)
     return _load_into_recurse(cls, to_load, init=init, strict=strict, convert_types=convert_types)
 
 
@@ -663,7 +971,8 @@ def load_into_instance(
     Shortcut for _load_data + load_into_existing.
     """
     cls = inst.__class__
-    allow_types = (dict, bytes) if issubclass(cls, BinaryConfig) else (dict,)
+    allow_types = (dict, *BUFFER_TYPES) if issubclass(cls, BinaryConfig) else (dict,)
+    lazy_env = _is_lazy_env(cls, use_env)
     to_load = load_data(
         data,
         key,
@@ -671,8 +980,10 @@ def load_into_instance(
         lower_keys=lower_keys,
         allow_types=allow_types,
         strict=strict,
-        use_env=use_env,
+        use_env="no" if lazy_env else use_env,
     )
+    if lazy_env:
+        to_load = defer_values(to_load, use_env, strict, convert_types)
     return _load_into_instance(inst, cls, to_load, init=init, strict=strict, convert_types=convert_types)
 
 
@@ -737,6 +1048,14 @@ def load_into(
             use_env=use_env,
         )
 
+    WATCHED.track(result, data, key, strict, lower_keys, convert_types, use_env)
+    return _post_load(result)
+
+
+def _post_load(result: C) -> C:
+    """
+    Call `__post_init__` on a freshly loaded instance (dataclasses already do this themselves).
+    """
     post_init = getattr(result, "__post_init__", None)
     if callable(post_init) and not dc.is_dataclass(result):
         post_init()
@@ -744,6 +1063,209 @@ def load_into(
     return result
 
 
+def _prepare_record(
+    record: dict[str, typing.Any],
+    key: str | None,
+    lower_keys: bool,
+    env: dict[str, typing.Any] | None,
+) -> dict[str, typing.Any]:
+    """
+    `_select_data` for one of the records of `load_many`, without guessing the key and with a pre-computed env.
+    """
+    if key:
+        record = _data_for_nested_key(key, record)
+    if lower_keys:
+        record = {k.lower(): v for k, v in record.items()}
+    if env:
+        expand_values(record, env, case_insensitive=False)
+    return record
+
+
+def _ensure_columns(rows: list[dict[str, typing.Any]], fields: tuple[FieldPlan, ...], convert_types: bool) -> None:
+    """
+    Like `ensure_types`, but for the same field of all rows at once (in place), so the validator is looked up once.
+    """
+    for field in fields:
+        key, annotation = field.key, field.annotation
+        validator = compile_validator(annotation)
+        for row in rows:
+            if key not in row:
+                # set by __init__
+                continue
+
+            value = row[key]
+            if isinstance(value, Alias):
+                value = row.get(value.to, value)
+
+            if isinstance(value, Postponed):
+                # don't do anything with this item!
+                del row[key]
+            elif not validator(value):
+                row[key] = check_and_convert_type(value, annotation, convert_types, key)
+            else:
+                row[key] = value
+
+
+def _load_batch(
+    cls: typing.Type[C],
+    rows: list[dict[str, typing.Any]],
+    strict: bool = True,
+    convert_types: bool = False,
+) -> list[C]:
+    """
+    `_load_into_recurse` for many rows at once.
+    """
+    plan = load_plan(cls)
+    is_dataclass = dc.is_dataclass(cls)
+    # dataclasses are created after loading, other classes before (so keys set by __init__ can be skipped):
+    instances: list[typing.Any] = [] if is_dataclass else [cls() for _ in rows]
+
+    loaded = []
+    for idx, row in enumerate(rows):
+        init_keys = () if is_dataclass else instances[idx].__dict__.keys()
+        loaded.append(_load_fields(cls, convert_config(row), plan.without(init_keys), convert_types=convert_types))
+
+    if strict:
+        _ensure_columns(loaded, plan.fields, convert_types)
+
+    if is_dataclass:
+        return [cls(**data) for data in loaded]
+
+    for inst, data in zip(instances, loaded):
+        inst.__dict__.update(data)
+        _post_load(inst)
+
+    return typing.cast(list[C], instances)
+
+
+@typing.overload
+def load_many(
+    cls: typing.Type[C],
+    records: typing.Iterable[dict[str, typing.Any]],
+    /,
+    key: str = None,
+    strict: bool = True,
+    lower_keys: bool = False,
+    convert_types: bool = False,
+    use_env: UseEnvSetting = DEFAULT_ENV_SETTING,
+    lazy: typing.Literal[False] = False,
+) -> list[C]:
+    """
+    Load many records into a list of instances.
+    """
+
+
+@typing.overload
+def load_many(
+    cls: typing.Type[C],
+    records: typing.Iterable[dict[str, typing.Any]],
+    /,
+    key: str = None,
+    strict: bool = True,
+    lower_keys: bool = False,
+    convert_types: bool = False,
+    use_env: UseEnvSetting = DEFAULT_ENV_SETTING,
+    lazy: typing.Literal[True] = True,
+) -> typing.Iterator[C]:
+    """
+    Load many records, one at a time.
+    """
+
+
+def load_many(
+    cls: typing.Type[C],
+    records: typing.Iterable[dict[str, typing.Any]],
+    /,
+    key: str = None,
+    strict: bool = True,
+    lower_keys: bool = False,
+    convert_types: bool = False,
+    use_env: UseEnvSetting = DEFAULT_ENV_SETTING,
+    lazy: bool = False,
+) -> list[C] | typing.Iterator[C]:
+    """
+    Load many records (dicts) into instances of the same class, e.g. the rows of a list of tenants.
+
+    Faster than calling `load_into` for each record: the class' plan and the env are prepared once,
+    records are used as-is (the key is not guessed) and types are checked per field (column) for all records.
+
+    Args:
+        cls: the class to load the records into.
+        records: iterable of dicts.
+        key: optional (nested) key to load from each record (e.g. 'tenant.settings').
+        strict: see `load_into`.
+        lower_keys: see `load_into`.
+        convert_types: see `load_into`.
+        use_env: see `load_into`.
+        lazy: return a generator that loads one record at a time (e.g. for huge amounts of records),
+            instead of a list.
+    """
+    env = env_for(use_env) if use_env != "no" else None
+    if env:
+        # case-fold once instead of for every record:
+        env = case_insensitive_view(env)
+
+    if issubclass(cls, BinaryConfig):
+        binary = (
+            load_into(cls, record, key=key, strict=strict, convert_types=convert_types, use_env=use_env)
+            for record in records
+        )
+        return binary if lazy else list(binary)
+
+    if lazy:
+        return (
+            _load_batch(cls, [_prepare_record(record, key, lower_keys, env)], strict, convert_types)[0]
+            for record in records
+        )
+
+    rows = [_prepare_record(record, key, lower_keys, env) for record in records]
+    return _load_batch(cls, rows, strict, convert_types)
+
+
+def iter_load_into(
+    cls: typing.Type[C],
+    source: str | Path | typing.BinaryIO | typing.TextIO,
+    /,
+    key: str = None,
+    strict: bool = True,
+    lower_keys: bool = False,
+    convert_types: bool = False,
+    use_env: UseEnvSetting = DEFAULT_ENV_SETTING,
+    extension: str = None,
+) -> typing.Iterator[C]:
+    """
+    Lazily load every record of a JSON Lines (.jsonl) or multi-document YAML file into an instance of `cls`.
+
+    Records are read, parsed and loaded one at a time (like `load_many(..., lazy=True)`), so memory usage stays
+    the same regardless of the size of the file.
+
+    Args:
+        cls: the class to load each record into.
+        source: path to the file or an opened (binary or text) stream, e.g. sys.stdin.
+        key: optional (nested) key to load from each record (e.g. 'tenant.settings').
+        strict: see `load_into`.
+        lower_keys: see `load_into`.
+        convert_types: see `load_into`.
+        use_env: see `load_into`.
+        extension: file type (e.g. 'jsonl') if it can't be determined from the path or stream name.
+
+    Example:
+        for event in iter_load_into(Event, "events.jsonl"):
+            ...
+    """
+    records = iter_records(source, extension)
+    return load_many(
+        cls,
+        records,
+        key=key,
+        strict=strict,
+        lower_keys=lower_keys,
+        convert_types=convert_types,
+        use_env=use_env,
+        lazy=True,
+    )
+
+
 class Defaultable:
     """
     Explicit opt-in for classes that can construct a default instance.
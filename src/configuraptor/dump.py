@@ -5,9 +5,6 @@ Method to dump classes to other formats.
 import json
 import typing
 
-import tomli_w
-import yaml
-
 from .helpers import camel_to_snake, instance_of_custom_class, is_custom_class
 from .loaders.register import register_dumper
 
@@ -21,6 +18,17 @@ PRIVATE = 2  # class.__variable
 T_Scope = typing.Literal[0, 1, 2] | bool
 
 
+def _slots(cls: type) -> list[str]:
+    """
+    All __slots__ of a class (including those of its parents).
+    """
+    slots: list[str] = []
+    for klass in reversed(cls.__mro__):
+        names = klass.__dict__.get("__slots__", ())
+        slots.extend([names] if isinstance(names, str) else names)
+    return [slot for slot in slots if slot not in ("__dict__", "__weakref__")]
+
+
 @register_dumper("dict")
 def asdict(
     inst: typing.Any, _level: int = 0, /, with_top_level_key: bool = True, exclude_internals: T_Scope = 0
@@ -28,14 +36,25 @@ def asdict(
     """
     Dump a config instance to a dictionary (recursively).
     """
+    from .binary_config import BinaryConfig
+    from .env import LazyEnv
+
     data: dict[str, typing.Any] = {}
 
-    if not hasattr(inst, "__dict__"):
+    if isinstance(inst, BinaryConfig) and inst._raw is not None:
+        # loaded lazily: decode the fields instead of dumping the raw record
+        items = [(key, getattr(inst, key)) for key in inst._fields]
+    elif hasattr(inst, "__dict__"):
+        items = inst.__dict__.items()
+    elif slots := _slots(inst.__class__):
+        # e.g. a compact BinaryConfig
+        items = [(key, getattr(inst, key)) for key in slots if hasattr(inst, key)]
+    else:
         # weird type - skip
         return {}
 
     internals_prefix = f"_{inst.__class__.__name__}__"
-    for key, value in inst.__dict__.items():
+    for key, value in items:
         if exclude_internals == PROTECTED and key.startswith(internals_prefix):
             # skip _ and __ on level 2
             continue
@@ -45,6 +64,11 @@ def asdict(
         # else: skip nothing
 
         cls = value.__class__
+        if cls is LazyEnv:
+            # loaded with lazy_env, expand it now
+            value = getattr(inst, key)
+            cls = value.__class__
+
         if is_custom_class(cls):
             value = asdict(value, _level + 1, exclude_internals=exclude_internals)
         elif isinstance(value, list):
@@ -73,6 +97,8 @@ def astoml(inst: typing.Any, multiline_strings: bool = False, **kw: typing.Any)
     """
     Dump a config instance to toml (recursively).
     """
+    import tomli_w
+
     data = asdict(
         inst,
         with_top_level_key=kw.pop("with_top_level_key", True),
@@ -99,6 +125,8 @@ def asyaml(inst: typing.Any, **kw: typing.Any) -> str:
     """
     Dump a config instance to yaml (recursively).
     """
+    import yaml
+
     data = asdict(
         inst,
         with_top_level_key=kw.pop("with_top_level_key", True),
@@ -0,0 +1,365 @@
+"""
+Expansion of ${VAR} placeholders in config values (see the `use_env` setting of `load_into`).
+
+Strings are scanned for '$' first, so values without placeholders cost (almost) nothing.
+Every distinct string with placeholders is compiled once into its literal parts and the variables in between.
+Syntax the compiled form doesn't support (e.g. ${VAR:?error}, ${VAR:+alt} or escapes) is expanded by `expandvars`.
+
+With `class MyConfig(TypedConfig, lazy_env=True)`, placeholders are only expanded when a field is first used.
+
+The variables themselves (os.environ and/or the .env file) are cached between loads too,
+until os.environ, the working directory or the .env file changes (or `invalidate` is called).
+"""
+
+import os
+import re
+import typing
+import warnings
+
+from .caching import LRUCache
+
+T_env = typing.Mapping[str, typing.Any]
+
+_LEGACY_ENV_DEFAULTS_RE = re.compile(r"\$\{([A-Za-z_][A-Za-z0-9_]*):([^\-?=+][^}]*)}")
+
+# $VAR, ${VAR}, ${VAR-default} and ${VAR:-default} (with a plain default):
+_PLACEHOLDER_RE = re.compile(
+    r"\$(?:(?P<bare>[A-Za-z_][A-Za-z0-9_]*)(?!\w)|\{(?P<name>[A-Za-z_][A-Za-z0-9_]*)(?::?-(?P<default>[^${}\\]*))?})"
+)
+
+
+def _normalize_legacy_env_defaults(value: str) -> str:
+    """
+    Rewrite legacy ${VAR:default} to ${VAR:-default} and warn once.
+    """
+    if not _LEGACY_ENV_DEFAULTS_RE.search(value):
+        return value
+
+    warnings.warn(
+        "Legacy ${VAR:default} syntax is deprecated; use ${VAR:-default}. "
+        "Support for the legacy form may be removed in a future release.",
+        DeprecationWarning,
+        stacklevel=3,
+    )
+
+    return _LEGACY_ENV_DEFAULTS_RE.sub(r"${\1:-\2}", value)
+
+
+class Template:
+    """
+    A string with placeholders, compiled into (literal, variable, default) parts.
+    """
+
+    __slots__ = ("fallback", "parts", "source", "tail")
+
+    def __init__(self, source: str) -> None:
+        """
+        Compile `source` (use `compile_template` to get a cached one).
+        """
+        self.source = source
+        self.parts: list[tuple[str, str, str | None]] = []
+        # escapes and other syntax are left to expandvars:
+        self.fallback = "\\" in source
+
+        position = 0
+        for match in _PLACEHOLDER_RE.finditer(source):
+            literal = source[position : match.start()]
+            self.fallback = self.fallback or "$" in literal
+            self.parts.append((literal, match["bare"] or match["name"], match["default"]))
+            position = match.end()
+
+        self.tail = source[position:]
+        self.fallback = self.fallback or "$" in self.tail
+
+    def render(self, env: T_env) -> str:
+        """
+        Fill in the variables from `env` (missing or empty ones are replaced by their default or an empty string).
+        """
+        if self.fallback:
+            from expandvars import expand
+
+            return typing.cast(str, expand(self.source, environ=env))
+
+        result = []
+        for literal, name, default in self.parts:
+            value = env.get(name)
+            result.append(literal)
+            if default is None:
+                result.append("" if value is None else value)
+            else:
+                result.append(value or default)
+        result.append(self.tail)
+
+        return "".join(result)
+
+
+# the value of a LazyEnv that was not expanded (yet):
+UNRESOLVED = typing.NewType("UNRESOLVED", object)  # SentinelObject
+
+
+class LazyEnv:
+    """
+    A config value with placeholders, that is only expanded when it is used (see `TypedConfig`'s lazy_env option).
+    """
+
+    __slots__ = ("convert_types", "strict", "template", "use_env", "value")
+
+    def __init__(self, template: Template, use_env: str, strict: bool = True, convert_types: bool = False) -> None:
+        """
+        Store the compiled template and the settings it was loaded with.
+        """
+        self.template = template
+        self.use_env = use_env
+        self.strict = strict
+        self.convert_types = convert_types
+        # the (type-checked) value after expanding, see TypedConfig:
+        self.value: typing.Any = UNRESOLVED
+
+    def __copy__(self) -> "LazyEnv":
+        """
+        A copy with its own memoised value (sharing the compiled template).
+        """
+        new = LazyEnv(self.template, self.use_env, self.strict, self.convert_types)
+        new.value = self.value
+        return new
+
+    def __deepcopy__(self, _: dict[int, typing.Any]) -> "LazyEnv":
+        """
+        Same as copy: the template is immutable and the (expanded) value a string or simple type.
+        """
+        return self.__copy__()
+
+    def render(self) -> str:
+        """
+        Expand the template with the current environment.
+        """
+        return self.template.render(case_insensitive_view(env_for(self.use_env) or {}))
+
+    def __repr__(self) -> str:
+        """
+        Show the template (and its value if it was expanded already).
+        """
+        value = "" if self.value is UNRESOLVED else f" -> {self.value!r}"
+        return f"<LazyEnv {self.template.source!r}{value}>"
+
+
+# compiled templates by their source:
+TEMPLATES: LRUCache[str, Template] = LRUCache(maxsize=4096)
+# case-insensitive views (see case_insensitive_env) by the items of the environment they are based on:
+ENV_VIEWS: LRUCache[tuple[tuple[str, typing.Any], ...], dict[str, typing.Any]] = LRUCache(maxsize=8)
+
+
+def compile_template(value: str) -> Template:
+    """
+    Get the (cached) compiled template for a string.
+    """
+    if (template := TEMPLATES.get(value)) is None:
+        template = Template(_normalize_legacy_env_defaults(value))
+        TEMPLATES.set(value, template)
+    return template
+
+
+def expand_string(value: str, env: T_env) -> str:
+    """
+    Replace the placeholders in a string with variables from env.
+    """
+    if "$" not in value:
+        return value
+    return compile_template(value).render(env)
+
+
+def case_insensitive_env(env: T_env) -> dict[str, typing.Any]:
+    """
+    Add upper and lower case variants of the keys in env (without overwriting existing keys).
+    """
+    env_case: dict[str, typing.Any] = dict(env)
+    for key, value in env.items():
+        upper = key.upper()
+        lower = key.lower()
+        if upper not in env_case:
+            env_case[upper] = value
+        if lower not in env_case:
+            env_case[lower] = value
+    return env_case
+
+
+def case_insensitive_view(env: T_env) -> dict[str, typing.Any]:
+    """
+    Cached version of `case_insensitive_env`, for when the same environment is used for many loads.
+
+    The result is shared, so it should not be modified.
+    """
+    fingerprint = tuple(env.items())
+    try:
+        view = ENV_VIEWS.get(fingerprint)
+    except TypeError:
+        # unhashable values, can't be cached
+        return case_insensitive_env(env)
+
+    if view is None:
+        view = case_insensitive_env(env)
+        ENV_VIEWS.set(fingerprint, view)
+    return view
+
+
+def _expand_dict(data: dict[str, typing.Any], env: T_env) -> None:
+    for key, value in data.items():
+        if isinstance(value, dict):
+            _expand_dict(value, env)
+        elif isinstance(value, str) and "$" in value:
+            data[key] = compile_template(value).render(env)
+        elif isinstance(value, list) and any(isinstance(item, str) and "$" in item for item in value):
+            data[key] = [expand_string(item, env) if isinstance(item, str) else item for item in value]
+
+
+def expand_values(data: dict[str, typing.Any], env: T_env, *, case_insensitive: bool = True) -> None:
+    """
+    Expand the placeholders in the strings of (nested) dicts and lists of strings, in place.
+
+    Args:
+        data: e.g. a loaded TOML document
+        env: the variables to use
+        case_insensitive: look up variables case-insensitively (see `case_insensitive_env`).
+            Use False if env is already a case-insensitive view.
+    """
+    if not data or not env:
+        return
+
+    if case_insensitive:
+        env = case_insensitive_view(env)
+
+    _expand_dict(data, env)
+
+
+def _dotenv_values(dotenv_path: str) -> dict[str, str | None]:
+    """
+    Parse a .env file with python-dotenv (imported when the first .env file is found).
+    """
+    from dotenv import dotenv_values as _parse
+
+    return _parse(dotenv_path=dotenv_path)
+
+
+# cwd -> (mtime of the cwd, the .env file that applies to it or None)
+DOTENV_PATHS: dict[str, tuple[int, str | None]] = {}
+# (path, (mtime, size, inode)) -> parsed .env file
+DOTENV_VALUES: LRUCache[tuple[str, tuple[int, int, int]], dict[str, str | None]] = LRUCache(maxsize=16)
+# use_env -> (os.environ it was made from, .env values it was made from, merged env)
+MERGED: dict[str, tuple[dict[typing.Any, typing.Any], dict[str, str | None], dict[str, typing.Any]]] = {}
+
+
+def _find_dotenv() -> str | None:
+    """
+    `find_dotenv(usecwd=True)`, cached per working directory.
+
+    The walk up from the cwd is repeated when a file is added to (or removed from) the cwd itself,
+    a new .env file in one of its parents is only noticed after `invalidate`.
+    """
+    cwd = os.getcwd()
+    mtime = os.stat(cwd).st_mtime_ns
+    cached = DOTENV_PATHS.get(cwd)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    from dotenv import find_dotenv
+
+    path = find_dotenv(usecwd=True) or None
+    DOTENV_PATHS[cwd] = (mtime, path)
+    return path
+
+
+def dotenv_values() -> dict[str, str | None]:
+    """
+    The values of the .env file in (a parent of) the cwd, parsed again only when the file changes.
+
+    The result is shared, so it should not be modified.
+    """
+    if not (path := _find_dotenv()):
+        return {}
+
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        DOTENV_PATHS.pop(os.getcwd(), None)
+        return {}
+
+    key = (path, (stat.st_mtime_ns, stat.st_size, stat.st_ino))
+    if (values := DOTENV_VALUES.get(key)) is None:
+        values = _dotenv_values(dotenv_path=path)
+        DOTENV_VALUES.set(key, values)
+    return values
+
+
+def _environ_data() -> typing.Mapping[typing.Any, typing.Any]:
+    """
+    The data behind os.environ, which is much cheaper to compare than a (decoded) copy.
+    """
+    return getattr(os.environ, "_data", os.environ)
+
+
+def env_for(use_env: str) -> dict[str, typing.Any] | None:
+    """
+    Get the variables to expand ${VAR} placeholders with, according to the env-setting (None for 'no').
+
+    The same dict is returned until os.environ or the .env file changes, so it should not be modified.
+    """
+    if use_env not in ("yes", "inverse", "dotenv", "environ"):
+        return None
+
+    dotenv = {} if use_env == "environ" else dotenv_values()
+    environ = _environ_data()
+    cached = MERGED.get(use_env)
+    if cached and cached[1] is dotenv and cached[0] == environ:
+        return cached[2]
+
+    env: dict[str, typing.Any]
+    match use_env:
+        case "yes":
+            env = dotenv | os.environ
+        case "inverse":
+            env = {**os.environ} | dotenv
+        case "dotenv":
+            env = dict(dotenv)
+        case _:
+            env = {**os.environ}
+
+    MERGED[use_env] = (dict(environ), dotenv, env)
+    return env
+
+
+def defer_values(
+    data: dict[str, typing.Any], use_env: str, strict: bool = True, convert_types: bool = False
+) -> dict[str, typing.Any]:
+    """
+    Like `expand_values`, but top-level strings with placeholders become LazyEnv values, expanded when they are used.
+
+    Nested values (e.g. for nested classes) are expanded right away (in place, like `expand_values`).
+    """
+    result: dict[str, typing.Any] = {}
+    nested: dict[str, typing.Any] = {}
+    for key, value in data.items():
+        if isinstance(value, str) and "$" in value:
+            value = LazyEnv(compile_template(value), use_env, strict, convert_types)
+        elif isinstance(value, (dict, list)):
+            nested[key] = value
+        result[key] = value
+
+    if nested and (env := env_for(use_env)):
+        expand_values(nested, env)
+        result |= nested
+
+    return result
+
+
+def invalidate() -> None:
+    """
+    Forget the cached .env files and environments (and compiled templates).
+
+    Changes to os.environ and the .env file are noticed automatically, so this is only required in edge cases,
+    e.g. when a .env file is added to a parent of the cwd or rewritten with the same size within the same mtime.
+    """
+    DOTENV_PATHS.clear()
+    DOTENV_VALUES.clear()
+    MERGED.clear()
+    ENV_VIEWS.clear()
+    TEMPLATES.clear()
@@ -6,16 +6,15 @@ import contextlib
 import dataclasses as dc
 import io
 import math
-import re
+import os
 import types
 import typing
-import warnings
 from collections import ChainMap
 from pathlib import Path
 
-from expandvars import expand
-from typeguard import TypeCheckError
-from typeguard import check_type as _check_type
+from .caching import ClassCache
+from .env import expand_string, expand_values
+from .validators import compile_validator
 
 try:
     import annotationlib
@@ -33,11 +32,47 @@ def camel_to_snake(s: str) -> str:
     return "".join([f"_{c.lower()}" if c.isupper() else c for c in s]).lstrip("_")
 
 
-# def find_pyproject_toml() -> typing.Optional[str]:
-#     """
-#     Find the project's config toml, looks up until it finds the project root (black's logic).
-#     """
-#     return black.files.find_pyproject_toml((os.getcwd(),))
+# start dir -> (mtimes of the directories that were searched, the pyproject.toml that applies to it or None)
+PYPROJECT_PATHS: dict[str, tuple[tuple[tuple[str, int], ...], Path | None]] = {}
+
+
+def _walk_to_pyproject_toml(start_dir: Path) -> tuple[Path | None, tuple[tuple[str, int], ...]]:
+    """
+    Look for pyproject.toml in start_dir and its parents.
+
+    Returns:
+        The found pyproject.toml (or None) and the mtime of every directory that was searched.
+    """
+    current_dir = start_dir
+    searched = []
+
+    while str(current_dir) != str(current_dir.root):
+        # stat before looking, so a file that is added in between is noticed next time:
+        searched.append((str(current_dir), _mtime(current_dir)))
+        pyproject_toml = current_dir / "pyproject.toml"
+        if pyproject_toml.is_file():
+            return pyproject_toml, tuple(searched)
+        current_dir = current_dir.parent
+
+    # If not found anywhere
+    return None, tuple(searched)
+
+
+def _mtime(directory: Path | str) -> int:
+    """
+    Get the mtime (in ns) of a directory, or -1 if it doesn't exist (so it's never seen as unchanged).
+    """
+    try:
+        return os.stat(directory).st_mtime_ns
+    except OSError:
+        return -1
+
+
+def _unchanged(searched: tuple[tuple[str, int], ...]) -> bool:
+    """
+    Check whether none of the searched directories changed since the walk.
+    """
+    return all(mtime != -1 and _mtime(directory) == mtime for directory, mtime in searched)
 
 
 def find_pyproject_toml(start_dir: typing.Optional[Path | str] = None) -> Path | None:
@@ -45,6 +80,10 @@ def find_pyproject_toml(start_dir: typing.Optional[Path | str] = None) -> Path |
     Search for pyproject.toml starting from the current working directory \
      and moving upwards in the directory tree.
 
+    The result is cached per start directory, together with the mtime of every directory that was searched
+    (up to and including the one with the pyproject.toml).
+    Adding or removing a pyproject.toml in any of those changes its mtime, so the walk is repeated.
+
     Args:
         start_dir: Starting directory to begin the search.
             If not provided, uses the current working directory.
@@ -52,18 +91,15 @@ def find_pyproject_toml(start_dir: typing.Optional[Path | str] = None) -> Path |
     Returns:
         Path or None: Path object to the found pyproject.toml file, or None if not found.
     """
-    start_dir = Path.cwd() if start_dir is None else Path(start_dir).resolve()
+    start = os.getcwd() if start_dir is None else os.path.abspath(start_dir)
 
-    current_dir = start_dir
+    cached = PYPROJECT_PATHS.get(start)
+    if cached and _unchanged(cached[0]):
+        return cached[1]
 
-    while str(current_dir) != str(current_dir.root):
-        pyproject_toml = current_dir / "pyproject.toml"
-        if pyproject_toml.is_file():
-            return pyproject_toml
-        current_dir = current_dir.parent
-
-    # If not found anywhere
-    return None
+    path, searched = _walk_to_pyproject_toml(Path.cwd() if start_dir is None else Path(start).resolve())
+    PYPROJECT_PATHS[start] = (searched, path)
+    return path
 
 
 Type = typing.Type[typing.Any]
@@ -108,17 +144,31 @@ def _all_annotations(cls: type) -> ChainMap[str, type]:
     return ChainMap(*(_cls_annotations(c) for c in getattr(cls, "__mro__", [])))
 
 
+def _resolve_annotations(cls: type) -> types.MappingProxyType[str, type]:
+    """
+    Flatten the ChainMap of `_all_annotations` to a read-only dict, with Annotated[T, ...] stripped to T.
+    """
+    return types.MappingProxyType({k: strip_annotated(v) for k, v in _all_annotations(cls).items()})
+
+
+# walking the mro and evaluating (string) annotations only happens once per class.
+# The cache is weakly keyed on the class, so a redefined class is resolved again.
+# Use ANNOTATIONS.invalidate(cls) after changing the annotations of an existing class (and its subclasses).
+ANNOTATIONS: ClassCache[types.MappingProxyType[str, type]] = ClassCache(_resolve_annotations)
+
+
 def all_annotations(cls: Type, _except: typing.Iterable[str] = None) -> dict[str, type[object]]:
     """
     Wrapper around `_all_annotations` that filters away any keys in _except.
 
     It also flattens the ChainMap to a regular dict.
     """
-    if _except is None:
-        _except = set()
+    _all = ANNOTATIONS.get(cls)
 
-    _all = _all_annotations(cls)
-    return {k: strip_annotated(v) for k, v in _all.items() if k not in _except}
+    if not _except:
+        return dict(_all)
+
+    return {k: v for k, v in _all.items() if k not in _except}
 
 
 T = typing.TypeVar("T")
@@ -128,13 +178,11 @@ def check_type(value: typing.Any, expected_type: typing.Type[T]) -> typing.TypeG
     """
     Given a variable, check if it matches 'expected_type' (which can be a Union, parameterized generic etc.).
 
-    Based on typeguard but this returns a boolean instead of returning the value or throwing a TypeCheckError
+    Based on typeguard but this returns a boolean instead of returning the value or throwing a TypeCheckError.
+    Common annotations (builtins, custom classes, list/dict, unions, Literal, Annotated) skip typeguard entirely,
+    see `validators.py`.
     """
-    try:
-        _check_type(value, expected_type)
-        return True
-    except TypeCheckError:
-        return False
+    return compile_validator(expected_type)(value)
 
 
 def is_builtin_type(_type: Type) -> bool:
@@ -280,26 +328,6 @@ def as_binaryio(file: str | Path | typing.BinaryIO | None, mode: typing.Literal[
     return file
 
 
-_LEGACY_ENV_DEFAULTS_RE = re.compile(r"\$\{([A-Za-z_][A-Za-z0-9_]*):([^\-?=+][^}]*)}")
-
-
-def _normalize_legacy_env_defaults(value: str) -> str:
-    """
-    Rewrite legacy ${VAR:default} to ${VAR:-default} and warn once.
-    """
-    if not _LEGACY_ENV_DEFAULTS_RE.search(value):
-        return value
-
-    warnings.warn(
-        "Legacy ${VAR:default} syntax is deprecated; use ${VAR:-default}. "
-        "Support for the legacy form may be removed in a future release.",
-        DeprecationWarning,
-        stacklevel=3,
-    )
-
-    return _LEGACY_ENV_DEFAULTS_RE.sub(r"${\1:-\2}", value)
-
-
 def expand_posix_vars(posix_expr: str, context: dict[str, str]) -> str:
     """
     Replace case-insensitive POSIX and Docker Compose-like environment variables in a string with their values.
@@ -311,8 +339,7 @@ def expand_posix_vars(posix_expr: str, context: dict[str, str]) -> str:
     Returns:
         str: The string with replaced variable values.
     """
-    posix_expr = _normalize_legacy_env_defaults(posix_expr)
-    return typing.cast(str, expand(posix_expr, environ=context))
+    return expand_string(posix_expr, context)
 
 
 def expand_env_vars_into_toml_values(
@@ -359,27 +386,4 @@ def expand_env_vars_into_toml_values(
         #     'key2': ['String with value_1', 'Another value_2']
         # }
     """
-    if not toml or not env:  # pragma: no cover
-        return
-
-    if case_insensitive:
-        env_case: dict[str, typing.Any] = dict(env)
-        for key, value in env.items():
-            upper = key.upper()
-            lower = key.lower()
-            if upper not in env_case:
-                env_case[upper] = value
-            if lower not in env_case:
-                env_case[lower] = value
-        env = env_case
-
-    for key, var in toml.items():
-        if isinstance(var, dict):
-            expand_env_vars_into_toml_values(var, env, case_insensitive=case_insensitive)
-        elif isinstance(var, list):
-            toml[key] = [expand_posix_vars(value, env) if isinstance(value, str) else value for value in var]
-        elif isinstance(var, str):
-            toml[key] = expand_posix_vars(var, env)
-        else:
-            # nothing to substitute
-            continue
+    expand_values(toml, env, case_insensitive=case_insensitive)
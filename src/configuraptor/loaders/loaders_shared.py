@@ -1,5 +1,7 @@
 """
 File loaders that work regardless of Python version.
+
+The libraries behind them are imported on first use, so only the formats that are actually loaded cost import time.
 """
 
 import configparser
@@ -8,11 +10,6 @@ from collections import defaultdict
 from pathlib import Path
 from typing import BinaryIO
 
-import pyjson5 as json_lib
-import tomli
-import yaml as yaml_lib
-from dotenv import dotenv_values
-
 from ._types import T_config, as_tconfig
 from .register import register_loader
 
@@ -22,6 +19,8 @@ def json(f: BinaryIO, _: typing.Optional[Path]) -> T_config:
     """
     Load a JSON file.
     """
+    import pyjson5 as json_lib
+
     data = json_lib.load(f)  # type: ignore
     return as_tconfig(data)
 
@@ -31,6 +30,8 @@ def yaml(f: BinaryIO, _: typing.Optional[Path]) -> typing.Any:
     """
     Load a YAML file.
     """
+    import yaml as yaml_lib
+
     return yaml_lib.load(f, yaml_lib.SafeLoader)
 
 
@@ -39,6 +40,8 @@ def toml(f: BinaryIO, _: typing.Optional[Path]) -> typing.Any:
     """
     Load a toml file.
     """
+    import tomli
+
     return tomli.load(f)
 
 
@@ -47,6 +50,8 @@ def dotenv(_: typing.Optional[BinaryIO], fullpath: Path) -> typing.Any:
     """
     Load a toml file.
     """
+    from dotenv import dotenv_values
+
     return dotenv_values(fullpath)
 
 
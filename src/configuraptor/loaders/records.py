@@ -0,0 +1,99 @@
+"""
+Record loaders: read files that contain many records (one config per record), one record at a time.
+
+Unlike regular loaders, which return one document, these yield the records lazily
+so memory usage doesn't depend on the amount of records in the file.
+"""
+
+import json
+import typing
+from pathlib import Path
+
+from .register import register_something
+
+T_stream = typing.BinaryIO | typing.TextIO
+T_record_loader = typing.Callable[[T_stream], typing.Iterator[typing.Any]]
+
+RECORD_LOADERS: dict[str, T_record_loader] = {}
+
+
+@typing.overload
+def register_record_loader(*extension_args: str) -> typing.Callable[[T_record_loader], T_record_loader]:
+    """
+    Overload for case with parens: @register_record_loader(".jsonl", ".ndjson").
+    """
+
+
+@typing.overload
+def register_record_loader(*extension_args: T_record_loader) -> T_record_loader:
+    """
+    Overload for case without parens: @register_record_loader (the function name is the extension).
+    """
+
+
+def register_record_loader(
+    *extension_args: str | T_record_loader,
+) -> T_record_loader | typing.Callable[[T_record_loader], T_record_loader]:
+    """
+    Register a record loader for a new filetype, like `register_loader`.
+
+    Used as a decorator on a function that takes an open file (binary, or text for e.g. stdin) and yields records.
+    """
+    return register_something(RECORD_LOADERS, *extension_args)
+
+
+@register_record_loader(".jsonl", ".ndjson")
+def jsonl(f: T_stream) -> typing.Iterator[typing.Any]:
+    """
+    Load a JSON Lines file: one JSON document per (non-empty) line.
+    """
+    for line in f:
+        if line.strip():
+            yield json.loads(line)
+
+
+@register_record_loader(".yaml", ".yml")
+def yaml_documents(f: T_stream) -> typing.Iterator[typing.Any]:
+    """
+    Load a multi-document YAML file: one record per `---` separated document (empty documents are skipped).
+    """
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    for document in yaml.load_all(f, loader):
+        if document is not None:
+            yield document
+
+
+def get_record_loader(extension: str) -> T_record_loader:
+    """
+    Get the right record loader for a specific extension.
+    """
+    extension = extension.removeprefix(".")
+    if loader := RECORD_LOADERS.get(extension):
+        return loader
+
+    raise ValueError(f"Invalid extension for records {extension}")
+
+
+def _read_file(loader: T_record_loader, path: Path) -> typing.Iterator[typing.Any]:
+    with path.open("rb") as f:
+        yield from loader(f)
+
+
+def iter_records(source: str | Path | T_stream, extension: str | None = None) -> typing.Iterator[typing.Any]:
+    """
+    Yield the records from a file path or an already opened stream, one at a time.
+
+    The extension is taken from the path (or the `name` of the stream) if it isn't passed explicitly.
+    An unknown extension raises a ValueError right away (not when the first record is requested).
+    """
+    if isinstance(source, (str, Path)):
+        path = Path(source)
+        return _read_file(get_record_loader(extension or path.suffix), path)
+
+    loader = get_record_loader(extension or Path(str(getattr(source, "name", ""))).suffix)
+    return loader(source)
+
+
+__all__ = ["RECORD_LOADERS", "iter_records", "jsonl", "register_record_loader", "yaml_documents"]
@@ -0,0 +1,320 @@
+"""
+Streaming (event based) loaders that only materialize one (nested) key of a huge JSON or YAML document.
+
+The rest of the document is skipped while reading it, so memory usage depends on the size of the selected section
+instead of the size of the whole file.
+"""
+
+import json
+import re
+import typing
+from pathlib import Path
+from typing import BinaryIO
+
+from . import get
+from .loaders_shared import json as json_loader
+from .loaders_shared import yaml as yaml_loader
+from .register import T_loader
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import yaml
+
+MISSING = typing.NewType("MISSING", object)  # SentinelObject, returned if the key path doesn't exist
+
+T_streamer = typing.Callable[[BinaryIO, list[str]], typing.Any]
+
+CHUNK_SIZE = 1 << 20
+
+_WHITESPACE = re.compile(rb"[ \t\r\n]*")
+# rest of a string after the opening quote (unrolled, so long strings don't cause deep backtracking):
+_STRING_END = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_STRING = rb'"[^"\\]*(?:\\.[^"\\]*)*"'
+_FLAT = rb'[^\[\]{}"]*(?:' + _STRING + rb'[^\[\]{}"]*)*'
+_NESTED = rb'[^\[\]{}"]*(?:(?:' + _STRING + rb"|\{" + _FLAT + rb"\}|\[" + _FLAT + rb'\])[^\[\]{}"]*)*'
+# complete strings and small containers (up to two levels deep) are skipped as one token;
+# a lone quote is the start of a string that continues in the next chunk:
+_TOKEN = re.compile(rb"\{" + _NESTED + rb"\}|\[" + _NESTED + rb"\]|" + _STRING + rb'|[\[\]{}"]', re.DOTALL)
+_SCALAR_END = re.compile(rb"[,}\]\s]")
+
+_QUOTE, _COLON, _COMMA = ord('"'), ord(":"), ord(",")
+_OPEN_OBJECT, _CLOSE_OBJECT = ord("{"), ord("}")
+_OPEN_ARRAY = ord("[")
+
+
+class _JsonStream:
+    """
+    Minimal incremental JSON tokenizer that can skip values without parsing them.
+    """
+
+    def __init__(self, f: BinaryIO, chunk_size: int = CHUNK_SIZE) -> None:
+        """
+        Read from `f` in chunks of `chunk_size` bytes.
+        """
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buffer = b""
+        self.pos = 0
+        # while capturing a value, the parts of it that are dropped from the buffer are stored here:
+        self.captured: list[bytes] | None = None
+        self.capture_start = 0
+
+    def _more(self) -> None:
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            raise ValueError("Unexpected end of JSON document.")
+
+        if self.captured is not None:
+            self.captured.append(self.buffer[self.capture_start : self.pos])
+            self.capture_start = 0
+
+        self.buffer = self.buffer[self.pos :] + chunk
+        self.pos = 0
+
+    def peek(self) -> int:
+        """
+        Get the next non-whitespace byte (without consuming it).
+        """
+        while True:
+            match = _WHITESPACE.match(self.buffer, self.pos)
+            self.pos = match.end() if match else self.pos
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            self._more()
+
+    def expect(self, char: int) -> None:
+        """
+        Consume the next non-whitespace byte, which must be `char`.
+        """
+        if (found := self.peek()) != char:
+            raise ValueError(f"Expected {chr(char)!r} but found {chr(found)!r} in JSON document.")
+        self.pos += 1
+
+    def _skip_string(self) -> None:
+        # pos is just after the opening quote
+        while not (match := _STRING_END.match(self.buffer, self.pos)):
+            self._more()
+        self.pos = match.end()
+
+    def _skip_container(self) -> None:
+        # pos is just after the opening { or [
+        depth = 1
+        while True:
+            for match in _TOKEN.finditer(self.buffer, self.pos):
+                start, end = match.span()
+                char = self.buffer[start]
+                if end - start > 1:
+                    continue  # complete string or flat container
+                if char == _QUOTE:
+                    self.pos = start
+                    break
+                depth += 1 if char in (_OPEN_OBJECT, _OPEN_ARRAY) else -1
+                if not depth:
+                    self.pos = end
+                    return
+            else:
+                self.pos = len(self.buffer)
+            self._more()
+
+    def skip_value(self) -> None:
+        """
+        Consume the next value (of any type) without parsing it.
+        """
+        char = self.peek()
+        self.pos += 1
+        if char == _QUOTE:
+            self._skip_string()
+        elif char in (_OPEN_OBJECT, _OPEN_ARRAY):
+            self._skip_container()
+        else:
+            # number, true, false, null
+            while not (match := _SCALAR_END.search(self.buffer, self.pos)):
+                self._more()
+            self.pos = match.start()
+
+    def read_key(self) -> str:
+        """
+        Consume an object key (and the colon after it).
+        """
+        self.expect(_QUOTE)
+        start = self.pos - 1
+        self.captured, self.capture_start = [], start
+        self._skip_string()
+        key = typing.cast(str, json.loads(self._end_capture()))
+        self.expect(_COLON)
+        return key
+
+    def read_value(self) -> typing.Any:
+        """
+        Parse the next value.
+        """
+        self.peek()
+        self.captured, self.capture_start = [], self.pos
+        self.skip_value()
+        return json.loads(self._end_capture())
+
+    def _end_capture(self) -> bytes:
+        captured = typing.cast(list[bytes], self.captured)
+        captured.append(self.buffer[self.capture_start : self.pos])
+        self.captured = None
+        return b"".join(captured)
+
+    def next_item(self) -> bool:
+        """
+        After a value in an object: is there another key?
+        """
+        char = self.peek()
+        self.pos += 1
+        if char == _COMMA:
+            return True
+        if char == _CLOSE_OBJECT:
+            return False
+        raise ValueError(f"Expected ',' or '}}' but found {chr(char)!r} in JSON document.")
+
+
+def stream_json(f: BinaryIO, path: list[str], chunk_size: int = CHUNK_SIZE) -> typing.Any:
+    """
+    Get the value at `path` (e.g. ['services', 'api']) from a JSON document, skipping everything else.
+    """
+    stream = _JsonStream(f, chunk_size)
+    for idx, part in enumerate(path):
+        stream.expect(_OPEN_OBJECT)
+        if stream.peek() == _CLOSE_OBJECT:
+            return MISSING
+
+        while stream.read_key() != part:
+            stream.skip_value()
+            if not stream.next_item():
+                return MISSING
+
+        if idx == len(path) - 1:
+            return stream.read_value()
+
+        if stream.peek() != _OPEN_OBJECT:
+            return MISSING
+
+    return MISSING  # pragma: no cover
+
+
+def _node_events(events: typing.Iterator["yaml.Event"], first: "yaml.Event") -> typing.Iterator["yaml.Event"]:
+    """
+    Yield the events of one node (scalar, alias or a complete mapping/sequence), starting with `first`.
+    """
+    import yaml
+
+    yield first
+    if not isinstance(first, yaml.CollectionStartEvent):
+        return
+
+    depth = 1
+    for event in events:
+        yield event
+        if isinstance(event, yaml.CollectionStartEvent):
+            depth += 1
+        elif isinstance(event, yaml.CollectionEndEvent):
+            depth -= 1
+            if not depth:
+                return
+
+
+def _skip_node(events: typing.Iterator["yaml.Event"], first: "yaml.Event") -> None:
+    for _ in _node_events(events, first):
+        pass
+
+
+def stream_yaml(f: BinaryIO, path: list[str]) -> typing.Any:
+    """
+    Get the value at `path` (e.g. ['services', 'api']) from the first YAML document, skipping everything else.
+
+    Only the events of the selected node are kept; they are composed into python objects with the SafeLoader.
+    """
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    events = yaml.parse(f, Loader=loader)
+
+    for event in events:
+        if isinstance(event, yaml.DocumentStartEvent):
+            break
+
+    for idx, part in enumerate(path):
+        if not isinstance(next(events), yaml.MappingStartEvent):
+            return MISSING
+
+        while True:
+            event = next(events)
+            if isinstance(event, yaml.MappingEndEvent):
+                return MISSING
+
+            if isinstance(event, yaml.ScalarEvent) and event.value == part:
+                break
+
+            # skip the key (can be complex) and its value:
+            _skip_node(events, event)
+            _skip_node(events, next(events))
+
+        if idx == len(path) - 1:
+            node = list(_node_events(events, next(events)))
+            document = [
+                yaml.StreamStartEvent(),
+                yaml.DocumentStartEvent(explicit=False),
+                *node,
+                yaml.DocumentEndEvent(explicit=False),
+                yaml.StreamEndEvent(),
+            ]
+            return yaml.load(yaml.emit(document), loader)
+
+    return MISSING  # pragma: no cover
+
+
+class Streaming:
+    """
+    Settings for streaming: which files are streamed and with which streamer.
+    """
+
+    def __init__(self, min_size: int | None = None) -> None:
+        """
+        Files of at least `min_size` bytes are streamed when a key is selected; None disables streaming.
+        """
+        self.min_size = min_size
+        # streamers for the builtin loaders (a custom loader for .json is not replaced):
+        self.streamers: dict[T_loader, T_streamer] = {json_loader: stream_json, yaml_loader: stream_yaml}
+
+    def select(self, path: Path, key: str) -> dict[str, typing.Any] | None:
+        """
+        Stream the section `key` (e.g. 'services.api') of a file, if streaming applies to it.
+
+        The result contains only the selected section, at its original (nested) position:
+        {"services": {"api": {...}}}.
+        None is returned when streaming doesn't apply (or fails) or the section is not a non-empty dict,
+        so the whole file can be parsed instead.
+        """
+        if self.min_size is None or not key:
+            return None
+
+        streamer = self.streamers.get(get(path.suffix or path.name, None))  # type: ignore
+        if not streamer:
+            return None
+
+        parts = key.split(".")
+        try:
+            if path.stat().st_size < self.min_size:
+                return None
+
+            with path.open("rb") as f:
+                value = streamer(f, parts)
+        except Exception:
+            # e.g. json5 syntax or yaml aliases to outside of the section: parse the whole document instead.
+            return None
+
+        if value is MISSING or not isinstance(value, dict) or not value:
+            # e.g. a scalar or empty section: load_data falls back to key="", which needs the whole document.
+            return None
+
+        for part in reversed(parts):
+            value = {part: value}
+
+        return typing.cast(dict[str, typing.Any], value)
+
+
+# e.g. STREAMING.min_size = 50 * 1024 * 1024 to stream files of 50MB and larger
+STREAMING = Streaming()
@@ -0,0 +1,126 @@
+"""
+Structural diffing and patching of config instances.
+
+A patch is a flat dict of (dotted, for nested configs) keys that changed: {'nested.key': 'new value'}.
+Applying a patch creates a new config that shares every untouched (nested) value with the original,
+so deriving a config from another one costs O(changed keys) instead of a deepcopy of everything.
+"""
+
+import copy
+import typing
+from typing import Any
+
+from .cls import TypedConfig
+from .errors import ConfigErrorExtraKey
+from .helpers import ANNOTATIONS
+from .persistent import PersistentTypedMapping
+
+C = typing.TypeVar("C", bound=Any)
+
+T_patch = dict[str, Any]
+
+DELETED = typing.NewType("DELETED", object)  # SentinelObject, used as value for keys that were removed
+
+
+def _is_config(value: Any) -> bool:
+    """
+    Values that are diffed/patched recursively instead of being replaced as a whole.
+    """
+    if isinstance(value, TypedConfig):
+        return True
+    # other (nested) classes loaded by load_into:
+    return hasattr(value, "__dict__") and not isinstance(value, type) and bool(ANNOTATIONS.get(type(value)))
+
+
+def _diff(old: Any, new: Any, prefix: str, patch: T_patch) -> None:
+    """
+    Add the differences between the values of two instances to `patch`.
+    """
+    old_values: typing.Mapping[str, Any]
+    new_values: typing.Mapping[str, Any]
+    if isinstance(old, PersistentTypedMapping) and isinstance(new, PersistentTypedMapping):
+        # skip the parts of the trie both share:
+        old_values, new_values = old._data, new._data
+        keys: typing.Iterable[str] = old._data.changed_keys(new._data)
+    else:
+        old_values, new_values = old.__dict__, new.__dict__
+        keys = [*new_values, *(old_values.keys() - new_values.keys())]
+
+    for key in keys:
+        old_value = old_values.get(key, DELETED)
+        new_value = new_values.get(key, DELETED)
+        if old_value is new_value:
+            # shared (e.g. by apply_patch or |), so nothing changed in this subtree
+            continue
+
+        if new_value is not DELETED and type(old_value) is type(new_value) and _is_config(new_value):
+            _diff(old_value, new_value, f"{prefix}{key}.", patch)
+        elif old_value != new_value:
+            patch[f"{prefix}{key}"] = new_value
+
+
+def diff(old: C, new: C) -> T_patch:
+    """
+    Find the changes required to turn `old` into `new`.
+
+    Nested configs are compared recursively (and skipped if they are the same object).
+
+    Example:
+        diff(config, config | {"key": "value"}) -> {"key": "value"}
+        diff(config, other) -> {"nested.key": "new value", "removed": DELETED}
+    """
+    patch: T_patch = {}
+    _diff(old, new, "", patch)
+    return patch
+
+
+def apply_patch(config: C, patch: T_patch, _strict: bool = True, _convert_types: bool = False) -> C:
+    """
+    Create a new config with `patch` (see `diff`) applied, sharing all untouched values with `config`.
+
+    The original config is not modified. Only the changed keys are type checked.
+
+    Args:
+        config: instance to start from.
+        patch: {key: new value}, where key can be a dotted path to a nested config and value can be DELETED.
+        _strict: check the types of the new values?
+        _convert_types: try to convert the new values to the annotated type if required?
+    """
+    values: dict[str, Any] = {}
+    nested: dict[str, T_patch] = {}
+    for path, value in patch.items():
+        key, _, rest = path.partition(".")
+        if rest:
+            nested.setdefault(key, {})[rest] = value
+        else:
+            values[key] = value
+
+    for key, sub_patch in nested.items():
+        target = values[key] if key in values else getattr(config, key, DELETED)
+        if not _is_config(target):
+            sub_key, value = next(iter(sub_patch.items()))
+            raise ConfigErrorExtraKey(cls=config.__class__, key=f"{key}.{sub_key}", value=value)
+
+        values[key] = apply_patch(target, sub_patch, _strict=_strict, _convert_types=_convert_types)
+
+    deleted = [key for key, value in values.items() if value is DELETED]
+    for key in deleted:
+        del values[key]
+
+    if isinstance(config, PersistentTypedMapping):
+        return config._evolve(
+            _strict=_strict, _allow_none=True, _convert_types=_convert_types, _delete=deleted, **values
+        )
+
+    # shallow copy: (nested) values are shared, which is safe because changed ones are replaced, not modified.
+    result = copy.copy(config)
+    for key in deleted:
+        result.__dict__.pop(key, None)
+
+    if isinstance(result, TypedConfig):
+        # not result._update, so new instances of immutable configs (TypedMapping) can be derived too:
+        TypedConfig._update(result, _strict=_strict, _allow_none=True, _convert_types=_convert_types, **values)
+    else:
+        result.__dict__.update(values)
+
+    return result
@@ -0,0 +1,575 @@
+"""
+Persistent (immutable, structurally shared) storage for configs.
+
+`PersistentMap` is a hash array mapped trie (HAMT): 'changing' it returns a new map that shares every untouched node
+with the original, so deriving a map costs O(log n) time and memory instead of O(n) for a copied dict.
+`PersistentTypedMapping` is a `TypedMapping` that stores its values in a `PersistentMap`.
+"""
+
+import copy
+import typing
+from collections.abc import Mapping
+from typing import Any, Iterator, Never, Self
+
+from .alias import Alias, has_aliases
+from .cls import NO_ANNOTATION, K, TypedMappingAbstract, V
+from .core import check_and_convert_type
+from .errors import ConfigErrorExtraKey, ConfigErrorImmutable
+from .helpers import ANNOTATIONS, is_optional
+from .loaders.loaders_shared import _convert_key
+
+KT = typing.TypeVar("KT")
+VT = typing.TypeVar("VT")
+
+_BITS = 5
+_MASK = (1 << _BITS) - 1
+_HASH_BITS = 64
+_HASH_MASK = (1 << _HASH_BITS) - 1
+
+_MISSING = typing.NewType("_MISSING", object)  # SentinelObject
+
+
+class _Leaf:
+    """
+    One key-value pair in the trie.
+    """
+
+    __slots__ = ("hash", "key", "value")
+
+    def __init__(self, _hash: int, key: Any, value: Any) -> None:
+        """
+        Leaves are immutable after creation.
+        """
+        self.hash = _hash
+        self.key = key
+        self.value = value
+
+
+class _Collision:
+    """
+    Leaves with the exact same (64 bit) hash.
+    """
+
+    __slots__ = ("hash", "leaves")
+
+    def __init__(self, _hash: int, leaves: tuple[_Leaf, ...]) -> None:
+        """
+        Collisions are immutable after creation.
+        """
+        self.hash = _hash
+        self.leaves = leaves
+
+    def find(self, _hash: int, _shift: int, key: Any) -> Any:
+        """
+        Get the value for key or _MISSING.
+        """
+        for leaf in self.leaves:
+            if leaf.key is key or leaf.key == key:
+                return leaf.value
+        return _MISSING
+
+    def assoc(self, leaf: _Leaf, _shift: int) -> tuple["_Collision", bool]:
+        """
+        Return a collision node with `leaf` added (or replaced), and whether the amount of items grew.
+        """
+        for idx, existing in enumerate(self.leaves):
+            if existing.key is leaf.key or existing.key == leaf.key:
+                return _Collision(self.hash, (*self.leaves[:idx], leaf, *self.leaves[idx + 1 :])), False
+        return _Collision(self.hash, (*self.leaves, leaf)), True
+
+    def without(self, _hash: int, _shift: int, key: Any) -> "_Collision | _Leaf | None":
+        """
+        Return this node without `key` (self if it's not in here).
+        """
+        leaves = tuple(leaf for leaf in self.leaves if not (leaf.key is key or leaf.key == key))
+        if len(leaves) == len(self.leaves):
+            return self
+        if len(leaves) == 1:
+            return leaves[0]
+        return _Collision(self.hash, leaves)
+
+    def __iter__(self) -> Iterator[_Leaf]:
+        """
+        Loop over the leaves.
+        """
+        return iter(self.leaves)
+
+
+def _bit(_hash: int, shift: int) -> int:
+    return 1 << ((_hash >> shift) & _MASK)
+
+
+def _pair(first: _Leaf, second: _Leaf, shift: int) -> "_Node | _Collision":
+    """
+    Create the smallest (sub)trie containing two leaves with a different key.
+    """
+    if shift >= _HASH_BITS:
+        return _Collision(first.hash, (first, second))
+
+    first_bit, second_bit = _bit(first.hash, shift), _bit(second.hash, shift)
+    if first_bit == second_bit:
+        return _Node(first_bit, (_pair(first, second, shift + _BITS),))
+
+    children = (first, second) if first_bit < second_bit else (second, first)
+    return _Node(first_bit | second_bit, children)
+
+
+class _Node:
+    """
+    Bitmap indexed node: `bitmap` marks which of the 32 possible children exist, `children` stores only those.
+    """
+
+    __slots__ = ("bitmap", "children")
+
+    def __init__(self, bitmap: int, children: tuple[Any, ...]) -> None:
+        """
+        Nodes are immutable after creation.
+        """
+        self.bitmap = bitmap
+        self.children = children
+
+    def _index(self, bit: int) -> int:
+        return (self.bitmap & (bit - 1)).bit_count()
+
+    def find(self, _hash: int, shift: int, key: Any) -> Any:
+        """
+        Get the value for key or _MISSING.
+        """
+        bit = _bit(_hash, shift)
+        if not self.bitmap & bit:
+            return _MISSING
+
+        child = self.children[self._index(bit)]
+        if isinstance(child, _Leaf):
+            if child.hash == _hash and (child.key is key or child.key == key):
+                return child.value
+            return _MISSING
+
+        return child.find(_hash, shift + _BITS, key)
+
+    def _replace(self, idx: int, child: Any) -> "_Node":
+        return _Node(self.bitmap, (*self.children[:idx], child, *self.children[idx + 1 :]))
+
+    def assoc(self, leaf: _Leaf, shift: int) -> tuple["_Node", bool]:
+        """
+        Return a node with `leaf` added (or replaced), and whether the amount of items grew.
+        """
+        bit = _bit(leaf.hash, shift)
+        idx = self._index(bit)
+
+        if not self.bitmap & bit:
+            return _Node(self.bitmap | bit, (*self.children[:idx], leaf, *self.children[idx:])), True
+
+        child = self.children[idx]
+        if isinstance(child, _Leaf):
+            if child.hash == leaf.hash and (child.key is leaf.key or child.key == leaf.key):
+                if child.value is leaf.value:
+                    return self, False
+                return self._replace(idx, leaf), False
+
+            return self._replace(idx, _pair(child, leaf, shift + _BITS)), True
+
+        new_child, added = child.assoc(leaf, shift + _BITS)
+        if new_child is child:
+            return self, False
+        return self._replace(idx, new_child), added
+
+    def without(self, _hash: int, shift: int, key: Any) -> "_Node | _Leaf | None":
+        """
+        Return this node without `key` (self if it's not in here, a leaf or None if only that is left).
+        """
+        bit = _bit(_hash, shift)
+        if not self.bitmap & bit:
+            return self
+
+        idx = self._index(bit)
+        child = self.children[idx]
+        if isinstance(child, _Leaf):
+            if not (child.hash == _hash and (child.key is key or child.key == key)):
+                return self
+            new_child = None
+        else:
+            new_child = child.without(_hash, shift + _BITS, key)
+            if new_child is child:
+                return self
+
+        if new_child is None:
+            children = (*self.children[:idx], *self.children[idx + 1 :])
+            if not children:
+                return None
+            if len(children) == 1 and isinstance(children[0], _Leaf):
+                # collapse, so the parent can store the leaf directly
+                return children[0]
+            return _Node(self.bitmap ^ bit, children)
+
+        if isinstance(new_child, _Leaf) and len(self.children) == 1:
+            return new_child
+
+        return self._replace(idx, new_child)
+
+    def __iter__(self) -> Iterator[_Leaf]:
+        """
+        Loop over all leaves in this subtrie.
+        """
+        for child in self.children:
+            if isinstance(child, _Leaf):
+                yield child
+            else:
+                yield from child
+
+
+_EMPTY = _Node(0, ())
+
+
+def _changed_keys(first: Any, second: Any) -> Iterator[Any]:
+    """
+    Keys of two (sub)tries that are not shared by both (see `PersistentMap.changed_keys`).
+    """
+    if first is second:
+        return
+
+    if isinstance(first, _Node) and isinstance(second, _Node):
+        for bit in (1 << idx for idx in range(1 << _BITS)):
+            in_first, in_second = first.bitmap & bit, second.bitmap & bit
+            yield from _changed_keys(
+                first.children[first._index(bit)] if in_first else None,
+                second.children[second._index(bit)] if in_second else None,
+            )
+        return
+
+    seen = set()
+    for node in (first, second):
+        if node is None:
+            continue
+        for leaf in node if not isinstance(node, _Leaf) else (node,):
+            if leaf.key not in seen:
+                seen.add(leaf.key)
+                yield leaf.key
+
+
+class PersistentMap(Mapping[KT, VT]):
+    """
+    Immutable mapping where `set`, `delete` and `update` return a new map that shares unchanged nodes.
+
+    Example:
+        first = PersistentMap({"a": 1})
+        second = first.set("b", 2)  # first is unchanged
+    """
+
+    __slots__ = ("_count", "_root")
+
+    _root: _Node
+    _count: int
+
+    def __init__(self, items: typing.Mapping[KT, VT] | typing.Iterable[tuple[KT, VT]] = ()) -> None:
+        """
+        Create a map from a dict or (key, value) pairs.
+        """
+        root, count = _EMPTY, 0
+        pairs = items.items() if isinstance(items, typing.Mapping) else items
+        for key, value in pairs:
+            root, added = root.assoc(_Leaf(hash(key) & _HASH_MASK, key, value), 0)
+            count += added
+
+        self._root = root
+        self._count = count
+
+    @classmethod
+    def _create(cls, root: _Node, count: int) -> Self:
+        new = cls.__new__(cls)
+        new._root = root
+        new._count = count
+        return new
+
+    def __getitem__(self, key: KT) -> VT:
+        """
+        Get a value by key (O(log n)).
+        """
+        value = self._root.find(hash(key) & _HASH_MASK, 0, key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return typing.cast(VT, value)
+
+    def __len__(self) -> int:
+        """
+        Amount of items.
+        """
+        return self._count
+
+    def __iter__(self) -> Iterator[KT]:
+        """
+        Loop over the keys (in no particular order).
+        """
+        return (leaf.key for leaf in self._root)
+
+    def items(self) -> Iterator[tuple[KT, VT]]:  # type: ignore
+        """
+        Loop over (key, value) pairs without looking each key up again.
+        """
+        return ((leaf.key, leaf.value) for leaf in self._root)
+
+    def __eq__(self, other: Any) -> bool:
+        """
+        Maps with shared roots are equal without comparing the items.
+        """
+        if isinstance(other, PersistentMap) and other._root is self._root:
+            return True
+        return super().__eq__(other)
+
+    def set(self, key: KT, value: VT) -> "PersistentMap[KT, VT]":
+        """
+        New map with `key` set to `value`.
+        """
+        root, added = self._root.assoc(_Leaf(hash(key) & _HASH_MASK, key, value), 0)
+        if root is self._root:
+            return self
+        return self._create(root, self._count + added)
+
+    def delete(self, key: KT) -> "PersistentMap[KT, VT]":
+        """
+        New map without `key` (KeyError if it doesn't exist).
+        """
+        root = self._root.without(hash(key) & _HASH_MASK, 0, key)
+        if root is self._root:
+            raise KeyError(key)
+
+        if root is None:
+            root = _EMPTY
+        elif isinstance(root, _Leaf):
+            root = _Node(_bit(root.hash, 0), (root,))
+
+        return self._create(root, self._count - 1)
+
+    def update(self, items: typing.Mapping[KT, VT] | typing.Iterable[tuple[KT, VT]] = ()) -> "PersistentMap[KT, VT]":
+        """
+        New map with all `items` set.
+        """
+        root, count = self._root, self._count
+        pairs = items.items() if isinstance(items, typing.Mapping) else items
+        for key, value in pairs:
+            root, added = root.assoc(_Leaf(hash(key) & _HASH_MASK, key, value), 0)
+            count += added
+
+        if root is self._root:
+            return self
+        return self._create(root, count)
+
+    def changed_keys(self, other: "PersistentMap[KT, VT]") -> Iterator[KT]:
+        """
+        Keys that might have a different value in `other`, skipping the (shared) nodes both maps have in common.
+
+        Cheap for maps derived from each other: O(changes * log n) instead of comparing every item.
+        """
+        return _changed_keys(self._root, other._root)
+
+    def __repr__(self) -> str:
+        """
+        Show the items like a dict.
+        """
+        return f"{self.__class__.__name__}({dict(self.items())})"
+
+
+class _Fields(dict[str, Any]):
+    """
+    Dict version of a PersistentTypedMapping's values (for `asdict`, `load_into` etc.).
+
+    Loading writes into `inst.__dict__`, so changes are passed on to the owner's PersistentMap.
+    """
+
+    __slots__ = ("_owner",)
+
+    def __init__(self, owner: "PersistentTypedMapping[Any, Any]") -> None:
+        """
+        Materialize the values of `owner`.
+        """
+        super().__init__(owner._data.items())
+        self._owner = owner
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        """
+        dict.update + update the owner.
+        """
+        values = dict(*args, **kwargs)
+        super().update(values)
+        object.__setattr__(self._owner, "_data", self._owner._data.update(values))
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        """
+        dict[key] = value + update the owner.
+        """
+        super().__setitem__(key, value)
+        object.__setattr__(self._owner, "_data", self._owner._data.set(key, value))
+
+    def __delitem__(self, key: str) -> None:
+        """
+        del dict[key] + update the owner.
+        """
+        super().__delitem__(key)
+        object.__setattr__(self._owner, "_data", self._owner._data.delete(key))
+
+
+class PersistentTypedMapping(TypedMappingAbstract[K, V]):
+    """
+    Immutable TypedMapping that stores its values in a PersistentMap (hash array mapped trie).
+
+    Derived configs (`config | {...}`, `apply_patch`) share all unchanged values and trie nodes with the original,
+    which makes them O(log n) per changed key instead of O(n), e.g. for cheap per-request overrides.
+
+    Note: this can't be used as a singleton!
+    """
+
+    # the values are stored in `self._data` (a PersistentMap), which isn't annotated as that would make it a config key.
+
+    def __getattribute__(self, key: str) -> Any:
+        """
+        Public attributes are looked up in the PersistentMap first (before class-level defaults).
+        """
+        if not key.startswith("_"):
+            try:
+                return object.__getattribute__(self, "_data")[key]
+            except (KeyError, AttributeError):
+                pass
+        return object.__getattribute__(self, key)
+
+    @property
+    def __dict__(self) -> dict[str, Any]:  # type: ignore
+        """
+        The values as a (cached) dict, for compatibility with code that reads `inst.__dict__` (e.g. asdict).
+
+        Prefer the Mapping methods (config[key], len(config), iter(config)), which don't have to build this dict.
+        """
+        try:
+            return typing.cast(_Fields, object.__getattribute__(self, "_fields"))
+        except AttributeError:
+            # instances are immutable, so this only has to be built once
+            fields = _Fields(self)
+            object.__setattr__(self, "_fields", fields)
+            return fields
+
+    def __getattr__(self, key: str) -> Any:
+        """
+        Only called if normal lookup fails: a fresh instance (e.g. before `load_into` fills it) gets an empty map.
+        """
+        if key != "_data":
+            raise AttributeError(key)
+
+        data: PersistentMap[str, Any] = PersistentMap()
+        object.__setattr__(self, "_data", data)
+        return data
+
+    def __getitem__(self, key: K) -> V:
+        """
+        Dict-notation to get attribute.
+        """
+        return typing.cast(V, self._data[typing.cast(str, key)])
+
+    def __len__(self) -> int:
+        """
+        Required for Mapping.
+        """
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[K]:
+        """
+        Required for Mapping.
+        """
+        return typing.cast(Iterator[K], iter(self._data))
+
+    def __eq__(self, other: Any) -> bool:
+        """
+        Two instances are equal if they are of the same type and have equal values.
+        """
+        if self is other:
+            return True
+        if type(self) is not type(other):
+            return False
+        return bool(self._data == other._data)
+
+    def _update(self, *_: Any, **__: Any) -> Never:
+        raise ConfigErrorImmutable(self.__class__)
+
+    def _evolve(
+        self,
+        _strict: bool = True,
+        _allow_none: bool = False,
+        _convert_types: bool = False,
+        _delete: typing.Iterable[str] = (),
+        **values: Any,
+    ) -> Self:
+        """
+        Create a new instance with `values` changed (and the keys in `_delete` removed).
+
+        Only the changed values are checked (like `_update`); everything else is shared with this instance.
+        """
+        cls = self.__class__
+        annotations = ANNOTATIONS.get(cls)
+        changes: dict[str, Any] = {}
+
+        for key, value in values.items():
+            key = _convert_key(key)
+            annotation = annotations.get(key, NO_ANNOTATION)
+
+            if value is None and not is_optional(annotation) and not _allow_none:
+                continue
+
+            if _strict and annotation is NO_ANNOTATION:
+                raise ConfigErrorExtraKey(cls=cls, key=key, value=value)
+
+            if _strict and not (value is None and _allow_none):
+                value = check_and_convert_type(value, annotation, convert_types=_convert_types, key=key)
+
+            changes[key] = value
+
+            prop = vars(cls).get(key)
+            if isinstance(prop, Alias):
+                changes[prop.to] = value
+            else:
+                for alias in has_aliases(cls, key):
+                    changes[alias] = value
+
+        data = self._data.update(changes)
+        for key in _delete:
+            if key in data:
+                data = data.delete(key)
+
+        new = copy.copy(self)
+        object.__setattr__(new, "_data", data)
+        return new
+
+    def __or__(self, other: dict[str, Any]) -> Self:
+        """
+        Returns a new instance with `other` (and optionally settings starting with _) applied, sharing everything else.
+        """
+        return self._evolve(**other)
+
+    def _clone(self) -> Self:
+        return copy.copy(self)
+
+    def __copy__(self) -> Self:
+        """
+        The values are immutable, so a copy can share all of them.
+        """
+        new = self.__class__.__new__(self.__class__)
+        object.__setattr__(new, "_data", self._data)
+        return new
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Self:
+        """
+        Deep copy the values (e.g. mutable lists).
+        """
+        new = self.__class__.__new__(self.__class__)
+        object.__setattr__(new, "_data", PersistentMap(copy.deepcopy(dict(self._data.items()), memo)))
+        return new
+
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Pickle the values as a dict.
+        """
+        return dict(self._data.items())
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """
+        Unpickle from a dict.
+        """
+        object.__setattr__(self, "_data", PersistentMap(state))
+
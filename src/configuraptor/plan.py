@@ -0,0 +1,198 @@
+"""
+Compiles a config class into a reusable 'load plan'.
+
+Analysing a class (walking the mro for annotations, checking which annotations are custom classes/unions/optional,
+finding aliases and defaults) only has to happen once per class.
+`load_recursive` and `check_and_convert_data` then execute the cached plan instead of re-deriving it on every load.
+"""
+
+import dataclasses as dc
+import enum
+import types
+import typing
+
+from .abs import AnyType
+from .alias import Alias
+from .caching import ClassCache
+from .errors import ConfigErrorMissingKey
+from .helpers import all_annotations, dataclass_field, is_custom_class, is_optional, is_parameterized, is_union
+
+
+class FieldKind(enum.Enum):
+    """
+    How a value that is present in the data should be loaded.
+    """
+
+    PLAIN = enum.auto()  # keep the value as-is
+    CUSTOM = enum.auto()  # load the value into a custom class
+    LIST = enum.auto()  # list[CustomClass]
+    DICT = enum.auto()  # dict[str, CustomClass]
+    UNION = enum.auto()  # CustomClass | ... (incl. Optional)
+
+
+class DefaultSource(enum.Enum):
+    """
+    Where the value of a field comes from when it is missing in the data (and no alias provides it).
+    """
+
+    ATTRIBUTE = enum.auto()  # class attribute (e.g. `key: str = "default"`)
+    DEFAULTABLE = enum.auto()  # Defaultable.default()
+    NONE = enum.auto()  # Optional without default
+    FACTORY = enum.auto()  # dataclass default_factory
+    MISSING = enum.auto()  # required key -> ConfigErrorMissingKey
+
+
+@dc.dataclass(frozen=True, slots=True)
+class FieldPlan:
+    """
+    Everything `load_recursive` needs to know about one annotated field.
+    """
+
+    key: str
+    annotation: AnyType
+    kind: FieldKind
+    # custom classes to recurse into (element type for list/dict, custom members for unions):
+    subtypes: tuple[AnyType, ...]
+    # whether NoneType is part of a union annotation:
+    nullable: bool
+    # names of the aliases pointing to this field:
+    aliases: tuple[str, ...]
+    default_source: DefaultSource
+    # Defaultable class or dataclass default_factory, depending on default_source:
+    default_factory: typing.Callable[[], typing.Any] | None = None
+
+    def default(self, cls: AnyType) -> typing.Any:
+        """
+        Resolve the value for this field when it's missing from the data.
+        """
+        match self.default_source:
+            case DefaultSource.ATTRIBUTE:
+                return cls.__dict__[self.key]
+            case DefaultSource.NONE:
+                return None
+            case DefaultSource.DEFAULTABLE | DefaultSource.FACTORY:
+                return typing.cast(typing.Callable[[], typing.Any], self.default_factory)()
+            case _:
+                raise ConfigErrorMissingKey(self.key, cls, self.annotation)
+
+
+@dc.dataclass(frozen=True, slots=True)
+class LoadPlan:
+    """
+    Immutable, compiled description of how to load data into a class.
+    """
+
+    fields: tuple[FieldPlan, ...]
+    by_key: types.MappingProxyType[str, FieldPlan]
+    annotations: types.MappingProxyType[str, AnyType]
+
+    def without(self, _except: typing.Iterable[str]) -> tuple[FieldPlan, ...]:
+        """
+        Get the fields of this plan, except the ones in `_except` (e.g. keys already set by __init__).
+        """
+        if not _except:
+            return self.fields
+
+        skip = set(_except)
+        return tuple(field for field in self.fields if field.key not in skip)
+
+    def select(self, cls: AnyType, annotations: dict[str, AnyType]) -> list[FieldPlan]:
+        """
+        Get the plan for each key in `annotations`.
+
+        The cached field plan is reused if the annotation matches,
+        otherwise (when custom annotations are passed) a new field plan is compiled.
+        """
+        selected = []
+        for key, _type in annotations.items():
+            field = self.by_key.get(key)
+            if field is None or not (field.annotation is _type or field.annotation == _type):
+                field = compile_field(cls, key, _type)
+            selected.append(field)
+        return selected
+
+
+def _aliases_for(cls: AnyType, key: str) -> tuple[str, ...]:
+    """
+    Names of all aliases in cls that point to 'key'.
+    """
+    return tuple(field for field, value in cls.__dict__.items() if isinstance(value, Alias) and value.to == key)
+
+
+def compile_field(cls: AnyType, key: str, _type: AnyType) -> FieldPlan:
+    """
+    Analyse a single annotated field of `cls`.
+    """
+    from .core import is_defaultable
+
+    kind = FieldKind.PLAIN
+    subtypes: tuple[AnyType, ...] = ()
+    nullable = False
+
+    if is_parameterized(_type):
+        origin = typing.get_origin(_type)
+        arguments = typing.get_args(_type)
+        if origin is list and arguments and is_custom_class(arguments[0]):
+            kind, subtypes = FieldKind.LIST, (arguments[0],)
+        elif origin is dict and len(arguments) > 1 and is_custom_class(arguments[1]):
+            # e.g. dict[str, Point]
+            kind, subtypes = FieldKind.DICT, (arguments[1],)
+        elif is_union(_type) and arguments:
+            kind = FieldKind.UNION
+            subtypes = tuple(arg for arg in arguments if is_custom_class(arg))
+            nullable = types.NoneType in arguments
+    elif is_custom_class(_type):
+        # includes dataclass but not optional[cls]
+        kind, subtypes = FieldKind.CUSTOM, (_type,)
+
+    default_factory = None
+    if key in cls.__dict__:
+        default_source = DefaultSource.ATTRIBUTE
+    elif (defaultable := is_defaultable(_type, with_optional=True)) is not None:
+        default_source = DefaultSource.DEFAULTABLE
+        default_factory = defaultable.default
+    elif is_optional(_type):
+        default_source = DefaultSource.NONE
+    elif dc.is_dataclass(cls) and (field := dataclass_field(cls, key)) and field.default_factory is not dc.MISSING:
+        default_source = DefaultSource.FACTORY
+        default_factory = field.default_factory
+    else:
+        default_source = DefaultSource.MISSING
+
+    return FieldPlan(
+        key=key,
+        annotation=_type,
+        kind=kind,
+        subtypes=subtypes,
+        nullable=nullable,
+        aliases=_aliases_for(cls, key),
+        default_source=default_source,
+        default_factory=default_factory,
+    )
+
+
+def compile_plan(cls: AnyType) -> LoadPlan:
+    """
+    Analyse all annotations (incl. inherited ones) of `cls` into a LoadPlan.
+    """
+    annotations = all_annotations(cls)
+    fields = tuple(compile_field(cls, key, _type) for key, _type in annotations.items())
+
+    return LoadPlan(
+        fields=fields,
+        by_key=types.MappingProxyType({field.key: field for field in fields}),
+        annotations=types.MappingProxyType(annotations),
+    )
+
+
+# plans are keyed (weakly) by class identity, so redefining a class results in a fresh plan.
+# Use LOAD_PLANS.invalidate(cls) or LOAD_PLANS.clear() after modifying a class in place
+# and LOAD_PLANS.info() for hit/miss statistics.
+LOAD_PLANS: ClassCache[LoadPlan] = ClassCache(compile_plan)
+
+
+def load_plan(cls: AnyType) -> LoadPlan:
+    """
+    Get the (cached) LoadPlan for `cls`.
+    """
+    return LOAD_PLANS.get(cls)
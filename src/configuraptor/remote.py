@@ -0,0 +1,266 @@
+"""
+HTTP logic for loading config from a url: a pooled session with a (memory + optional disk) cache.
+
+Responses are cached according to their `ETag`, `Last-Modified` and `Cache-Control` headers:
+fresh responses (max-age) are reused without a request and stale ones are revalidated with a conditional request,
+so a '304 Not Modified' can reuse the cached (and already parsed) document.
+
+requests is only imported when the first request is made.
+"""
+
+import hashlib
+import json
+import threading
+import time
+import typing
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from .caching import LRUCache
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import requests
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_TIMEOUT = 10
+DEFAULT_MEMORY_SIZE = 256
+
+
+@dataclass
+class CachedResponse:
+    """
+    The parts of a response that are required to load and revalidate it.
+    """
+
+    url: str
+    text: str
+    headers: dict[str, str]
+    etag: str | None = None
+    last_modified: str | None = None
+    # unix timestamp until which the response may be used without revalidating:
+    expires_at: float = 0.0
+    # the parsed document, so a revalidated response doesn't have to be parsed again (not stored on disk):
+    parsed: typing.Any = field(default=None, compare=False, repr=False)
+
+    @property
+    def is_fresh(self) -> bool:
+        """
+        Can this response be used without asking the server?
+        """
+        return time.time() < self.expires_at
+
+    def to_json(self) -> str:
+        """
+        Serialize for the disk cache.
+        """
+        data = asdict(self)
+        data.pop("parsed")
+        return json.dumps(data)
+
+    @classmethod
+    def from_json(cls, raw: str) -> "CachedResponse":
+        """
+        Load from the disk cache.
+        """
+        return cls(**json.loads(raw))
+
+
+def _cache_control(headers: typing.Mapping[str, str]) -> dict[str, str | None]:
+    """
+    Parse a Cache-Control header.
+
+    Example:
+        'public, max-age=60' -> {'public': None, 'max-age': '60'}
+    """
+    directives: dict[str, str | None] = {}
+    for directive in headers.get("cache-control", "").split(","):
+        name, _, value = directive.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"') or None
+    return directives
+
+
+def _expires_at(directives: dict[str, str | None]) -> float:
+    """
+    Until when is a response fresh, based on its Cache-Control directives?
+    """
+    if "no-cache" in directives:
+        return 0.0
+
+    try:
+        max_age = int(directives.get("max-age") or 0)
+    except ValueError:
+        max_age = 0
+
+    return time.time() + max_age if max_age > 0 else 0.0
+
+
+class HttpClient:
+    """
+    Pooled session + cache for `from_url`.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        cache_dir: Path | str | None = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        memory_size: int = DEFAULT_MEMORY_SIZE,
+    ) -> None:
+        """
+        Configure the client.
+
+        Args:
+            pool_size: max amount of (keep-alive) connections per host.
+            cache_dir: if set, responses are also stored on disk, so a restart doesn't re-download them.
+            timeout: request timeout in seconds.
+            memory_size: max amount of responses kept in memory (least recently used ones are dropped first).
+        """
+        self.pool_size = pool_size
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+        self.timeout = timeout
+
+        self._session: "requests.Session | None" = None
+        self._memory: LRUCache[str, CachedResponse] = LRUCache(memory_size)
+        self._lock = threading.Lock()
+
+    def configure(
+        self,
+        pool_size: int | None = None,
+        cache_dir: Path | str | None = None,
+        timeout: float | None = None,
+        memory_size: int | None = None,
+    ) -> None:
+        """
+        Change settings of an existing client (e.g. the default `HTTP`), the session is recreated if required.
+        """
+        if pool_size is not None and pool_size != self.pool_size:
+            self.pool_size = pool_size
+            self.close()
+        if cache_dir is not None:
+            self.cache_dir = Path(cache_dir).expanduser()
+        if timeout is not None:
+            self.timeout = timeout
+        if memory_size is not None:
+            self._memory.resize(memory_size)
+
+    @property
+    def session(self) -> "requests.Session":
+        """
+        Lazily create a requests Session with a connection pool of `pool_size`.
+        """
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            with self._lock:
+                if self._session is None:
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+                    session.mount("http://", adapter)
+                    session.mount("https://", adapter)
+                    self._session = session
+
+        return self._session
+
+    def close(self) -> None:
+        """
+        Close the pooled connections (a new session will be created on the next request).
+        """
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def _disk_path(self, url: str) -> Path | None:
+        if not self.cache_dir:
+            return None
+        return self.cache_dir / f"{hashlib.sha256(url.encode()).hexdigest()}.json"
+
+    def _lookup(self, url: str) -> CachedResponse | None:
+        """
+        Find a cached response in memory or on disk.
+        """
+        if cached := self._memory.get(url):
+            return cached
+
+        path = self._disk_path(url)
+        if not path or not path.exists():
+            return None
+
+        try:
+            cached = CachedResponse.from_json(path.read_text())
+        except (ValueError, TypeError):
+            # corrupt cache file, ignore it
+            return None
+
+        self._memory.set(url, cached)
+        return cached
+
+    def _store(self, cached: CachedResponse) -> None:
+        self._memory.set(cached.url, cached)
+
+        if path := self._disk_path(cached.url):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(cached.to_json())
+
+    def get(self, url: str, verify: bool = True) -> CachedResponse:
+        """
+        Get a (possibly cached) response for `url`.
+
+        If the server can't be reached, a stale cached response is used if available.
+        """
+        cached = self._lookup(url)
+        if cached and cached.is_fresh:
+            return cached
+
+        headers = {}
+        if cached and cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached and cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+
+        import requests
+
+        try:
+            resp = self.session.get(url, headers=headers, timeout=self.timeout, verify=verify)
+        except (requests.ConnectionError, requests.Timeout):
+            if cached:
+                return cached
+            raise
+
+        directives = _cache_control(resp.headers)
+
+        if resp.status_code == 304 and cached:
+            cached.expires_at = _expires_at(directives)
+            self._store(cached)
+            return cached
+
+        response = CachedResponse(
+            url=url,
+            text=resp.text,
+            headers={"content-type": resp.headers.get("content-type", "")},
+            etag=resp.headers.get("etag"),
+            last_modified=resp.headers.get("last-modified"),
+            expires_at=_expires_at(directives),
+        )
+
+        if resp.status_code == 200 and "no-store" not in directives:
+            self._store(response)
+
+        return response
+
+    def clear(self) -> None:
+        """
+        Remove all cached responses (memory and disk).
+        """
+        self._memory.clear()
+
+        if self.cache_dir and self.cache_dir.exists():
+            for path in self.cache_dir.glob("*.json"):
+                path.unlink(missing_ok=True)
+
+
+# Default client used by `from_url`.
+# Use e.g. HTTP.configure(pool_size=20, cache_dir="~/.cache/my-app") to change it.
+HTTP = HttpClient()
@@ -0,0 +1,65 @@
+"""
+Sources: a list of data sources that is loaded concurrently.
+"""
+
+import typing
+from dataclasses import dataclass
+
+from .abs import T_data_types
+
+T_on_error = typing.Literal["raise", "warn"]
+
+
+@dataclass(frozen=True, slots=True)
+class SourceTiming:
+    """
+    How long loading one of the Sources took, and the exception if it failed.
+    """
+
+    source: T_data_types
+    seconds: float
+    error: Exception | None = None
+
+
+class Sources(list[T_data_types]):
+    """
+    Drop-in replacement for a list of sources (files, urls, dicts) to load them in parallel.
+
+    The sources are fetched and parsed in a thread pool and merged in list order afterwards,
+    so the result is the same as when loading a regular list.
+
+    Usage:
+        sources = Sources(["base.toml", "env.toml", "https://config-server/app.json"], workers=4)
+        config = load_into(MyConfig, sources)
+        sources.timings  # -> [SourceTiming(source='base.toml', seconds=0.001, error=None), ...]
+
+    `aload_into`/`aload_data` also respect `workers` and `on_error` (with asyncio tasks instead of threads).
+
+    Note: `timings` describes the last load of this object, so don't load the same Sources from multiple
+    threads (or event loops) at the same time if you need them; use a copy (`Sources(sources, ...)`) per load instead.
+    """
+
+    timings: list[SourceTiming]
+
+    def __init__(
+        self,
+        sources: typing.Iterable[T_data_types] = (),
+        *,
+        workers: int = 4,
+        on_error: T_on_error | None = None,
+    ) -> None:
+        """
+        Create a list of sources.
+
+        Args:
+            sources: the files, urls, dicts etc. to load.
+            workers: max amount of threads.
+            on_error: 'raise' to fail fast with the first failing source (sources not started yet are cancelled),
+                'warn' to continue with the other sources (like non-strict `load_data`).
+                Follows the `strict` setting of the load by default.
+        """
+        super().__init__(sources)
+        self.workers = workers
+        self.on_error = on_error
+        # filled in list order after loading:
+        self.timings = []
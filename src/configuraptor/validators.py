@@ -0,0 +1,181 @@
+"""
+Fast type validation for the common annotations in config classes.
+
+An annotation is compiled once into a closure that uses plain `isinstance` checks.
+Exotic annotations (Protocols, TypedDicts, tuples, Callables, ...) fall back to typeguard.
+Semantics follow typeguard's defaults, so only the first item of a list/dict is checked.
+Changes to `typeguard.config` (e.g. collection_check_strategy) only affect the annotations that use typeguard.
+"""
+
+import collections.abc
+import enum
+import types
+import threading
+import typing
+
+Validator = typing.Callable[[typing.Any], bool]
+
+# classes that typeguard doesn't check with a simple isinstance:
+_TYPEGUARD_SPECIAL: set[typing.Any] = {
+    bytes,  # also accepts bytearray and memoryview
+    set,  # also accepts other AbstractSets
+    frozenset,
+    type,
+    collections.abc.Callable,
+    collections.abc.Mapping,
+    collections.abc.MutableMapping,
+    collections.abc.Sequence,
+    collections.abc.Set,
+    typing.IO,
+    typing.BinaryIO,
+    typing.TextIO,
+}
+
+# numeric tower (PEP 484): an int is a valid float and complex
+_NUMBERS: dict[type, tuple[type, ...]] = {
+    float: (float, int),
+    complex: (complex, float, int),
+}
+
+# Bounded (the oldest entries are dropped first), so the (redefined) classes in annotations can be garbage collected.
+# A plain dict instead of an LRUCache, so a hit doesn't need a lock (check_type is called for every loaded value).
+VALIDATORS: dict[typing.Any, Validator] = {}
+MAX_VALIDATORS = 1024
+_VALIDATORS_LOCK = threading.Lock()
+
+
+def _always(_: typing.Any) -> bool:
+    return True
+
+
+def _is_none(value: typing.Any) -> bool:
+    return value is None
+
+
+def _typeguard_validator(annotation: typing.Any) -> Validator:
+    """
+    Fallback for annotations that are not supported by the fast path.
+    """
+    from typeguard import TypeCheckError
+    from typeguard import check_type as _check_type
+
+    def validator(value: typing.Any) -> bool:
+        try:
+            _check_type(value, annotation)
+            return True
+        except TypeCheckError:
+            return False
+
+    return validator
+
+
+def _instance_validator(classes: type | tuple[type, ...]) -> Validator:
+    def validator(value: typing.Any) -> bool:
+        return isinstance(value, classes)
+
+    return validator
+
+
+def _is_plain_class(annotation: typing.Any) -> bool:
+    """
+    Classes that typeguard would check with only `isinstance`.
+    """
+    return (
+        isinstance(annotation, type)
+        and annotation not in _TYPEGUARD_SPECIAL
+        and not issubclass(annotation, tuple)  # incl. NamedTuple
+        and not getattr(annotation, "_is_protocol", False)
+        and not typing.is_typeddict(annotation)
+    )
+
+
+def _flatten_literal(args: tuple[typing.Any, ...]) -> tuple[typing.Any, ...] | None:
+    """
+    Literal[1, Literal[2]] -> (1, 2). Returns None if any value is not supported by typeguard.
+    """
+    values: list[typing.Any] = []
+    for arg in args:
+        if typing.get_origin(arg) is typing.Literal:
+            if (nested := _flatten_literal(typing.get_args(arg))) is None:
+                return None
+            values.extend(nested)
+        elif arg is None or isinstance(arg, (int, str, bytes, bool, enum.Enum)):
+            values.append(arg)
+        else:
+            return None
+    return tuple(values)
+
+
+def _compile_validator(annotation: typing.Any) -> Validator:
+    """
+    Turn an annotation into a validator function.
+    """
+    if annotation is typing.Any or annotation is object:
+        return _always
+    if annotation is None or annotation is types.NoneType:
+        return _is_none
+
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+
+    if origin is typing.Annotated:
+        return compile_validator(args[0])
+
+    if origin is None:
+        if annotation in _NUMBERS:
+            return _instance_validator(_NUMBERS[annotation])
+        if _is_plain_class(annotation):
+            return _instance_validator(annotation)
+    elif origin in (typing.Union, types.UnionType) and args:
+        options = tuple(compile_validator(arg) for arg in args)
+
+        def union_validator(value: typing.Any) -> bool:
+            return any(option(value) for option in options)
+
+        return union_validator
+    elif origin is typing.Literal and (literals := _flatten_literal(args)) is not None:
+        # the type check has to come first, as bool is a subclass of int (so 1 == True)
+        def literal_validator(value: typing.Any) -> bool:
+            return any(type(literal) is type(value) and literal == value for literal in literals)
+
+        return literal_validator
+    elif origin is list and len(args) == 1:
+        item_validator = compile_validator(args[0])
+
+        def list_validator(value: typing.Any) -> bool:
+            return isinstance(value, list) and (not value or item_validator(value[0]))
+
+        return list_validator
+    elif origin is dict and len(args) == 2:
+        key_validator, value_validator = compile_validator(args[0]), compile_validator(args[1])
+
+        def dict_validator(value: typing.Any) -> bool:
+            if not isinstance(value, dict):
+                return False
+            if not value:
+                return True
+            first_key, first_value = next(iter(value.items()))
+            return key_validator(first_key) and value_validator(first_value)
+
+        return dict_validator
+
+    return _typeguard_validator(annotation)
+
+
+def compile_validator(annotation: typing.Any) -> Validator:
+    """
+    Get the (cached) validator for an annotation.
+    """
+    try:
+        return VALIDATORS[annotation]
+    except KeyError:
+        validator = _compile_validator(annotation)
+    except TypeError:  # pragma: no cover
+        # unhashable annotation, don't cache
+        return _compile_validator(annotation)
+
+    with _VALIDATORS_LOCK:
+        while len(VALIDATORS) >= MAX_VALIDATORS:
+            del VALIDATORS[next(iter(VALIDATORS))]
+        VALIDATORS[annotation] = validator
+    return validator
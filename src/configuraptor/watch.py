@@ -0,0 +1,479 @@
+"""
+Hot-reloading: watch the files a config was loaded from and update the live instance when they change.
+
+Once a `Watcher` exists (or `WATCHED.enabled` is set), every instance created by `load_into` (or `TypedConfig.load`)
+from one or more files is tracked in `WATCHED`, so loading doesn't pay for this in programs that don't watch anything.
+A `Watcher` polls those files (optionally woken up by the `watchdog` package), re-parses only the files that changed
+and applies only the changed keys to the instance (via `TypedConfig._update`, so type checks and aliases still work).
+"""
+
+import threading
+import time
+import typing
+import warnings
+import weakref
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Self
+
+from .abs import DEFAULT_ENV_SETTING, T_data, T_data_types, UseEnvSetting
+
+# mtime, size, inode; None if the file doesn't exist (anymore)
+T_signature = tuple[int, int, int] | None
+# key: (old value, new value)
+T_changes = dict[str, tuple[Any, Any]]
+T_on_change = typing.Callable[[Any, T_changes], None]
+T_backend = typing.Literal["auto", "polling", "watchdog"]
+
+
+def _signature(path: Path) -> T_signature:
+    """
+    Cheap way to see if a file was changed, without reading it.
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+def _as_path(source: T_data_types) -> Path | None:
+    """
+    Get the path of a source if it's a (local) file.
+    """
+    from .core import is_url
+
+    if isinstance(source, str) and not is_url(source):
+        return Path(source)
+    if isinstance(source, Path):
+        return source
+    return None
+
+
+@dataclass(eq=False)
+class WatchedConfig:
+    """
+    An instance together with the sources and settings it was loaded with.
+    """
+
+    ref: weakref.ReferenceType[Any]
+    sources: tuple[T_data_types, ...]
+    # loaded from a list (which always uses lower_keys) or a single source:
+    is_list: bool
+    key: str | None
+    strict: bool
+    lower_keys: bool
+    convert_types: bool
+    use_env: UseEnvSetting
+    # per source (None for non-file sources):
+    paths: tuple[Path | None, ...]
+    signatures: list[T_signature]
+    # data per source as it was last applied, filled by the first check of a Watcher:
+    loaded: list[dict[str, Any]] | None = None
+    # source idx: (new signature, first seen), to debounce bursts of writes:
+    pending: dict[int, tuple[T_signature, float]] = field(default_factory=dict)
+
+    def _load(self, idx: int) -> dict[str, Any]:
+        """
+        (Re)load one of the sources.
+        """
+        from .core import load_data
+
+        instance = self.ref()
+        return load_data(
+            self.sources[idx],
+            key=self.key,
+            classname=type(instance).__name__,
+            lower_keys=self.lower_keys or self.is_list,
+            strict=True,
+            use_env=self.use_env,
+        )
+
+
+class WatchRegistry:
+    """
+    Keeps track of the instances loaded from files (weakly, so they can still be garbage collected).
+
+    Note: the (non-file) sources an instance was loaded from, e.g. dicts, are kept as long as the instance is tracked.
+    """
+
+    def __init__(self) -> None:
+        """
+        Start without any tracked instances (tracking is enabled by creating a `Watcher`).
+        """
+        self.enabled = False
+        # id(instance) -> record, removed when the instance is garbage collected:
+        self._items: dict[int, WatchedConfig] = {}
+        self._lock = threading.Lock()
+
+    def _forget(self, key: int, ref: weakref.ReferenceType[Any]) -> None:
+        """
+        Weakref callback: remove the record of a garbage collected instance.
+
+        Doesn't take the lock, since garbage collection can happen while it's held.
+        """
+        if (item := self._items.get(key)) is not None and item.ref is ref:
+            self._items.pop(key, None)
+
+    def track(
+        self,
+        instance: Any,
+        data: T_data,
+        key: str = None,
+        strict: bool = True,
+        lower_keys: bool = False,
+        convert_types: bool = False,
+        use_env: UseEnvSetting = DEFAULT_ENV_SETTING,
+    ) -> WatchedConfig | None:
+        """
+        Remember where `instance` was loaded from, if that includes at least one file.
+        """
+        from .cls import TypedMapping
+        from .persistent import PersistentTypedMapping
+
+        if not self.enabled or isinstance(instance, (TypedMapping, PersistentTypedMapping)):
+            # immutable configs can't be updated in place
+            return None
+
+        is_list = isinstance(data, list)
+        sources = tuple(data) if isinstance(data, list) else (data,)
+        paths = tuple(_as_path(source) for source in sources)
+        if not any(paths):
+            return None
+
+        instance_id = id(instance)
+        try:
+            ref = weakref.ref(instance, lambda dead: self._forget(instance_id, dead))
+        except TypeError:
+            # e.g. slotted dataclasses can't be watched
+            return None
+
+        record = WatchedConfig(
+            ref=ref,
+            sources=sources,
+            is_list=is_list,
+            key=key,
+            strict=strict,
+            lower_keys=lower_keys,
+            convert_types=convert_types,
+            use_env=use_env,
+            paths=paths,
+            signatures=[_signature(path) if path else None for path in paths],
+        )
+
+        with self._lock:
+            self._items[instance_id] = record
+
+        return record
+
+    def untrack(self, instance: Any) -> None:
+        """
+        Stop watching an instance.
+        """
+        with self._lock:
+            item = self._items.get(id(instance))
+            if item is not None and item.ref() is instance:
+                del self._items[id(instance)]
+
+    def clear(self) -> None:
+        """
+        Stop watching everything.
+        """
+        with self._lock:
+            self._items.clear()
+
+    def __iter__(self) -> typing.Iterator[WatchedConfig]:
+        """
+        Loop over the records of instances that are still alive.
+        """
+        with self._lock:
+            items = list(self._items.values())
+        return iter([item for item in items if item.ref() is not None])
+
+    def __len__(self) -> int:
+        """
+        Amount of instances that are still alive.
+        """
+        return len(list(iter(self)))
+
+
+# Filled by load_into once a Watcher was created (or `WATCHED.enabled = True`).
+# Use `WATCHED.enabled = False` to stop tracking new instances.
+WATCHED = WatchRegistry()
+
+
+def _apply(instance: Any, record: WatchedConfig, old: dict[str, Any], new: dict[str, Any]) -> T_changes:
+    """
+    Validate and set only the keys that changed between `old` and `new`.
+
+    Keys that were removed from the file keep their current value.
+    """
+    from .core import check_and_convert_data, convert_key
+    from .helpers import ANNOTATIONS
+
+    changed = {key: value for key, value in new.items() if key not in old or old[key] != value}
+    if not changed:
+        return {}
+
+    cls = type(instance)
+    annotations = ANNOTATIONS.get(cls)
+    keys = {convert_key(key) for key in changed}
+    # everything is validated before anything is set, so a wrong value doesn't leave a half-updated config.
+    # nested configs are only (re)loaded for changed keys, the unchanged ones are skipped:
+    values = check_and_convert_data(
+        cls, changed, _except=annotations.keys() - keys, strict=record.strict, convert_types=record.convert_types
+    )
+    values = {key: value for key, value in values.items() if key in annotations}
+
+    before = {key: getattr(instance, key, None) for key in values}
+    if update := getattr(instance, "_update", None):
+        update(_strict=record.strict, _convert_types=record.convert_types, **values)
+    else:
+        for key, value in values.items():
+            setattr(instance, key, value)
+
+    after = {key: getattr(instance, key, None) for key in values}
+    return {key: (before[key], after[key]) for key in values if before[key] != after[key]}
+
+
+class Watcher:
+    """
+    Watches the files of tracked configs and updates them in place when they change.
+
+    Usage:
+        watcher = Watcher(interval=1.0)
+
+        # loaded after the watcher was created, so it's tracked (or use watcher.watch(config, "config.toml")):
+        config = MyConfig.load("config.toml")
+
+        @watcher.on_change
+        def changed(instance, changes):
+            print(instance, changes)  # {'key': (old, new)}
+
+        with watcher:  # or watcher.start() ... watcher.stop()
+            ...
+    """
+
+    def __init__(
+        self,
+        interval: float = 1.0,
+        debounce: float = 0.1,
+        backend: T_backend = "auto",
+        registry: WatchRegistry = WATCHED,
+    ) -> None:
+        """
+        Configure the watcher (it doesn't start until `start()` or `with watcher:`).
+
+        From now on, instances loaded from files are tracked by the registry.
+
+        Args:
+            interval: seconds between polls.
+            debounce: a file must be unchanged for this long before it's reloaded (so a burst of writes = 1 reload).
+            backend: 'polling', 'watchdog' (requires the watchdog package) or 'auto' (watchdog if it's installed).
+                With watchdog, file system events wake up the watcher before the next poll.
+            registry: where to find the instances to watch.
+        """
+        self.interval = interval
+        self.debounce = debounce
+        self.backend = backend
+        self.registry = registry
+        registry.enabled = True
+        self.callbacks: list[T_on_change] = []
+
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._observer: Any = None
+
+    def on_change(self, callback: T_on_change) -> T_on_change:
+        """
+        Register a function that's called with (instance, changes) after an instance is updated.
+
+        Can be used as a decorator.
+        """
+        self.callbacks.append(callback)
+        return callback
+
+    def watch(
+        self,
+        instance: Any,
+        data: T_data,
+        key: str = None,
+        strict: bool = True,
+        lower_keys: bool = False,
+        convert_types: bool = False,
+        use_env: UseEnvSetting = DEFAULT_ENV_SETTING,
+    ) -> WatchedConfig | None:
+        """
+        Explicitly watch an instance (e.g. one that wasn't created by `load_into`).
+
+        See `load_into` for the arguments.
+        """
+        return self.registry.track(instance, data, key, strict, lower_keys, convert_types, use_env)
+
+    def check(self) -> list[tuple[Any, T_changes]]:
+        """
+        Poll once: reload changed files (that are done changing) and apply the changes.
+
+        Returns the updated instances and their changes.
+        """
+        now = time.monotonic()
+        updated = []
+
+        for record in self.registry:
+            instance = record.ref()
+            if instance is None:  # pragma: no cover
+                continue
+
+            ready = []
+            for idx, path in enumerate(record.paths):
+                if path is None:
+                    continue
+
+                signature = _signature(path)
+                if signature == record.signatures[idx]:
+                    record.pending.pop(idx, None)
+                    continue
+
+                seen = record.pending.get(idx)
+                if seen is None or seen[0] != signature:
+                    seen = record.pending[idx] = (signature, now)
+
+                if now - seen[1] >= self.debounce:
+                    ready.append(idx)
+
+            if changes := self._reload(instance, record, ready):
+                updated.append((instance, changes))
+                for callback in self.callbacks:
+                    callback(instance, changes)
+
+        return updated
+
+    def _reload(self, instance: Any, record: WatchedConfig, ready: list[int]) -> T_changes:
+        """
+        Re-parse the ready sources of a record and apply the difference.
+        """
+        for idx in ready:
+            record.signatures[idx] = record.pending.pop(idx)[0]
+
+        if record.loaded is None:
+            # first check of this record: a file that changed since it was loaded (ready or still debouncing)
+            # is applied in full later, reading it now would make its new contents the baseline.
+            changed = set(ready) | record.pending.keys()
+            try:
+                record.loaded = [{} if idx in changed else record._load(idx) for idx in range(len(record.sources))]
+            except Exception as e:
+                warnings.warn(f"Could not reload {instance!r}: {e}", category=UserWarning)
+                return {}
+
+        if not ready:
+            return {}
+
+        old = _merge(record.loaded)
+        try:
+            loaded = list(record.loaded)
+            for idx in ready:
+                loaded[idx] = record._load(idx)
+
+            changes = _apply(instance, record, old, _merge(loaded))
+        except Exception as e:
+            # e.g. a syntax error while editing: keep the old config until the file is fixed.
+            warnings.warn(f"Could not reload {instance!r}: {e}", category=UserWarning)
+            return {}
+
+        record.loaded = loaded
+        return changes
+
+    def _start_backend(self) -> None:
+        """
+        Use watchdog's file system events (if available) to wake up the poll loop early.
+        """
+        if self.backend == "polling":
+            return
+
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            if self.backend == "watchdog":
+                raise
+            return
+
+        wake = self._wake
+
+        class Handler(FileSystemEventHandler):  # type: ignore
+            def on_any_event(self, _event: Any) -> None:
+                wake.set()
+
+        observer = Observer()
+        directories = {path.resolve().parent for record in self.registry for path in record.paths if path}
+        for directory in directories:
+            if directory.exists():
+                observer.schedule(Handler(), str(directory))
+        observer.start()
+        self._observer = observer
+
+    def _run(self) -> None:
+        """
+        Poll loop of the background thread.
+        """
+        while not self._stop.is_set():
+            try:
+                self.check()
+            except Exception as e:  # pragma: no cover
+                warnings.warn(f"Watcher check failed: {e}", category=UserWarning)
+
+            has_pending = any(record.pending for record in self.registry)
+            self._wake.wait(min(self.debounce, self.interval) if has_pending else self.interval)
+            self._wake.clear()
+
+    def start(self) -> Self:
+        """
+        Start watching in a background (daemon) thread.
+        """
+        if self._thread and self._thread.is_alive():
+            return self
+
+        self._stop.clear()
+        self._start_backend()
+        self._thread = threading.Thread(target=self._run, name="configuraptor-watcher", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stop the background thread (and watchdog observer).
+        """
+        self._stop.set()
+        self._wake.set()
+
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> Self:
+        """
+        with Watcher(): ...
+        """
+        return self.start()
+
+    def __exit__(self, *_: Any) -> None:
+        """
+        Stop watching at the end of the with block.
+        """
+        self.stop()
+
+
+def _merge(loaded: list[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Combine the data of multiple sources in order (like `load_data` does for a list).
+    """
+    final_data: dict[str, Any] = {}
+    for data in loaded:
+        final_data |= data
+    return final_data
@@ -0,0 +1,110 @@
+import asyncio
+import json
+import time
+
+import pytest
+
+from src.configuraptor import Sources, TypedConfig, aload_data, aload_into
+from src.configuraptor.errors import FailedToLoad
+from tests.constants import EXAMPLE_FILE
+
+
+class Configuration(TypedConfig):
+    color: str
+    width: int
+
+
+class WithInit:
+    color: str
+    width: int
+
+    def __init__(self):
+        self.color = "from init"
+
+
+async def slow_transport(url: str) -> tuple[str, str | None]:
+    # e.g. http://config/0.5/{"color": "red"}
+    _, _, _, delay, body = url.split("/", 4)
+    await asyncio.sleep(float(delay))
+    return body, "application/json"
+
+
+def test_aload_into():
+    inst = asyncio.run(aload_into(Configuration, 'mock://{"color": "green", "width": 15}'))
+    assert inst.color == "green"
+    assert inst.width == 15
+
+    inst = asyncio.run(Configuration.aload({"color": "blue", "width": 3}))
+    assert inst.color == "blue"
+
+    # existing instance:
+    existing = WithInit()
+    asyncio.run(aload_into(existing, {"color": "ignored", "width": 4}))  # type: ignore
+    assert existing.color == "from init"
+    assert existing.width == 4
+
+
+def test_aload_file():
+    data = asyncio.run(aload_data(EXAMPLE_FILE, key=""))
+    assert data
+
+
+def test_sources_are_loaded_concurrently_and_merged_in_order():
+    sources = [
+        "http://config/0.3/" + json.dumps({"color": "red", "width": 1}),
+        "http://config/0.1/" + json.dumps({"color": "green"}),
+        {"width": 15},
+    ]
+
+    start = time.perf_counter()
+    inst = asyncio.run(aload_into(Configuration, sources, transport=slow_transport))
+    duration = time.perf_counter() - start
+
+    assert inst.color == "green"
+    assert inst.width == 15
+    assert duration < 0.39
+
+
+def test_aload_errors():
+    async def failing_transport(_: str) -> tuple[str, str | None]:
+        raise ConnectionError("nope")
+
+    with pytest.raises(FailedToLoad):
+        asyncio.run(aload_data("https://config/", strict=True, transport=failing_transport))
+
+    with pytest.warns(UserWarning):
+        assert asyncio.run(aload_data("https://config/", transport=failing_transport)) == {}
+
+    with pytest.raises(FailedToLoad):
+        asyncio.run(aload_data([], strict=True))
+
+
+def test_aload_sources():
+    async def transport(url: str) -> tuple[str, str | None]:
+        if "broken" in url:
+            raise ConnectionError("nope")
+        return await slow_transport(url)
+
+    urls = ["http://config/0.1/" + json.dumps({"color": color}) for color in ("red", "green", "blue")]
+    broken = "http://broken/"
+
+    sources = Sources([*urls, {"width": 15}], workers=1)
+    start = time.perf_counter()
+    inst = asyncio.run(aload_into(Configuration, sources, transport=transport))
+    # workers=1, so one at a time:
+    assert time.perf_counter() - start >= 0.3
+    assert inst.color == "blue"
+    assert [timing.source for timing in sources.timings] == sources
+    assert all(timing.error is None for timing in sources.timings)
+
+    sources = Sources([broken, *urls], on_error="warn")
+    with pytest.warns(UserWarning):
+        assert asyncio.run(aload_data(sources, strict=True, transport=transport)) == {"color": "blue"}
+    assert isinstance(sources.timings[0].error, FailedToLoad)
+
+    # strict by default -> fail fast:
+    sources = Sources([broken, *urls], workers=1)
+    with pytest.raises(FailedToLoad) as exc:
+        asyncio.run(aload_into(Configuration, sources, transport=transport))
+    assert isinstance(exc.value.__cause__, ConnectionError)
+    assert [timing.source for timing in sources.timings] == [broken]
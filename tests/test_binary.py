@@ -1,11 +1,13 @@
 import json
+import mmap
 import struct
 
+import pytest
 import tomli_w
 import yaml
 
 from src import configuraptor
-from src.configuraptor import BinaryConfig, BinaryField, asbytes
+from src.configuraptor import BinaryConfig, BinaryField, asbytes, compact
 
 
 class MyBinaryConfig(BinaryConfig):
@@ -108,3 +110,224 @@ def test_resize_config():
 
     inst.contains = big_num
     assert inst._get_length() == 8
+
+
+def test_buffers(tmp_path):
+    records = [struct.pack("i i i", idx, idx * 2, idx * 3) for idx in range(100)]
+    path = tmp_path / "versions.bin"
+    path.write_bytes(b"".join(records))
+    size = Version._get_length()
+    assert size == 12
+    assert Version._struct() is Version._struct()
+
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        tenth = Version.from_buffer(mm, offset=9 * size)
+        assert (tenth.major, tenth.minor, tenth.patch) == (9, 18, 27)
+
+        with memoryview(mm) as view, view[size : 2 * size] as second:
+            assert Version.load(second).patch == 3
+
+    assert configuraptor.load_into(Version, bytearray(records[5])).minor == 10
+
+    # load_into requires exactly one record, like struct.unpack:
+    with pytest.raises(struct.error):
+        configuraptor.load_into(Version, records[5] + b"xxxx")
+    with pytest.raises(struct.error):
+        Version.load(records[5][:-1])
+    assert Version.from_buffer(records[5] + b"xxxx").minor == 10
+
+    versions = Versions.from_buffer(memoryview(b"padding" + records[1] + records[2]), offset=7)
+    assert versions.second.major == 2
+    assert versions._pack() == records[1] + records[2]
+
+
+def test_iter_unpack_and_pack_many():
+    versions = [Version.load(struct.pack("i i i", idx, idx + 1, idx + 2)) for idx in range(50)]
+
+    packed = Version.pack_many(versions)
+    assert packed == b"".join(version._pack() for version in versions)
+    assert Version.pack_many(iter([])) == b""
+
+    unpacked = list(Version.iter_unpack(packed))
+    assert len(unpacked) == 50
+    assert unpacked[10].minor == 11
+    assert Version.pack_many(unpacked) == packed
+
+    # still regular instances:
+    unpacked[0].major = 7
+    assert unpacked[0]._pack() == struct.pack("i i i", 7, 1, 2)
+    assert [v.second.patch for v in Versions.iter_unpack(memoryview(packed[: 2 * 24]))] == [3, 5]
+
+    with pytest.raises(TypeError):
+        Version.pack_many([IsNumber()])
+
+    with pytest.raises(struct.error):
+        list(Version.iter_unpack(packed[:-1]))
+
+
+class Record(BinaryConfig):
+    id = BinaryField(int, format="q")
+    small = BinaryField(int, format="h")
+    score = BinaryField(float, format="d")
+    active = BinaryField(bool)
+    name = BinaryField(str, length=6)
+    version = BinaryField(Version)
+
+
+def test_numpy():
+    np = pytest.importorskip("numpy")
+
+    version = struct.pack("i i i", 1, 2, 3)
+    records = [Record.load(Record._struct().pack(idx, -idx, idx / 2, bool(idx % 2), b"rec", version)) for idx in (0, 1)]
+    dtype = Record.to_dtype()
+    assert dtype.itemsize == Record._get_length()
+    assert dtype["version"] == Version.to_dtype()
+
+    array = Record.to_numpy(records * 50)
+    assert len(array) == 100
+    assert array["score"][1] == 0.5
+    assert array["name"][0] == b"rec"
+    assert array["version"]["minor"][1] == 2
+
+    active = array[array["active"]]
+    assert len(active) == 50
+    loaded = Record.from_numpy(active)
+    assert loaded[0]._pack() == records[1]._pack()
+    assert loaded[0].name == "rec"
+
+    # only the layout matters:
+    assert Record.from_numpy(np.frombuffer(Record.pack_many(records), dtype=np.uint8))[1].small == -1
+
+    with pytest.raises(ValueError):
+        Record.from_numpy(np.zeros(2, dtype=[("id", "i8")]))
+
+
+def test_without_numpy(monkeypatch):
+    import sys
+
+    monkeypatch.setitem(sys.modules, "numpy", None)
+
+    with pytest.raises(ImportError, match="pip install"):
+        Record.to_dtype()
+
+    # the struct path still works:
+    assert list(Record.iter_unpack(Record.pack_many([]))) == []
+
+
+@compact
+class CompactRecord(BinaryConfig):
+    id = BinaryField(int, format="q")
+    name = BinaryField(str, length=6)
+    version = BinaryField(Version)
+
+
+def test_compact():
+    packed = struct.pack("q 6s", 1, b"first") + struct.pack("i i i", 1, 2, 3)
+    record = CompactRecord.load(packed)
+
+    assert not hasattr(record, "__dict__")
+    assert isinstance(record, BinaryConfig)
+    assert CompactRecord.__name__ == "CompactRecord"
+    assert record.name == "first"
+    assert record.version.patch == 3
+    assert record._pack() == packed
+
+    with pytest.raises(AttributeError):
+        record.other = 1
+
+    record.id = 2
+    records = list(CompactRecord.iter_unpack(CompactRecord.pack_many([record, record])))
+    assert [r.id for r in records] == [2, 2]
+    assert configuraptor.asdict(records[0]) == {
+        "compact_record": {"id": 2, "name": "first", "version": {"major": 1, "minor": 2, "patch": 3}}
+    }
+
+    with pytest.raises(TypeError):
+        compact(JsonField)
+
+
+class Misaligned(BinaryConfig):
+    flag = BinaryField(bool)
+    version = BinaryField(Version)
+
+
+def test_layout():
+    layout = Versions.layout()
+    assert layout.size == Versions._get_length() == 24
+    assert layout.offsets == (0, 12)
+    assert all(layout.inlined)
+    assert layout.flat.format == "1i 1i 1i 1i 1i 1i"
+    assert layout.table()[:3] == [("first", 0, 12, "12s"), ("first.major", 0, 4, "1i"), ("first.minor", 4, 4, "1i")]
+    assert layout.table()[-1] == ("second.patch", 20, 4, "1i")
+
+    # inlining the ints would align them differently:
+    packed = struct.pack("? 12s", True, struct.pack("i i i", 1, 2, 3))
+    assert Misaligned.layout().size == 13
+    assert not any(Misaligned.layout().inlined)
+    inst = Misaligned.load(packed)
+    assert inst.version.minor == 2
+    assert inst._pack() == packed
+    assert list(Misaligned.iter_unpack(packed * 2))[1].version.patch == 3
+
+    # a replaced nested config can't be packed inline (note: this resizes the class):
+    class Pair(BinaryConfig):
+        first = BinaryField(Version)
+        second = BinaryField(Version)
+
+    pair = Pair.load(struct.pack("i i i", 1, 2, 3) * 2)
+    layout = Pair.layout()
+    pair.second = IsNumber.load(struct.pack("h", 4))
+    assert Pair.layout() is not layout
+    assert pair._pack() == struct.pack("i i i h", 1, 2, 3, 4)
+
+
+class LazyRecord(BinaryConfig, lazy=True):
+    id = BinaryField(int, format="q")
+    data = BinaryField(JsonField, format="json", length=32)
+    version = BinaryField(Version)
+
+
+@compact
+class CompactLazyRecord(BinaryConfig, lazy=True):
+    id = BinaryField(int, format="q")
+    data = BinaryField(JsonField, format="json", length=32)
+    version = BinaryField(Version)
+
+
+def test_lazy(monkeypatch):
+    data = struct.pack("32s", json.dumps({"name": "Alex", "age": 42}).encode())
+    packed = struct.pack("q", 1) + data + struct.pack("i i i", 1, 2, 3)
+
+    record = LazyRecord.load(packed)
+    assert "data" not in record.__dict__
+    assert record._pack() is packed
+
+    # only the field that is used is decoded (once):
+    calls = []
+    special = LazyRecord._fields["data"].special
+    monkeypatch.setattr(LazyRecord._fields["data"], "special", lambda value: calls.append(value) or special(value))
+    assert record.id == 1
+    assert calls == []
+    assert record.data.name == record.data.name == "Alex"
+    assert len(calls) == 1
+
+    # untouched fields are packed as they were loaded, changed ones again:
+    record.id = 2
+    record.version.patch = 4
+    assert record._pack() == struct.pack("q", 2) + data + struct.pack("i i i", 1, 2, 4)
+    assert LazyRecord.pack_many([record, LazyRecord.load(packed)]) == record._pack() + packed
+    assert configuraptor.asdict(record)["lazy_record"]["version"] == {"major": 1, "minor": 2, "patch": 4}
+
+    # regular instances are not affected:
+    assert isinstance(LazyRecord().id, type(LazyRecord._fields["id"]))
+    assert "id" in Record.load(Record.pack_many([Record.load(bytes(Record._get_length()))])).__dict__
+
+    compact_records = list(CompactLazyRecord.iter_unpack(memoryview(packed * 3)))
+    assert [r.version.minor for r in compact_records] == [2, 2, 2]
+    assert compact_records[0]._pack() == packed
+    assert not hasattr(compact_records[0], "__dict__")
+    with pytest.raises(AttributeError):
+        compact_records[0].other
+
+    with pytest.raises(struct.error):
+        LazyRecord.from_buffer(packed, offset=1)
@@ -64,6 +64,30 @@ def test_all_annotations():
     assert set(all_annotations(Sub, {"has_also"}).keys()) == {"has"}
 
 
+def test_all_annotations_cache():
+    from src.configuraptor.helpers import ANNOTATIONS
+
+    class Cached(Base):
+        other: typing.Annotated[str, "meta"]
+
+    misses = ANNOTATIONS.info().misses
+    hits = ANNOTATIONS.info().hits
+
+    first = all_annotations(Cached)
+    assert first == {"has": int, "other": str}
+    # the returned dict is a copy, so the cache can't be corrupted:
+    first["other"] = int
+
+    assert all_annotations(Cached) == {"has": int, "other": str}
+    assert all_annotations(Cached, {"has"}) == {"other": str}
+    assert ANNOTATIONS.info().misses == misses + 1
+    assert ANNOTATIONS.info().hits == hits + 2
+
+    Cached.__annotations__["extra"] = bool
+    ANNOTATIONS.invalidate(Cached)
+    assert "extra" in all_annotations(Cached)
+
+
 def test_no_data():
     from src import configuraptor
 
@@ -82,6 +106,40 @@ def test_no_data():
     configuraptor.core.load_data({"-": 0, "+": None}, key=None, classname="-.+")
 
 
+def test_key_fallback_reuses_parsed_data(monkeypatch):
+    from src.configuraptor import core
+
+    fetched = []
+    fetch = core._fetch_data
+
+    def counting_fetch(data):
+        fetched.append(data)
+        return fetch(data)
+
+    monkeypatch.setattr(core, "_fetch_data", counting_fetch)
+
+    seen = []
+    hook = core.KEY_FALLBACK.register(lambda data, key, e: seen.append((key, type(e))))
+    core.KEY_FALLBACK.reset()
+    try:
+        url = 'mock://{"first": 1, "second": 2}'
+        assert core.load_data(url, key="missing") == {"first": 1, "second": 2}
+        # 'first' is not a dict -> fallback as well:
+        assert core.load_data(url, key="first") == {"first": 1, "second": 2}
+
+        assert len(fetched) == 2
+        assert core.KEY_FALLBACK.count == 2
+        assert seen == [("missing", ValueError), ("first", ValueError)]
+
+        # unparseable data is not retried:
+        with pytest.warns(UserWarning):
+            assert core.load_data("mock://{invalid", key="missing") == {}
+        assert core.KEY_FALLBACK.count == 2
+    finally:
+        core.KEY_FALLBACK.hooks.remove(hook)
+        core.KEY_FALLBACK.reset()
+
+
 def test_str_to_none():
     assert str_to_none("null") == str_to_none("none") == str_to_none("None") == str_to_none("") == None
 
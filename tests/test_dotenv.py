@@ -182,3 +182,47 @@ def test_expand_env_vars():
     expand_env_vars_into_toml_values(data, {"myvalue": "789"})
     assert data["myvar"] is None
     assert data["mynumber"] == 123
+
+
+def test_dotenv_cache(tmp_path, monkeypatch):
+    from src.configuraptor import env
+
+    env.invalidate()
+    parsed = []
+    parse = env._dotenv_values
+    monkeypatch.setattr(env, "_dotenv_values", lambda dotenv_path: parsed.append(dotenv_path) or parse(dotenv_path))
+    monkeypatch.delenv("CACHED_VAR", raising=False)
+
+    dotenv_file = tmp_path / ".env"
+    dotenv_file.write_text("CACHED_VAR=first\n")
+    (tmp_path / "sub").mkdir()
+
+    with chdir(tmp_path / "sub"):
+        assert env.env_for("dotenv") == {"CACHED_VAR": "first"}
+        # same .env and os.environ: the same env is used again, without parsing the file again
+        assert env.env_for("yes") is env.env_for("yes")
+        assert EnvConfig.load({"env_config": {"from_my_env": "$cached_var"}}).from_my_env == "first"
+        assert len(parsed) == 1
+
+        dotenv_file.write_text("CACHED_VAR=second value\n")
+        assert env.env_for("yes")["CACHED_VAR"] == "second value"
+
+        monkeypatch.setenv("CACHED_VAR", "from environ")
+        assert env.env_for("yes")["CACHED_VAR"] == "from environ"
+        assert env.env_for("inverse")["CACHED_VAR"] == "second value"
+        assert len(parsed) == 2
+
+        # a new .env in the cwd itself is picked up:
+        (tmp_path / "sub" / ".env").write_text("CACHED_VAR=sub\n")
+        assert env.dotenv_values() == {"CACHED_VAR": "sub"}
+        # still available in core (as a copy, since the cached dict is shared):
+        values = configuraptor.core.dotenv_values()
+        assert values == {"CACHED_VAR": "sub"}
+        assert values is not env.dotenv_values()
+
+    with chdir(tmp_path):
+        env.invalidate()
+        assert env.dotenv_values() == {"CACHED_VAR": "second value"}
+        assert len(parsed) == 4
+
+    assert env.env_for("no") is None
@@ -0,0 +1,144 @@
+import copy
+
+import pytest
+from expandvars import expand
+
+from src.configuraptor import TypedConfig, apply_patch, asdict, load_into
+from src.configuraptor import env as env_module
+from src.configuraptor.errors import ConfigErrorInvalidType
+from src.configuraptor.env import (
+    ENV_VIEWS,
+    TEMPLATES,
+    case_insensitive_view,
+    compile_template,
+    expand_string,
+    expand_values,
+)
+
+ENV = {"A": "x", "EMPTY": "", "NONE": None, "lower": "low", "ZERO": 0}
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        "plain",
+        "$A",
+        "${A}",
+        "$A$A and ${A}b",
+        "$A-b $A.b $Ab",
+        "${A:-d} ${EMPTY:-d} ${EMPTY-d} ${MISSING-d} ${MISSING:-} ${NONE:-d} ${ZERO:-d}",
+        "$NONE ${NONE} $MISSING",
+        "${MISSING:-x:y} ${MISSING:-a b}",
+        # not compiled, but expanded by expandvars:
+        "${MISSING:-${A}}",
+        "${A:+alt}",
+        "\\$A",
+        "cost: $5",
+        "a $ b",
+        "$AÄ",
+    ],
+)
+def test_same_as_expandvars(template):
+    assert expand_string(template, ENV) == expand(template, environ=ENV)
+
+
+def test_compiled_once():
+    TEMPLATES.clear()
+    assert compile_template("${A} and ${B}") is compile_template("${A} and ${B}")
+    assert TEMPLATES.info().misses == 1
+
+    assert not compile_template("${A}").fallback
+    assert compile_template("${A:?error}").fallback
+
+    with pytest.warns(DeprecationWarning):
+        assert expand_string("${MISSING:legacy default}", ENV) == "legacy default"
+
+
+def test_expand_values(monkeypatch):
+    data = {
+        "plain": "nothing to do",
+        "upper": "$LOWER",
+        "nested": {"list": ["${a}", 1, "no vars"], "number": 3, "other": ["x"]},
+    }
+    other = data["nested"]["other"]
+
+    expand_values(data, ENV)
+    assert data == {
+        "plain": "nothing to do",
+        "upper": "low",
+        "nested": {"list": ["x", 1, "no vars"], "number": 3, "other": ["x"]},
+    }
+    # lists without placeholders are kept as-is:
+    assert data["nested"]["other"] is other
+
+    # strings without '$' are never compiled:
+    monkeypatch.setattr(env_module, "compile_template", None)
+    expand_values({"key": "value", "list": ["a", "b"]}, ENV)
+
+
+def test_case_insensitive_view():
+    ENV_VIEWS.clear()
+    view = case_insensitive_view({"Key": "value"})
+    assert view == {"Key": "value", "KEY": "value", "key": "value"}
+    assert case_insensitive_view({"Key": "value"}) is view
+
+    # a changed environment gets a new view:
+    assert case_insensitive_view({"Key": "other"})["key"] == "other"
+    assert ENV_VIEWS.info().currsize == 2
+
+    # unhashable values can't be cached:
+    assert case_insensitive_view({"Key": ["value"]})["KEY"] == ["value"]
+    assert ENV_VIEWS.info().currsize == 2
+
+
+class Nested:
+    url: str
+
+
+class LazyConfig(TypedConfig, lazy_env=True):
+    host: str
+    port: int
+    name: str
+    nested: Nested
+
+
+def test_lazy_env(monkeypatch):
+    monkeypatch.setenv("LAZY_HOST", "localhost")
+    monkeypatch.setenv("LAZY_PORT", "8000")
+    data = {"host": "${LAZY_HOST}", "port": "$LAZY_PORT", "name": "plain", "nested": {"url": "http://$LAZY_HOST"}}
+
+    config = LazyConfig.load(data, use_env="environ", convert_types=True)
+    # nested values are still expanded while loading:
+    assert config.nested.url == "http://localhost"
+    assert isinstance(config.__dict__["host"], env_module.LazyEnv)
+    assert data["host"] == "${LAZY_HOST}"
+
+    assert config.host == "localhost"
+    assert config.port == 8000
+
+    # memoised until refresh_env:
+    monkeypatch.setenv("LAZY_HOST", "example.com")
+    assert config.host == "localhost"
+    assert config.refresh_env() is config
+    assert config.host == "example.com"
+    assert config._format("{host}:{port}") == "example.com:8000"
+    assert asdict(config, with_top_level_key=False)["port"] == 8000
+
+    # derived configs have their own (memoised) values:
+    for derived in (config | {"name": "derived"}, apply_patch(config, {"name": "derived"}), copy.copy(config)):
+        monkeypatch.setenv("LAZY_HOST", "derived.com")
+        assert derived.refresh_env().host == "derived.com"
+        assert config.host == "example.com"
+        monkeypatch.setenv("LAZY_HOST", "example.com")
+
+    # overwriting a lazy value replaces it:
+    config.host = "other"
+    assert config.host == "other"
+
+    # types are checked when a value is used:
+    config = load_into(LazyConfig, data, use_env="environ")
+    with pytest.raises(ConfigErrorInvalidType):
+        config.port
+
+    # without env, nothing is deferred:
+    assert load_into(LazyConfig, data, use_env="no", strict=False).host == "${LAZY_HOST}"
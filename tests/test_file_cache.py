@@ -0,0 +1,138 @@
+import os
+
+import pytest
+
+from src.configuraptor import TypedConfig, loader, loaders
+from src.configuraptor import helpers
+from src.configuraptor.core import FILE_CACHE, PYPROJECT_CACHE
+
+PARSED: list[str] = []
+
+
+@loader("counted")
+def counted(f, fullpath):
+    PARSED.append(str(fullpath))
+    return loaders.toml(f, fullpath)
+
+
+class First(TypedConfig):
+    numbers: list[int]
+
+
+class Second(TypedConfig):
+    name: str
+
+
+@pytest.fixture
+def file_cache():
+    FILE_CACHE.resize(8)
+    FILE_CACHE.clear()
+    PARSED.clear()
+    yield FILE_CACHE
+    FILE_CACHE.resize(0)
+    FILE_CACHE.clear()
+
+
+def test_sections_share_one_parse(file_cache, tmp_path):
+    path = tmp_path / "settings.counted"
+    path.write_text('[first]\nnumbers = [1, 2]\n\n[second]\nname = "${NOT_SET:-fallback}"\n')
+
+    first = First.load(path)
+    second = Second.load(path)
+    assert First.load(str(path)) == first
+
+    assert first.numbers == [1, 2]
+    assert second.name == "fallback"
+    assert len(PARSED) == 1
+    assert file_cache.info().hits == 2
+
+    # changing the loaded data does not change the cached document:
+    first.numbers.append(3)
+    assert First.load(path).numbers == [1, 2]
+
+    # the template is still in the cache, env expansion happened on a copy:
+    os.environ["NOT_SET"] = "now set"
+    try:
+        assert Second.load(path).name == "now set"
+    finally:
+        del os.environ["NOT_SET"]
+
+    assert len(PARSED) == 1
+
+
+def test_changed_file_is_parsed_again(file_cache, tmp_path):
+    path = tmp_path / "settings.counted"
+    path.write_text('[second]\nname = "before"\n')
+    assert Second.load(path).name == "before"
+
+    path.write_text('[second]\nname = "after, with a different size"\n')
+    assert Second.load(path).name == "after, with a different size"
+    assert len(PARSED) == 2
+
+
+def test_lru_bound(file_cache, tmp_path):
+    file_cache.resize(1)
+    first, second = tmp_path / "first.counted", tmp_path / "second.counted"
+    first.write_text('[second]\nname = "first"\n')
+    second.write_text('[second]\nname = "second"\n')
+
+    Second.load(first)
+    Second.load(second)
+    Second.load(first)
+
+    assert len(PARSED) == 3
+    assert file_cache.info().currsize == 1
+
+
+def test_disabled_by_default(tmp_path):
+    path = tmp_path / "settings.counted"
+    path.write_text('[second]\nname = "uncached"\n')
+    PARSED.clear()
+
+    Second.load(path)
+    Second.load(path)
+
+    assert len(PARSED) == 2
+    assert FILE_CACHE.info().currsize == 0
+
+
+def test_pyproject_found_and_parsed_once(tmp_path, monkeypatch):
+    project = tmp_path / "project"
+    workdir = project / "src" / "package"
+    workdir.mkdir(parents=True)
+    pyproject = project / "pyproject.toml"
+    pyproject.write_text('[tool.first]\nnumbers = [1]\n\n[tool.second]\nname = "project"\n')
+    monkeypatch.chdir(workdir)
+
+    walks = []
+    walk = helpers._walk_to_pyproject_toml
+    monkeypatch.setattr(helpers, "_walk_to_pyproject_toml", lambda start: walks.append(start) or walk(start))
+    helpers.PYPROJECT_PATHS.clear()
+    PYPROJECT_CACHE.clear()
+
+    assert First.load(key="tool.first").numbers == [1]
+    assert Second.load(key="tool.second").name == "project"
+    assert Second.load(key="tool.second").name == "project"
+    assert len(walks) == 1
+    assert PYPROJECT_CACHE.info().currsize == 1
+    assert PYPROJECT_CACHE.info().hits == 2
+
+    # a pyproject.toml in the start dir itself changes its mtime:
+    closer = workdir / "pyproject.toml"
+    closer.write_text('[tool.second]\nname = "package"\n')
+    assert helpers.find_pyproject_toml() == closer
+    assert Second.load(key="tool.second").name == "package"
+
+    # and removing it again too:
+    closer.unlink()
+    assert helpers.find_pyproject_toml(".") == pyproject
+
+    # a pyproject.toml in one of the searched parents is noticed as well:
+    walks.clear()
+    assert helpers.find_pyproject_toml() == pyproject
+    assert len(walks) == 0
+    between = project / "src" / "pyproject.toml"
+    between.write_text('[tool.second]\nname = "src"\n')
+    assert helpers.find_pyproject_toml() == between
+    assert len(walks) == 1
+    assert helpers.find_pyproject_toml(tmp_path / "missing") is None
@@ -0,0 +1,166 @@
+import json
+import threading
+import typing
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.configuraptor import load_into
+from src.configuraptor.remote import HTTP, HttpClient
+
+
+class Configuration:
+    color: str
+    width: int
+
+
+class ConfigServer(ThreadingHTTPServer):
+    body: typing.ClassVar[dict[str, typing.Any]] = {"color": "green", "width": 15}
+    cache_control = "no-cache"
+    requests: list[dict[str, str]]
+    not_modified: int
+
+    @property
+    def etag(self) -> str:
+        return f'"{hash(json.dumps(self.body))}"'
+
+
+class Handler(BaseHTTPRequestHandler):
+    server: ConfigServer
+
+    def do_GET(self):
+        self.server.requests.append(dict(self.headers))
+
+        if self.headers.get("If-None-Match") == self.server.etag:
+            self.server.not_modified += 1
+            self.send_response(304)
+            self.send_header("Cache-Control", self.server.cache_control)
+            self.end_headers()
+            return
+
+        body = json.dumps(self.server.body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", self.server.etag)
+        self.send_header("Cache-Control", self.server.cache_control)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ConfigServer(("127.0.0.1", 0), Handler)
+    httpd.requests = []
+    httpd.not_modified = 0
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    HTTP.clear()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+    HTTP.clear()
+
+
+def _url(server) -> str:
+    host, port = server.server_address
+    return f"http://{host}:{port}/config"
+
+
+def test_etag_revalidation(server):
+    url = _url(server)
+
+    first = load_into(Configuration, url)
+    second = load_into(Configuration, url)
+
+    assert first.color == second.color == "green"
+    assert len(server.requests) == 2
+    assert server.not_modified == 1
+    assert server.requests[1]["If-None-Match"] == server.etag
+
+    # changes on the server are picked up:
+    server.body = {"color": "blue", "width": 15}
+    assert load_into(Configuration, url).color == "blue"
+    assert server.not_modified == 1
+
+
+def test_max_age(server):
+    server.cache_control = "max-age=60"
+    url = _url(server)
+
+    load_into(Configuration, url)
+    server.body = {"color": "blue", "width": 15}
+
+    # still fresh, so no request is done:
+    assert load_into(Configuration, url).color == "green"
+    assert len(server.requests) == 1
+
+
+def test_no_store(server):
+    server.cache_control = "no-store"
+    url = _url(server)
+
+    load_into(Configuration, url)
+    load_into(Configuration, url)
+
+    assert server.not_modified == 0
+    assert "If-None-Match" not in server.requests[1]
+
+
+def test_disk_cache(server, tmp_path):
+    url = _url(server)
+
+    first_run = HttpClient(cache_dir=tmp_path)
+    assert json.loads(first_run.get(url).text)["color"] == "green"
+
+    # e.g. after a restart:
+    second_run = HttpClient(cache_dir=tmp_path, pool_size=2)
+    assert second_run.get(url).text == first_run.get(url).text
+    assert server.not_modified == 2
+
+    # server down -> stale cached response is used:
+    server.shutdown()
+    server.server_close()
+    third_run = HttpClient(cache_dir=tmp_path)
+    assert json.loads(third_run.get(url).text)["width"] == 15
+
+    third_run.clear()
+    assert not list(tmp_path.glob("*.json"))
+
+
+def test_timeout_uses_stale_cache(server, monkeypatch):
+    import requests
+
+    url = _url(server)
+    client = HttpClient()
+    assert json.loads(client.get(url).text)["color"] == "green"
+
+    def slow_server(*_, **__):
+        raise requests.ReadTimeout("too slow")
+
+    monkeypatch.setattr(client.session, "get", slow_server)
+    assert json.loads(client.get(url).text)["color"] == "green"
+
+    # no cached copy -> the timeout is raised:
+    uncached = HttpClient()
+    monkeypatch.setattr(uncached.session, "get", slow_server)
+    with pytest.raises(requests.Timeout):
+        uncached.get(url)
+
+
+def test_memory_cache_is_bounded(server):
+    url = _url(server)
+    client = HttpClient(memory_size=2)
+
+    for idx in range(5):
+        client.get(f"{url}?page={idx}")
+
+    assert client._memory.info().currsize == 2
+    assert client._memory.get(f"{url}?page=4")
+    assert not client._memory.get(f"{url}?page=0")
+
+    client.configure(memory_size=1)
+    assert client._memory.info().currsize == 1
@@ -0,0 +1,47 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).parent.parent
+HEAVY = (
+    "requests",
+    "yaml",
+    "pyjson5",
+    "tomli",
+    "tomli_w",
+    "dotenv",
+    "expandvars",
+    "typeguard",
+    "asyncio",
+    "concurrent.futures",
+)
+
+
+def imported_after(code: str) -> set[str]:
+    check = f"{code}\nimport sys\nprint(' '.join(m for m in {HEAVY!r} if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", check], cwd=ROOT, capture_output=True, text=True, check=True)
+    return set(result.stdout.split())
+
+
+def test_import_is_light():
+    assert imported_after("import src.configuraptor") == set()
+
+
+@pytest.mark.parametrize(
+    "code, expected",
+    [
+        ("configuraptor.load_data({'key': 'value'}, use_env='no')", set()),
+        ("configuraptor.load_data('pyproject.toml', use_env='no')", {"tomli"}),
+        ("configuraptor.load_data('examples/example_from_readme.yaml', use_env='no')", {"yaml"}),
+        ("configuraptor.asjson(object())", set()),
+        ("configuraptor.asyaml(object())", {"yaml"}),
+        ("configuraptor.check_type(1, int)", set()),
+        # (typeguard imports asyncio itself, which imports concurrent.futures)
+        ("configuraptor.check_type((1,), tuple[int])", {"typeguard", "asyncio", "concurrent.futures"}),
+        ("configuraptor.load_data(configuraptor.Sources([{'key': 'value'}]), use_env='no')", {"concurrent.futures"}),
+    ],
+)
+def test_dependencies_are_imported_on_first_use(code, expected):
+    assert imported_after(f"from src import configuraptor\n{code}") == expected
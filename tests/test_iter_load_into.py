@@ -0,0 +1,98 @@
+import io
+import json
+
+import pytest
+
+from src.configuraptor import TypedConfig, iter_load_into, load_many
+from src.configuraptor.errors import ConfigErrorInvalidType
+from src.configuraptor.loaders import records
+from src.configuraptor.loaders.records import iter_records, register_record_loader
+
+
+class Limits(TypedConfig):
+    users: int
+
+
+class Tenant(TypedConfig):
+    name: str
+    limits: Limits
+
+
+RECORDS = [{"name": f"tenant-{idx}", "limits": {"users": idx}} for idx in range(5)]
+
+
+def test_jsonl(tmp_path):
+    path = tmp_path / "tenants.jsonl"
+    path.write_text("\n".join(json.dumps(record) for record in RECORDS) + "\n\n")
+
+    tenants = iter_load_into(Tenant, path)
+    assert not isinstance(tenants, list)
+
+    assert next(tenants) == Tenant.load(RECORDS[0], key="")
+    assert [tenant.limits.users for tenant in tenants] == [1, 2, 3, 4]
+
+    assert list(iter_load_into(Tenant, str(path))) == load_many(Tenant, RECORDS)
+
+
+def test_multi_document_yaml(tmp_path):
+    path = tmp_path / "tenants.yaml"
+    path.write_text(
+        """
+tenant:
+  name: first
+  limits:
+    users: 1
+---
+---
+tenant:
+  name: second
+  limits:
+    users: 2
+"""
+    )
+
+    tenants = list(iter_load_into(Tenant, path, key="tenant"))
+    assert [tenant.name for tenant in tenants] == ["first", "second"]
+    assert tenants[1].limits.users == 2
+
+
+def test_streams():
+    text = io.StringIO("\n".join(json.dumps(record) for record in RECORDS))
+    assert len(list(iter_load_into(Tenant, text, extension="jsonl"))) == 5
+
+    binary = io.BytesIO(b"name: first\nlimits: {users: 1}\n---\nname: second\nlimits: {users: 2}\n")
+    assert [tenant.name for tenant in iter_load_into(Tenant, binary, extension=".yml")] == ["first", "second"]
+
+    with pytest.raises(ValueError):
+        # no extension to be found
+        iter_load_into(Tenant, io.BytesIO(b""))
+
+
+def test_lazy():
+    def records():
+        yield RECORDS[0]
+        yield {"name": "invalid", "limits": {"users": "many"}}
+
+    stream = io.StringIO("\n".join(json.dumps(record) for record in records()))
+    tenants = iter_load_into(Tenant, stream, extension="jsonl")
+
+    assert next(tenants).name == "tenant-0"
+    # the second line has not been read yet:
+    assert stream.tell() < len(stream.getvalue())
+
+    with pytest.raises(ConfigErrorInvalidType):
+        next(tenants)
+
+
+def test_register_record_loader(monkeypatch):
+    monkeypatch.setattr(records, "RECORD_LOADERS", dict(records.RECORD_LOADERS))
+
+    @register_record_loader(".csv")
+    def csv(f):
+        for line in f:
+            name, users = line.strip().split(",")
+            yield {"name": name, "limits": {"users": int(users)}}
+
+    assert records.RECORD_LOADERS["csv"] is csv
+    rows = list(iter_records(io.StringIO("first,1\nsecond,2\n"), "csv"))
+    assert rows[1] == {"name": "second", "limits": {"users": 2}}
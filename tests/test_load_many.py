@@ -0,0 +1,85 @@
+import dataclasses
+import typing
+
+import pytest
+
+from src.configuraptor import TypedConfig, alias, load_into, load_many, postpone
+from src.configuraptor.errors import ConfigErrorInvalidType, ConfigErrorMissingKey
+
+
+class Limits(TypedConfig):
+    users: int
+
+
+class Tenant(TypedConfig):
+    name: str
+    active: bool = True
+    limits: Limits
+    tags: list[str]
+    later: str = postpone()
+    title: str = alias("name")
+
+
+@dataclasses.dataclass
+class Row:
+    id: int
+    value: typing.Optional[float] = None
+
+
+class WithInit:
+    name: str
+    number: int
+
+    def __init__(self):
+        self.name = "from init"
+
+
+RECORDS = [
+    {"name": f"tenant-{idx}", "limits": {"users": idx}, "tags": ["a"], "active": bool(idx % 2)} for idx in range(50)
+]
+
+
+def test_load_many():
+    tenants = load_many(Tenant, RECORDS)
+
+    assert len(tenants) == 50
+    assert tenants == [load_into(Tenant, record, key="") for record in RECORDS]
+    assert tenants[3].limits.users == 3
+    assert tenants[3].title == "tenant-3"
+    assert tenants[0].active is False
+
+    lazy = load_many(Tenant, iter(RECORDS), lazy=True)
+    assert not isinstance(lazy, list)
+    assert next(lazy) == tenants[0]
+    assert list(lazy) == tenants[1:]
+
+
+def test_load_many_other_classes():
+    rows = load_many(Row, [{"id": 1}, {"id": 2, "value": 2.5}])
+    assert rows == [Row(1), Row(2, 2.5)]
+
+    with_init = load_many(WithInit, [{"number": 1}, {"number": 2, "name": "ignored"}])
+    assert [(inst.name, inst.number) for inst in with_init] == [("from init", 1), ("from init", 2)]
+
+
+def test_load_many_options(monkeypatch):
+    monkeypatch.setenv("TENANT_NAME", "from env")
+
+    records = [{"Tenant": {"Name": "${TENANT_NAME}", "Limits": {"users": "5"}, "Tags": []}}]
+    (tenant,) = load_many(Tenant, records, key="Tenant", lower_keys=True, convert_types=True)
+    assert tenant.name == "from env"
+    assert tenant.limits.users == 5
+
+    (tenant,) = load_many(Tenant, [{"name": "${TENANT_NAME}", "limits": {"users": 1}, "tags": []}], use_env="no")
+    assert tenant.name == "${TENANT_NAME}"
+
+
+def test_load_many_errors():
+    with pytest.raises(ConfigErrorInvalidType):
+        load_many(Row, [{"id": 1}, {"id": "two"}])
+
+    with pytest.raises(ConfigErrorMissingKey):
+        load_many(Row, [{"value": 1.0}])
+
+    # not strict:
+    assert load_many(Row, [{"id": "two"}], strict=False) == [Row("two")]
@@ -0,0 +1,137 @@
+import copy
+import typing
+
+import pytest
+
+from src.configuraptor import DELETED, TypedConfig, TypedMapping, apply_patch, diff, load_into
+from src.configuraptor.errors import ConfigErrorExtraKey, ConfigErrorImmutable, ConfigErrorInvalidType
+
+
+class Tenant(TypedConfig):
+    name: str
+    limits: dict[str, int]
+
+
+class Database(TypedConfig):
+    host: str
+    port: int
+
+
+class Settings(TypedConfig):
+    debug: bool
+    tenant: Tenant
+    database: Database
+    extra: typing.Optional[str] = None
+
+
+class Plain:
+    level: int
+    database: Database
+
+
+class Frozen(TypedMapping):
+    name: str
+    database: Database
+
+
+@pytest.fixture
+def settings():
+    return Settings.load(
+        {
+            "debug": False,
+            "tenant": {"name": "default", "limits": {"users": 10}},
+            "database": {"host": "localhost", "port": 5432},
+        }
+    )
+
+
+def test_diff(settings):
+    assert diff(settings, settings) == {}
+    assert diff(settings, copy.deepcopy(settings)) == {}
+
+    other = copy.deepcopy(settings)
+    other.database.port = 1234
+    other.debug = True
+    del other.__dict__["extra"]
+    assert diff(settings, other) == {"database.port": 1234, "debug": True, "extra": DELETED}
+
+    other.tenant = Tenant.load({"name": "other", "limits": {"users": 10}})
+    assert diff(settings, other)["tenant.name"] == "other"
+    assert "tenant.limits" not in diff(settings, other)
+
+
+def test_apply_patch(settings):
+    patched = apply_patch(settings, {"database.port": 1234, "debug": True})
+
+    assert patched.database.port == 1234
+    assert patched.debug is True
+    # original is untouched:
+    assert settings.database.port == 5432
+    assert settings.debug is False
+
+    # untouched subtrees are shared, changed ones are new:
+    assert patched.tenant is settings.tenant
+    assert patched.database is not settings.database
+    assert patched.database.host is settings.database.host
+
+    # roundtrip:
+    assert diff(settings, patched) == {"database.port": 1234, "debug": True}
+    assert apply_patch(settings, diff(settings, patched)) == patched
+
+    removed = apply_patch(settings, {"extra": DELETED})
+    assert "extra" not in removed.__dict__
+
+    replaced = apply_patch(settings, {"database": Database.load({"host": "remote", "port": 1}), "database.port": 2})
+    assert replaced.database.host == "remote"
+    assert replaced.database.port == 2
+
+
+def test_apply_patch_checks_types(settings):
+    with pytest.raises(ConfigErrorInvalidType):
+        apply_patch(settings, {"database.port": "not a number"})
+
+    assert apply_patch(settings, {"database.port": "1"}, _convert_types=True).database.port == 1
+
+    with pytest.raises(ConfigErrorExtraKey):
+        apply_patch(settings, {"debug.nested": 1})
+
+    with pytest.raises(ConfigErrorExtraKey):
+        apply_patch(settings, {"unknown": 1})
+
+
+def test_or_copies_values(settings):
+    updated = settings | {"debug": True}
+
+    assert updated.debug and not settings.debug
+    assert diff(settings, updated) == {"debug": True}
+
+    # modifying the result of | in place doesn't change the original:
+    updated.tenant.name = "changed"
+    updated.tenant.limits["users"] = 1
+    assert settings.tenant.name == "default"
+    assert settings.tenant.limits == {"users": 10}
+
+    # apply_patch shares the unchanged values instead:
+    patched = apply_patch(settings, {"debug": True})
+    assert patched.tenant is settings.tenant
+
+
+def test_other_classes():
+    plain = load_into(Plain, {"level": 1, "database": {"host": "localhost", "port": 5432}})
+    patched = apply_patch(plain, {"level": 2, "database.port": 1})
+
+    assert isinstance(patched, Plain)
+    assert patched.level == 2
+    assert patched.database.port == 1
+    assert plain.database.port == 5432
+    assert diff(plain, patched) == {"level": 2, "database.port": 1}
+
+    frozen = Frozen.load({"name": "frozen", "database": {"host": "localhost", "port": 5432}})
+    with pytest.raises(ConfigErrorImmutable):
+        frozen | {"name": "changed"}
+
+    # but a new immutable config can be derived:
+    derived = apply_patch(frozen, {"name": "derived"})
+    assert derived["name"] == "derived"
+    assert frozen["name"] == "frozen"
+    assert derived["database"] is frozen["database"]
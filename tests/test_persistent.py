@@ -0,0 +1,144 @@
+import copy
+import pickle
+import random
+
+import pytest
+
+from src.configuraptor import PersistentTypedMapping, TypedConfig, apply_patch, asdict, diff
+from src.configuraptor.errors import ConfigErrorExtraKey, ConfigErrorImmutable, ConfigErrorInvalidType
+from src.configuraptor.persistent import PersistentMap
+
+
+class Colliding:
+    def __init__(self, value):
+        self.value = value
+
+    def __hash__(self):
+        return 42
+
+    def __eq__(self, other):
+        return isinstance(other, Colliding) and other.value == self.value
+
+
+def test_persistent_map():
+    rng = random.Random(0)
+    expected = {}
+    data = PersistentMap()
+    for _ in range(5000):
+        key = rng.randint(0, 2000)
+        if key in expected and rng.random() < 0.3:
+            previous = data
+            data = data.delete(key)
+            del expected[key]
+            assert key in previous
+        else:
+            data = data.set(key, rng.random())
+            expected[key] = data[key]
+
+        assert len(data) == len(expected)
+
+    assert data == expected
+    assert dict(data.items()) == expected
+    assert set(data) == set(expected)
+
+    with pytest.raises(KeyError):
+        data.delete(-1)
+    with pytest.raises(KeyError):
+        data[-1]
+
+    key = next(iter(data))
+    assert data.set(key, data[key]) is data
+    assert PersistentMap({"a": 1}).update({"b": 2}) == {"a": 1, "b": 2}
+    assert repr(PersistentMap({"a": 1})) == "PersistentMap({'a': 1})"
+
+
+def test_hash_collisions():
+    data = PersistentMap((Colliding(idx), idx) for idx in range(10))
+    assert len(data) == 10
+    assert data[Colliding(3)] == 3
+    assert data.set(Colliding(3), 33)[Colliding(3)] == 33
+
+    for idx in range(10):
+        data = data.delete(Colliding(idx))
+    assert len(data) == 0
+    assert list(data) == []
+
+
+def test_changed_keys():
+    first = PersistentMap({str(idx): idx for idx in range(1000)})
+    second = first.set("1", -1).delete("2").set("new", 0)
+
+    changed = set(first.changed_keys(second))
+    # might include a few unchanged keys (of nodes that were restructured), but not the whole map:
+    assert {"1", "2", "new"} <= changed
+    assert len(changed) < 10
+    assert list(first.changed_keys(first)) == []
+
+
+class Database(TypedConfig):
+    host: str
+    port: int
+
+
+class Settings(PersistentTypedMapping):
+    name: str
+    debug: bool = False
+    database: Database
+
+
+@pytest.fixture
+def settings():
+    return Settings.load({"name": "base", "database": {"host": "localhost", "port": 5432}})
+
+
+def test_persistent_typed_mapping(settings):
+    assert settings.name == settings["name"] == "base"
+    assert settings.debug is False
+    assert len(settings) == 3
+    assert set(settings) == {"name", "debug", "database"}
+    assert asdict(settings, with_top_level_key=False)["database"] == {"host": "localhost", "port": 5432}
+    assert "base" in repr(settings)
+
+    with pytest.raises(ConfigErrorImmutable):
+        settings.name = "changed"
+    with pytest.raises(ConfigErrorImmutable):
+        settings.update(name="changed")
+
+
+def test_derive(settings):
+    derived = settings | {"debug": True}
+
+    assert derived.debug is True
+    assert derived["debug"] is True
+    assert settings.debug is False
+    assert derived.database is settings.database
+    assert derived != settings
+    assert derived | {"debug": False} == settings
+
+    with pytest.raises(ConfigErrorInvalidType):
+        settings | {"debug": "yes"}
+    with pytest.raises(ConfigErrorExtraKey):
+        settings | {"unknown": 1}
+
+    assert (settings | {"unknown": 1, "_strict": False})["unknown"] == 1
+
+
+def test_diff_and_patch(settings):
+    patched = apply_patch(settings, {"database.port": 1, "name": "patched"})
+
+    assert patched.database.port == 1
+    assert patched.name == "patched"
+    assert settings.database.port == 5432
+    assert diff(settings, patched) == {"database.port": 1, "name": "patched"}
+    assert diff(settings, settings | {}) == {}
+
+
+def test_copy(settings):
+    assert copy.copy(settings) == settings
+    assert copy.copy(settings).database is settings.database
+
+    deep = copy.deepcopy(settings)
+    assert deep == settings
+    assert deep.database is not settings.database
+
+    assert pickle.loads(pickle.dumps(settings)) == settings
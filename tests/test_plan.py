@@ -0,0 +1,107 @@
+import dataclasses
+import typing
+
+import pytest
+
+from src.configuraptor import Defaultable, alias, load_into
+from src.configuraptor.core import load_recursive
+from src.configuraptor.errors import ConfigErrorMissingKey
+from src.configuraptor.plan import LOAD_PLANS, DefaultSource, FieldKind, load_plan
+
+
+class Point:
+    x: int
+    y: int
+
+
+class WithDefault(Defaultable):
+    value: str = "default"
+
+
+@dataclasses.dataclass
+class Planned:
+    point: Point
+    points: list[Point]
+    named: dict[str, Point]
+    maybe: Point | None
+    defaultable: WithDefault
+    tags: list[str] = dataclasses.field(default_factory=list)
+    name: str = "planned"
+    title: str = alias("name")
+
+
+def test_plan_kinds_and_defaults():
+    plan = load_plan(Planned)
+
+    assert [field.key for field in plan.fields][:5] == ["point", "points", "named", "maybe", "defaultable"]
+
+    assert plan.by_key["point"].kind is FieldKind.CUSTOM
+    assert plan.by_key["points"].kind is FieldKind.LIST
+    assert plan.by_key["named"].kind is FieldKind.DICT
+    assert plan.by_key["maybe"].kind is FieldKind.UNION
+    assert plan.by_key["maybe"].nullable
+    assert plan.by_key["maybe"].subtypes == (Point,)
+
+    assert plan.by_key["point"].default_source is DefaultSource.MISSING
+    assert plan.by_key["maybe"].default_source is DefaultSource.NONE
+    assert plan.by_key["defaultable"].default_source is DefaultSource.DEFAULTABLE
+    assert plan.by_key["tags"].default_source is DefaultSource.FACTORY
+    assert plan.by_key["name"].default_source is DefaultSource.ATTRIBUTE
+    assert plan.by_key["name"].aliases == ("title",)
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        plan.by_key["name"].key = "other"  # type: ignore
+
+    with pytest.raises(TypeError):
+        plan.by_key["name"] = plan.by_key["tags"]  # type: ignore
+
+
+def test_plan_is_executed():
+    inst = load_into(
+        Planned,
+        {
+            "point": {"x": 1, "y": 2},
+            "points": [{"x": 3, "y": 4}],
+            "named": {"origin": {"x": 0, "y": 0}},
+            "title": "from alias",
+        },
+    )
+
+    assert inst.point.y == 2
+    assert inst.points[0].x == 3
+    assert inst.named["origin"].x == 0
+    assert inst.maybe is None
+    assert inst.defaultable.value == "default"
+    assert inst.tags == []
+    assert inst.name == "from alias"
+
+    with pytest.raises(ConfigErrorMissingKey):
+        load_into(Planned, {"points": [], "named": {}})
+
+
+def test_plan_cache_statistics():
+    class Cached:
+        number: int
+
+    LOAD_PLANS.invalidate(Cached)
+    before = LOAD_PLANS.info()
+
+    load_into(Cached, {"number": 1})
+    load_into(Cached, {"number": 2})
+
+    after = LOAD_PLANS.info()
+    assert after.misses == before.misses + 1
+    assert after.hits >= before.hits + 1
+
+    # a redefined class gets its own plan:
+    class Cached:  # type: ignore
+        number: str
+
+    assert load_into(Cached, {"number": "three"}).number == "three"
+    assert LOAD_PLANS.info().misses == after.misses + 1
+
+
+def test_load_recursive_with_custom_annotations():
+    # annotations that differ from the class' own annotations are compiled on the fly:
+    data = load_recursive(Planned, {"name": {"x": 1, "y": 1}}, {"name": typing.cast(type, Point)})
+    assert isinstance(data["name"], Point)
@@ -0,0 +1,113 @@
+import threading
+import time
+
+import pytest
+
+from src.configuraptor import Sources, TypedConfig, load_data, loader, loaders
+from src.configuraptor.errors import FailedToLoad
+
+RUNNING = 0
+MAX_RUNNING = 0
+LOCK = threading.Lock()
+
+
+@loader("slow")
+def slow(f, fullpath):
+    global RUNNING, MAX_RUNNING
+    with LOCK:
+        RUNNING += 1
+        MAX_RUNNING = max(MAX_RUNNING, RUNNING)
+    try:
+        data = loaders.toml(f, fullpath)
+        time.sleep(data.pop("delay", 0.1))
+        return data
+    finally:
+        with LOCK:
+            RUNNING -= 1
+
+
+class Configuration(TypedConfig):
+    name: str
+    first: int
+    last: int
+
+
+@pytest.fixture
+def files(tmp_path):
+    paths = []
+    for idx in range(4):
+        path = tmp_path / f"{idx}.slow"
+        # the first file is the slowest, but its keys must still be overwritten by the later ones:
+        path.write_text(f'delay = {0.3 if idx == 0 else 0.1}\nname = "file {idx}"\nlast = {idx}\n')
+        paths.append(path)
+
+    paths[0].write_text(paths[0].read_text() + "first = 0\n")
+    return paths
+
+
+def test_sources_is_a_list(files):
+    sources = Sources(files, workers=2)
+    assert isinstance(sources, list)
+    assert sources == files
+    assert sources.timings == []
+
+
+def test_load_concurrently(files):
+    global MAX_RUNNING
+    MAX_RUNNING = 0
+
+    sources = Sources(files, workers=4)
+    start = time.perf_counter()
+    inst = Configuration.load(sources)
+    duration = time.perf_counter() - start
+
+    # merged in list order, like a regular list:
+    assert inst.name == "file 3"
+    assert inst.first == 0
+    assert inst.last == 3
+    assert Configuration.load(list(files)) == inst
+
+    # 0.3 + 3 * 0.1 sequentially:
+    assert duration < 0.5
+    assert MAX_RUNNING > 1
+
+    assert [timing.source for timing in sources.timings] == files
+    assert all(timing.seconds >= 0.1 and timing.error is None for timing in sources.timings)
+
+
+def test_bounded_workers(files):
+    global MAX_RUNNING
+    MAX_RUNNING = 0
+
+    Configuration.load(Sources(files, workers=1))
+    assert MAX_RUNNING == 1
+
+
+def test_on_error(files, tmp_path):
+    broken = tmp_path / "broken.slow"
+    broken.write_text("delay = 0\n[invalid")
+
+    # strict (default of load_into) -> raise:
+    with pytest.raises(FailedToLoad):
+        Configuration.load(Sources([*files, broken]))
+
+    # fail fast: the sources that were not started yet are skipped
+    sources = Sources([broken, *files], workers=1, on_error="raise")
+    with pytest.raises(FailedToLoad) as exc:
+        load_data(sources)
+    # the actual (parse) error is kept as the cause:
+    assert exc.value.__cause__ is not None
+    assert not isinstance(exc.value.__cause__, FailedToLoad)
+    assert [timing.source for timing in sources.timings] == [broken]
+    assert isinstance(sources.timings[0].error, FailedToLoad)
+
+    # tolerate failures:
+    sources = Sources([*files, broken], on_error="warn")
+    with pytest.warns(UserWarning):
+        inst = Configuration.load(sources)
+    assert inst.name == "file 3"
+    assert sources.timings[-1].error is not None
+
+    # non-strict follows the existing behavior of warning:
+    with pytest.warns(UserWarning):
+        assert load_data(Sources([broken, {"name": "dict"}]), strict=False) == {"name": "dict"}
@@ -0,0 +1,123 @@
+import io
+import json
+
+import pytest
+import yaml
+
+from src.configuraptor import TypedConfig, load_data, load_into
+from src.configuraptor.loaders.streaming import CHUNK_SIZE, MISSING, STREAMING, stream_json, stream_yaml
+
+DOCUMENT = {
+    "before": {"text": 'tricky "quotes", {braces} and [brackets] \\ é', "list": [1, 2.5, None, True, {"a": []}]},
+    "empty": {},
+    "services": {
+        "web": {"port": 80, "hosts": ["a", "b"]},
+        "api": {"port": 8000, "name": 'api "server"', "nested": {"values": [1, 2, 3]}, "enabled": False},
+        "last": 1,
+    },
+    "after": [{"services": {"api": "not this one"}}],
+}
+
+
+class Api(TypedConfig):
+    port: int
+    name: str
+    nested: dict[str, list[int]]
+    enabled: bool
+
+
+@pytest.fixture
+def enable_streaming():
+    STREAMING.min_size = 0
+    yield STREAMING
+    STREAMING.min_size = None
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, CHUNK_SIZE])
+def test_stream_json(chunk_size):
+    raw = json.dumps(DOCUMENT, indent=2).encode()
+
+    def select(*path, data=raw):
+        return stream_json(io.BytesIO(data), list(path), chunk_size=chunk_size)
+
+    assert select("services", "api") == DOCUMENT["services"]["api"]
+    assert select("services", "last") == 1
+    assert select("before", "list") == DOCUMENT["before"]["list"]
+    assert select("after") == DOCUMENT["after"]
+
+    assert select("services", "missing") is MISSING
+    assert select("empty", "missing") is MISSING
+    assert select("services", "last", "deeper") is MISSING
+
+    with pytest.raises(ValueError):
+        select("services", "api", data=raw[:200])
+
+
+def test_stream_yaml():
+    raw = yaml.dump(DOCUMENT).encode()
+
+    assert stream_yaml(io.BytesIO(raw), ["services", "api"]) == DOCUMENT["services"]["api"]
+    assert stream_yaml(io.BytesIO(raw), ["before"]) == DOCUMENT["before"]
+    assert stream_yaml(io.BytesIO(raw), ["services", "missing"]) is MISSING
+    assert stream_yaml(io.BytesIO(raw), ["services", "last", "deeper"]) is MISSING
+
+    anchored = b"base: &base\n  port: 1\nservices:\n  api: *base\n  web:\n    <<: *base\n"
+    with pytest.raises(yaml.YAMLError):
+        # alias to something outside the section
+        stream_yaml(io.BytesIO(anchored), ["services", "api"])
+
+
+@pytest.mark.parametrize("extension, dump", [(".json", json.dumps), (".yaml", yaml.dump)])
+@pytest.mark.usefixtures("enable_streaming")
+def test_load_streamed(monkeypatch, tmp_path, extension, dump):
+    from src.configuraptor import core
+
+    path = tmp_path / f"manifest{extension}"
+    path.write_text(dump(DOCUMENT))
+
+    def full_parse(_data):
+        raise AssertionError("should not parse the whole file")
+
+    monkeypatch.setattr(core, "_fetch_data", full_parse)
+
+    api = Api.load(path, key="services.api")
+    assert api.port == 8000
+    assert api.nested == {"values": [1, 2, 3]}
+
+    # key guessed from the class name:
+    assert load_data(path, key=None, classname="Services")["api"]["port"] == 8000
+
+
+def test_streaming_falls_back(enable_streaming, tmp_path):
+    path = tmp_path / "manifest.yaml"
+    path.write_text("base: &base\n  port: 1\nservices:\n  api: *base\n")
+    assert enable_streaming.select(path, "services.api") is None
+    assert load_data(path, key="services.api") == {"port": 1}
+
+    # missing key -> same fallback (key='') as without streaming:
+    assert enable_streaming.select(path, "services.missing") is None
+    assert load_data(path, key="services.missing") == load_data(path, key="")
+
+    # not a builtin loader:
+    (tmp_path / "settings.toml").write_text("[services]\nport = 1\n")
+    assert enable_streaming.select(tmp_path / "settings.toml", "services") is None
+
+    enable_streaming.min_size = 1024 * 1024
+    assert enable_streaming.select(path, "base") is None
+
+
+def test_streaming_scalar_falls_back(enable_streaming, tmp_path):
+    class Version:
+        name: str
+        port: int
+
+    path = tmp_path / "settings.json"
+    path.write_text(json.dumps({"version": 3, "name": "app", "port": 80}))
+
+    # 'version' is a scalar (and 'empty' an empty section), so key="" must see the whole document:
+    assert enable_streaming.select(path, "version") is None
+    assert load_into(Version, path).name == "app"
+
+    path.write_text(json.dumps({"empty": {}, "name": "app", "port": 80}))
+    assert enable_streaming.select(path, "empty") is None
+    assert load_into(Version, path, key="empty").port == 80
@@ -0,0 +1,122 @@
+import dataclasses
+import gc
+import typing
+import weakref
+
+import pytest
+from typeguard import TypeCheckError
+from typeguard import check_type as typeguard_check_type
+
+from src.configuraptor import validators
+from src.configuraptor.helpers import check_type
+from src.configuraptor.validators import VALIDATORS, compile_validator
+
+
+@dataclasses.dataclass
+class Point:
+    x: int
+    y: int
+
+
+class Named(typing.NamedTuple):
+    name: str
+
+
+def _typeguard(value, annotation) -> bool:
+    try:
+        typeguard_check_type(value, annotation)
+        return True
+    except TypeCheckError:
+        return False
+
+
+ANNOTATIONS = [
+    int,
+    str,
+    bool,
+    float,
+    complex,
+    bytes,
+    typing.Any,
+    None,
+    type(None),
+    Point,
+    list,
+    dict,
+    list[int],
+    list[str],
+    list[Point],
+    dict[str, int],
+    dict[str, Point],
+    int | None,
+    typing.Optional[str],
+    typing.Union[int, str],
+    list[int | None],
+    typing.Literal["a", "b"],
+    typing.Literal[1, typing.Literal[True]],
+    typing.Annotated[int, "meta"],
+    typing.Annotated[list[str], "meta"],
+    tuple[int, str],
+    Named,
+    set[int],
+]
+
+VALUES = [
+    0,
+    1,
+    True,
+    1.5,
+    1j,
+    "a",
+    "c",
+    b"bytes",
+    bytearray(b"bytes"),
+    None,
+    Point(1, 2),
+    [],
+    [1, 2],
+    ["a", "b"],
+    [Point(1, 2)],
+    [None, 1],
+    {},
+    {"a": 1},
+    {"a": Point(1, 2)},
+    {1: "a"},
+    (1, "a"),
+    Named("a"),
+    {1, 2},
+]
+
+
+@pytest.mark.parametrize("annotation", ANNOTATIONS, ids=repr)
+def test_same_result_as_typeguard(annotation):
+    for value in VALUES:
+        assert check_type(value, annotation) is _typeguard(value, annotation), value
+
+
+def test_validators_are_cached():
+    annotation = dict[str, list[int]]
+    VALIDATORS.pop(annotation, None)
+
+    validator = compile_validator(annotation)
+    assert compile_validator(annotation) is validator
+    assert validator({"a": [1]})
+    assert not validator({"a": ["1"]})
+
+
+def test_validators_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(validators, "MAX_VALIDATORS", 2)
+    VALIDATORS.clear()
+
+    class Local:
+        pass
+
+    compile_validator(list[Local])
+    ref = weakref.ref(Local)
+    del Local
+
+    compile_validator(list[int])
+    compile_validator(list[str])
+    assert len(VALIDATORS) == 2
+    gc.collect()
+    assert ref() is None
@@ -0,0 +1,192 @@
+import gc
+import os
+import time
+
+import pytest
+
+from src.configuraptor import TypedConfig, Watcher, load_into, loader, loaders
+from src.configuraptor.watch import WATCHED
+
+PARSED: list[str] = []
+
+
+@loader("watched")
+def watched(f, fullpath):
+    PARSED.append(fullpath.name)
+    return loaders.toml(f, fullpath)
+
+
+class Nested(TypedConfig):
+    level: int
+
+
+class Configuration(TypedConfig):
+    name: str
+    number: int
+    nested: Nested
+
+
+class Plain:
+    name: str
+    number: int
+
+
+def write(path, content):
+    path.write_text(content)
+    # make sure the mtime changes, even on file systems with a coarse resolution:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    WATCHED.clear()
+    WATCHED.enabled = True
+    PARSED.clear()
+    path = tmp_path / "config.watched"
+    path.write_text('[configuration]\nname = "first"\nnumber = 1\n\n[configuration.nested]\nlevel = 1\n')
+    yield path
+    WATCHED.clear()
+    WATCHED.enabled = False
+
+
+def test_tracking(config_file):
+    config = Configuration.load(config_file)
+    assert len(WATCHED) == 1
+    Configuration.load({"name": "dict", "number": 1, "nested": {"level": 1}})
+    assert len(WATCHED) == 1
+
+    WATCHED.untrack(config)
+    assert len(WATCHED) == 0
+
+    WATCHED.enabled = False
+    Configuration.load(config_file)
+    assert len(WATCHED) == 0
+
+    # creating a watcher enables tracking, an instance loaded before that can be added explicitly:
+    watcher = Watcher()
+    assert WATCHED.enabled
+    other = Configuration.load(config_file)
+    assert len(WATCHED) == 1
+    assert watcher.watch(config, config_file)
+    assert len(WATCHED) == 2
+
+    # records are removed when their instance is garbage collected:
+    del config
+    gc.collect()
+    assert len(WATCHED._items) == 1
+    assert [record.ref() for record in WATCHED] == [other]
+
+
+def test_apply_changed_keys(config_file):
+    config = Configuration.load(config_file)
+    nested = config.nested
+
+    watcher = Watcher(debounce=0)
+    seen = []
+    watcher.on_change(lambda instance, changes: seen.append((instance, changes)))
+
+    assert watcher.check() == []
+
+    write(config_file, '[configuration]\nname = "second"\nnumber = 1\n\n[configuration.nested]\nlevel = 1\n')
+    assert watcher.check() == [(config, {"name": ("first", "second")})]
+    assert seen == [(config, {"name": ("first", "second")})]
+    assert config.name == "second"
+    # unchanged subtrees are not touched:
+    assert config.nested is nested
+
+    write(config_file, '[configuration]\nname = "second"\nnumber = 1\n\n[configuration.nested]\nlevel = 2\n')
+    ((_, changes),) = watcher.check()
+    assert config.nested.level == 2
+    assert set(changes) == {"nested"}
+
+    # nothing changed anymore:
+    assert watcher.check() == []
+
+
+def test_invalid_changes(config_file):
+    config = Configuration.load(config_file)
+    watcher = Watcher(debounce=0)
+    watcher.check()
+
+    write(config_file, '[configuration]\nname = "second"\nnumber = "not a number"\n')
+    with pytest.warns(UserWarning):
+        assert watcher.check() == []
+    assert config.name == "first"
+
+    write(config_file, "[configuration\n")
+    with pytest.warns(UserWarning):
+        assert watcher.check() == []
+
+    # fixed -> compared with the last valid data:
+    write(config_file, '[configuration]\nname = "first"\nnumber = 2\n\n[configuration.nested]\nlevel = 1\n')
+    assert watcher.check() == [(config, {"number": (1, 2)})]
+
+
+def test_debounce(config_file):
+    config = Configuration.load(config_file)
+    watcher = Watcher(debounce=0.2)
+    watcher.check()
+
+    write(config_file, '[configuration]\nname = "second"\nnumber = 1\n')
+    assert watcher.check() == []
+    write(config_file, '[configuration]\nname = "third"\nnumber = 1\n')
+    assert watcher.check() == []
+    time.sleep(0.25)
+    assert watcher.check() == [(config, {"name": ("first", "third")})]
+
+
+def test_only_changed_files_are_parsed(config_file, tmp_path):
+    other = tmp_path / "other.watched"
+    other.write_text("[configuration]\nnumber = 5\n")
+
+    config = load_into(Plain, [config_file, other])
+    assert config.number == 5
+
+    watcher = Watcher(debounce=0)
+    # first check parses every source once to know the current state:
+    watcher.check()
+    PARSED.clear()
+
+    write(other, "[configuration]\nnumber = 6\n")
+    assert watcher.check() == [(config, {"number": (5, 6)})]
+    assert PARSED == ["other.watched"]
+    assert config.name == "first"
+
+
+def test_change_before_first_check(config_file):
+    config = Configuration.load(config_file)
+    write(config_file, '[configuration]\nname = "second"\nnumber = 1\n\n[configuration.nested]\nlevel = 1\n')
+
+    (changes,) = Watcher(debounce=0).check()
+    assert changes == (config, {"name": ("first", "second")})
+
+
+def test_change_before_first_check_debounced(config_file):
+    config = Configuration.load(config_file)
+    write(config_file, '[configuration]\nname = "second"\nnumber = 1\n\n[configuration.nested]\nlevel = 1\n')
+
+    watcher = Watcher(debounce=0.2)
+    assert watcher.check() == []
+    assert config.name == "first"
+
+    time.sleep(0.25)
+    assert watcher.check() == [(config, {"name": ("first", "second")})]
+
+
+def test_background_thread(config_file):
+    config = Configuration.load(config_file)
+
+    with Watcher(interval=0.01, debounce=0, backend="polling") as watcher:
+        time.sleep(0.05)
+        write(config_file, '[configuration]\nname = "second"\nnumber = 1\n\n[configuration.nested]\nlevel = 1\n')
+        for _ in range(100):
+            if config.name == "second":
+                break
+            time.sleep(0.01)
+
+    assert config.name == "second"
+    assert watcher._thread is None
+
+    with pytest.raises(ImportError):
+        Watcher(backend="watchdog").start()